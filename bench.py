@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""Focused blob encoding experiments (beyond the main strategy matrix)."""
+
+import time
+from pathlib import Path
+
+import click
+
+from src.admission import ADMISSION_MODES, run_admission_benchmark, save_admission_results
+from src.archive import INDEX_FILE, build_archive, run_archive_benchmark, save_archive_results
+from src.attribution import ATTRIBUTION_ENCODINGS, run_attribution, save_attribution, summarize_attribution
+from src.benchmark import benchmark_allocations, strategy_combinations
+from src.compression import COMPRESSORS
+from src.cross_block import run_context_benchmark, save_context_results, summarize_context
+from src.packing import PACKERS
+from src.packing.rans import DEFAULT_MODEL_PATH
+from src.scaling import DEFAULT_SIZES_MB, MB, linearity_breaks, run_scaling, save_scaling, scaling_exponents
+from src.substitution import run_substitution_benchmark, save_substitution_results, split_corpus, summarize_substitution
+from src.symbol_registry import DEFAULT_REGISTRY_PATH, build_registry
+from src.synthetic import fit_model, generate_transactions, load_corpus, make_payload, write_payload
+from src.tx_list_encoding import (
+    ENCODERS, PERTX_BATCH_COMPRESSIONS, PERTX_COMPRESSIONS, BatchPerTxRlpEncoder, get_encoder, make_pertx_encoder,
+)
+from src.import_time import ENTRY_POINTS, PACKAGES, measure_import, save_import_times
+from src.partial import (
+    DEFAULT_FRACTIONS, run_partial_decode_benchmark, save_partial_decode_results, summarize_partial_decode,
+)
+from src.payload import find_payloads, load_transactions, sort_by_block_number
+from src.rans_benchmark import run_fe_benchmark, save_fe_results, summarize_fe, train_model
+from src.replay import replay_strategy, save_replay_results
+
+
+def _all_encoders() -> list[str]:
+    return (
+        list(ENCODERS.keys())
+        + [f"rlp_pertx_{comp}" for comp in PERTX_COMPRESSIONS]
+        + [f"rlp_pertx_batch_{comp}" for comp in PERTX_BATCH_COMPRESSIONS]
+    )
+
+
+def _parse_sizes(value: str) -> list[float]:
+    return [float(v) for v in value.split(",") if v]
+
+
+@click.group()
+def cli():
+    """Blob encoding experiments.
+
+    Examples:
+      python bench.py synth -s 5 -s 30          # Write 5 MB and 30 MB payloads
+      python bench.py scaling --sizes 1,5,10    # Throughput across sizes
+      python bench.py alloc                     # Buffer pool allocation savings
+      python bench.py context -d 1 -d 4         # Previous blocks as zstd prefix
+      python bench.py registry                  # Address/selector substitution
+      python bench.py replay --slot-time 12000  # Steady-state slot decode latency
+      python bench.py pertx -t 0 -t 4           # Per-tx zstd loop vs batched
+      python bench.py imports                   # Cold import time of entry points
+      python bench.py attribution -l 22         # Compressed bytes per tx type and field
+      python bench.py cells -f 0.1              # Partial decode from PeerDAS cells
+      python bench.py admission -b 3            # Incremental builder vs re-encoding
+      python bench.py archive --rebuild         # Cold/warm decode from an mmap archive
+      python bench.py fe -n 10                  # rANS into field elements vs zstd+bitpack
+    """
+
+
+@cli.command()
+@click.option("--size", "-s", "sizes", type=float, multiple=True, default=[5.0], help="Payload size in MB (repeatable)")
+@click.option("--mode", "-m", type=click.Choice(["sample", "model"]), default="sample", help="Generation mode")
+@click.option("--count", "-c", type=int, default=1, help="Payloads per size (default: 1)")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Source corpus")
+@click.option(
+    "--output-dir", "-o", type=click.Path(path_type=Path), default="payloads_synthetic", help="Output directory"
+)
+@click.option("--seed", type=int, default=0, help="Random seed")
+def synth(sizes: tuple[float, ...], mode: str, count: int, payloads_dir: Path, output_dir: Path, seed: int):
+    """Generate synthetic ExecutionPayload JSON files."""
+    corpus = load_corpus(payloads_dir)
+    model = fit_model(corpus) if mode == "model" else None
+
+    block_number = 0
+    for size_mb in sizes:
+        for i in range(count):
+            transactions = generate_transactions(int(size_mb * MB), mode, corpus, model, seed + i)
+            payload = make_payload(transactions, block_number, seed + i)
+            output_path = write_payload(payload, output_dir)
+            raw = sum(len(tx) for tx in transactions)
+            print(f"{output_path}: {len(transactions)} txs, {raw / MB:.2f} MB")
+            block_number += 1
+
+
+@cli.command()
+@click.option("--sizes", default=",".join(str(s) for s in DEFAULT_SIZES_MB),
+              help="Comma-separated size ladder in MB")
+@click.option("--mode", "-m", type=click.Choice(["sample", "model"]), default="sample", help="Generation mode")
+@click.option("--encoder", "-e", "encoders", multiple=True, help="Tx list encoders (default: all)")
+@click.option("--compressor", "-c", "compressors", multiple=True, help="Compressors (default: all)")
+@click.option("--packer", "-p", "packers", multiple=True, help="Packers (default: all)")
+@click.option("--iterations", "-i", type=int, default=1, help="Timing iterations per point")
+@click.option("--tolerance", type=float, default=0.25, help="Exponent above 1+tolerance counts as non-linear")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Source corpus")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def scaling(
+    sizes: str, mode: str, encoders: tuple[str, ...], compressors: tuple[str, ...], packers: tuple[str, ...],
+    iterations: int, tolerance: float, payloads_dir: Path, output_dir: Path,
+):
+    """Measure MB/s of every strategy across a payload size ladder."""
+    corpus = load_corpus(payloads_dir)
+    model = fit_model(corpus) if mode == "model" else None
+    strategies = strategy_combinations(
+        list(encoders) or _all_encoders(),
+        list(compressors) or list(COMPRESSORS.keys()),
+        list(packers) or list(PACKERS.keys()),
+    )
+
+    results = run_scaling(_parse_sizes(sizes), strategies, mode, corpus, model, iterations)
+    output_file = save_scaling(results, output_dir)
+    print(f"\nResults saved to {output_file}")
+
+    print("\n" + "=" * 60)
+    print("LINEARITY (first size where time grows faster than linear)")
+    print("=" * 60)
+    for key, brk in linearity_breaks(scaling_exponents(results), tolerance).items():
+        enc = f"{brk['encode']} MB" if brk["encode"] is not None else "linear"
+        dec = f"{brk['decode']} MB" if brk["decode"] is not None else "linear"
+        print(f"{key:35} encode: {enc:>10}  decode: {dec:>10}")
+
+
+@cli.command()
+@click.option("--encoder", "-e", default="rlp", help="Tx list encoder (default: rlp)")
+@click.option("--compressor", "-c", "compressors", multiple=True, help="Compressors (default: all)")
+@click.option("--packer", "-p", "packers", multiple=True, help="Packers (default: all)")
+@click.option("--count", "-n", type=int, default=5, help="Number of payloads (default: 5)")
+@click.option("--iterations", "-i", type=int, default=5, help="Iterations per measurement")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+def alloc(encoder: str, compressors: tuple[str, ...], packers: tuple[str, ...], count: int, iterations: int,
+          payloads_dir: Path):
+    """Compare encode/decode allocations with and without a buffer pool."""
+    payload_files = find_payloads(payloads_dir)[:count]
+    tx_encoder = get_encoder(encoder)
+    totals: dict[tuple[str, bool], list[int]] = {}
+
+    for payload_file in payload_files:
+        data = tx_encoder.encode(load_transactions(payload_file))
+        for comp_name in compressors or COMPRESSORS.keys():
+            for pack_name in packers or PACKERS.keys():
+                for r in benchmark_allocations(data, comp_name, pack_name, encoder, payload_file.name, iterations):
+                    key = f"{r.encoding}+{r.compression}+{r.packing}"
+                    total = totals.setdefault((key, r.pooled), [0, 0])
+                    total[0] += r.encode_peak_bytes
+                    total[1] += r.decode_peak_bytes
+
+    print(f"{'strategy':35} {'enc KB':>9} {'pooled':>9} {'dec KB':>9} {'pooled':>9}")
+    for key in dict.fromkeys(k for k, _ in totals):
+        plain, pooled = totals[(key, False)], totals[(key, True)]
+        n = len(payload_files)
+        print(f"{key:35} {plain[0] / n / 1024:9.1f} {pooled[0] / n / 1024:9.1f} "
+              f"{plain[1] / n / 1024:9.1f} {pooled[1] / n / 1024:9.1f}")
+
+
+@cli.command()
+@click.option("--depth", "-d", "depths", type=int, multiple=True, default=[1, 2, 4],
+              help="Previous blocks kept as context (repeatable)")
+@click.option("--level", "-l", type=int, default=22, help="Zstd level (default: 22)")
+@click.option("--encoder", "-e", default="rlp", help="Tx list encoder (default: rlp)")
+@click.option("--packer", "-p", default="bitpack", help="Packer (default: bitpack)")
+@click.option("--count", "-n", type=int, default=None, help="Limit number of payloads")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def context(depths: tuple[int, ...], level: int, encoder: str, packer: str, count: int | None,
+            payloads_dir: Path, output_dir: Path):
+    """Compress each block with the previous N blocks as a zstd prefix."""
+    payload_files = sort_by_block_number(find_payloads(payloads_dir))[:count]
+    results = run_context_benchmark(payload_files, list(depths), level, encoder, packer)
+    output_file = save_context_results(results, output_dir)
+    print(f"Results saved to {output_file}\n")
+
+    print(f"{'depth':>5} {'blobs':>6} {'saved':>6} {'bytes saved':>12} {'context':>10} "
+          f"{'enc ms':>14} {'dec ms':>14}")
+    for s in summarize_context(results):
+        saved_bytes = s["plain_compressed_size"] - s["context_compressed_size"]
+        print(f"{s['depth']:>5} {s['context_blobs']:>6} {s['blobs_saved']:>6} {saved_bytes:>12} "
+              f"{s['max_context_bytes'] / 1024:>8.0f}KB "
+              f"{s['plain_encode_ms']:>6.1f}->{s['context_encode_ms']:<6.1f} "
+              f"{s['plain_decode_ms']:>6.2f}->{s['context_decode_ms']:<6.2f}")
+
+
+@cli.command()
+@click.option("--train-fraction", type=float, default=0.5, help="Share of blocks (oldest first) used to build")
+@click.option("--max-addresses", type=int, default=16384, help="Registry address capacity")
+@click.option("--max-selectors", type=int, default=4096, help="Registry selector capacity")
+@click.option("--version", "registry_version", type=int, default=1, help="Registry version number")
+@click.option("--registry-path", type=click.Path(path_type=Path), default=DEFAULT_REGISTRY_PATH,
+              help="Where to write the registry")
+@click.option("--compressor", "-c", "compressors", multiple=True, default=["none", "zstd_3", "zstd_22"],
+              help="Compressors (repeatable)")
+@click.option("--packer", "-p", default="bitpack", help="Packer (default: bitpack)")
+@click.option("--iterations", "-i", type=int, default=3, help="Timing iterations")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def registry(train_fraction: float, max_addresses: int, max_selectors: int, registry_version: int,
+             registry_path: Path, compressors: tuple[str, ...], packer: str, iterations: int,
+             payloads_dir: Path, output_dir: Path):
+    """Build an address/selector registry and compare against plain rlp/ssz."""
+    train, test = split_corpus(find_payloads(payloads_dir), train_fraction)
+    if not train or not test:
+        raise click.UsageError("Need payloads in both the train and test split")
+
+    symbols = build_registry(
+        [tx for p in train for tx in load_transactions(p)],
+        registry_version, max_addresses, max_selectors,
+    )
+    symbols.save(registry_path)
+    print(f"Registry v{symbols.version}: {len(symbols.addresses)} addresses, "
+          f"{len(symbols.selectors)} selectors from {len(train)} blocks -> {registry_path}")
+
+    results = run_substitution_benchmark(test, symbols, ["rlp", "ssz"], list(compressors), packer, iterations)
+    output_file = save_substitution_results(results, output_dir)
+    print(f"Evaluated on {len(test)} blocks. Results saved to {output_file}\n")
+
+    print(f"{'strategy':40} {'blobs':>6} {'encoded':>10} {'compressed':>11} {'enc MB/s':>9} {'dec MB/s':>9}")
+    for s in summarize_substitution(results):
+        print(f"{s['key']:40} {s['blobs']:>6} {s['encoded_size']:>10} {s['compressed_size']:>11} "
+              f"{s['encode_mb_s']:>9.1f} {s['decode_mb_s']:>9.1f}")
+
+
+@cli.command()
+@click.option("--encoder", "-e", "encoders", multiple=True, default=["rlp", "ssz"], help="Tx list encoders")
+@click.option("--compressor", "-c", "compressors", multiple=True, default=["none", "zstd_3", "zstd_22"],
+              help="Compressors (default: none, zstd_3, zstd_22)")
+@click.option("--packer", "-p", "packers", multiple=True, help="Packers (default: all)")
+@click.option("--blobs-per-slot", "-b", type=int, default=6, help="Blob target per slot (default: 6)")
+@click.option("--slot-time", type=float, default=0.0, help="Slot cadence in ms (default: 0, back to back)")
+@click.option("--deadline", type=float, default=4000.0, help="Per-slot decode deadline in ms (default: 4000)")
+@click.option("--loops", type=int, default=1, help="Replay the corpus this many times")
+@click.option("--no-validate", is_flag=True, help="Skip decoded transaction validation")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def replay(encoders: tuple[str, ...], compressors: tuple[str, ...], packers: tuple[str, ...], blobs_per_slot: int,
+           slot_time: float, deadline: float, loops: int, no_validate: bool, payloads_dir: Path, output_dir: Path):
+    """Decode the corpus slot by slot in block order and report tail latency."""
+    payload_files = find_payloads(payloads_dir)
+    results = []
+    for enc_name, comp_name, pack_name in strategy_combinations(
+        list(encoders), list(compressors), list(packers or PACKERS.keys())
+    ):
+        results.append(replay_strategy(
+            payload_files, enc_name, comp_name, pack_name, blobs_per_slot, slot_time, deadline, loops,
+            validate=not no_validate,
+        ))
+
+    output_file = save_replay_results(results, output_dir)
+    print(f"Replayed {len(payload_files)} blocks x {loops}. Results saved to {output_file}\n")
+
+    print(f"{'strategy':35} {'slots':>6} {'MB/s':>7} {'p50 ms':>8} {'p99 ms':>8} {'p99.9 ms':>9} "
+          f"{'misses':>7} {'gc':>5} {'gc max ms':>10}")
+    for r in results:
+        key = f"{r.encoding}+{r.compression}+{r.packing}"
+        print(f"{key:35} {r.slots:>6} {r.sustained_mb_s:>7.1f} {r.p50_ms:>8.2f} {r.p99_ms:>8.2f} "
+              f"{r.p999_ms:>9.2f} {r.deadline_misses:>7} {r.gc_collections:>5} {r.gc_pause_max_ms:>10.2f}")
+
+
+@cli.command()
+@click.option("--level", "-l", type=int, default=3, help="Zstd level (default: 3)")
+@click.option("--threads", "-t", "thread_counts", type=int, multiple=True, default=[0, 1, 2, 4, -1],
+              help="Batch thread counts (0 = calling thread, -1 = all CPUs)")
+@click.option("--iterations", "-i", type=int, default=5, help="Iterations per payload")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+def pertx(level: int, thread_counts: tuple[int, ...], iterations: int, payloads_dir: Path):
+    """Compare per-tx zstd in a Python loop against the batched multi-buffer path."""
+    corpus = [load_transactions(p) for p in find_payloads(payloads_dir)]
+    raw_mb = sum(len(tx) for txs in corpus for tx in txs) * iterations / MB
+
+    encoders = [("loop", make_pertx_encoder(f"zstd_{level}"))]
+    encoders += [(f"batch threads={t}", BatchPerTxRlpEncoder(level, t)) for t in thread_counts]
+
+    print(f"{'path':20} {'enc MB/s':>9} {'dec MB/s':>9}")
+    for label, tx_encoder in encoders:
+        encode_s = decode_s = 0.0
+        for transactions in corpus:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                data = tx_encoder.encode(transactions)
+            encode_s += time.perf_counter() - start
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                tx_encoder.decode(data)
+            decode_s += time.perf_counter() - start
+        print(f"{label:20} {raw_mb / encode_s:>9.1f} {raw_mb / decode_s:>9.1f}")
+
+
+@cli.command()
+@click.option("--module", "-m", "modules", multiple=True, help="Modules to import (default: entry points and packages)")
+@click.option("--runs", "-r", type=int, default=5, help="Fresh interpreters per module (default: 5)")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def imports(modules: tuple[str, ...], runs: int, output_dir: Path):
+    """Time cold imports of the CLI entry points and strategy packages."""
+    results = [
+        measure_import(module, runs, cwd=Path(__file__).parent)
+        for module in modules or ENTRY_POINTS + PACKAGES
+    ]
+    output_file = save_import_times(results, output_dir)
+    print(f"Results saved to {output_file}\n")
+
+    print(f"{'module':22} {'import ms':>10} {'min ms':>8} {'process ms':>11}  backends loaded")
+    for r in results:
+        print(f"{r.module:22} {r.import_ms:>10.1f} {r.import_min_ms:>8.1f} {r.process_ms:>11.1f}  "
+              f"{', '.join(r.backends) or '-'}")
+
+
+@cli.command()
+@click.option("--encoder", "-e", type=click.Choice(ATTRIBUTION_ENCODINGS), default="rlp", help="Tx list encoder")
+@click.option("--level", "-l", type=int, default=22, help="Zstd level (default: 22)")
+@click.option("--count", "-n", type=int, default=None, help="Limit number of payloads")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def attribution(encoder: str, level: int, count: int | None, payloads_dir: Path, output_dir: Path):
+    """Attribute zstd-compressed bytes to transactions, tx types and fields."""
+    payload_files = sort_by_block_number(find_payloads(payloads_dir))[:count]
+    payloads = run_attribution(payload_files, encoder, level)
+    summary_file, rows_file = save_attribution(payloads, output_dir)
+    print(f"Results saved to {summary_file} (per-tx rows in {rows_file.name})\n")
+
+    summary = summarize_attribution(payloads)
+    categories = summary["categories"]
+    print(f"{'tx type':10} {'txs':>7} {'raw KB':>9} {'zstd KB':>9}  " + " ".join(f"{c:>13}" for c in categories))
+    rows = [(f"type {t}", e) for t, e in summary["by_type"].items()] + [("all", summary["totals"])]
+    for label, e in rows:
+        compressed = sum(e["compressed"].values())
+        shares = " ".join(f"{e['compressed'][c] / compressed:>13.1%}" if compressed else f"{'-':>13}"
+                          for c in categories)
+        print(f"{label:10} {e['count']:>7} {sum(e['raw'].values()) / 1024:>9.1f} {compressed / 1024:>9.1f}  {shares}")
+    print(f"\nFlush overhead: {summary['flushed_size'] / summary['compressed_size'] - 1:.1%} "
+          f"(attributed bytes are scaled back to the one-shot size)")
+
+
+@cli.command()
+@click.option("--packer", "-p", "packers", multiple=True, help="Packers (default: all)")
+@click.option("--fraction", "-f", "fractions", type=float, multiple=True, default=DEFAULT_FRACTIONS,
+              help="Payload share to read, besides one transaction (repeatable)")
+@click.option("--count", "-n", type=int, default=20, help="Number of payloads (default: 20)")
+@click.option("--iterations", "-i", type=int, default=3, help="Timing iterations")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def cells(packers: tuple[str, ...], fractions: tuple[float, ...], count: int, iterations: int,
+          payloads_dir: Path, output_dir: Path):
+    """Read payload slices from only the cells that hold them (rlp+none)."""
+    payload_files = find_payloads(payloads_dir)[:count]
+    results = run_partial_decode_benchmark(
+        payload_files, list(packers or PACKERS.keys()), tuple(fractions), iterations
+    )
+    output_file = save_partial_decode_results(results, output_dir)
+    print(f"Results saved to {output_file}\n")
+
+    print(f"{'packing':12} {'slice':>6} {'bytes':>9} {'cells':>7} {'full ms':>8} {'cells ms':>9} {'speedup':>8}")
+    for s in summarize_partial_decode(results):
+        print(f"{s['packing']:12} {s['slice']:>6} {s['slice_bytes']:>9.0f} {s['cell_share']:>7.1%} "
+              f"{s['full_decode_ms']:>8.2f} {s['partial_decode_ms']:>9.2f} {s['speedup']:>7.1f}x")
+
+
+@cli.command()
+@click.option("--packer", "-p", "packers", multiple=True, help="Packers (default: all)")
+@click.option("--level", "-l", type=int, default=3, help="Zstd level (default: 3)")
+@click.option("--max-blobs", "-b", type=int, default=3, help="Blob target (default: 3)")
+@click.option("--mode", "-m", "modes", type=click.Choice(ADMISSION_MODES), multiple=True,
+              default=ADMISSION_MODES, help="Admission strategies (default: both)")
+@click.option("--count", "-n", type=int, default=10, help="Number of payloads offered (default: 10)")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def admission(packers: tuple[str, ...], level: int, max_blobs: int, modes: tuple[str, ...], count: int,
+              payloads_dir: Path, output_dir: Path):
+    """Per-transaction admission latency into a blob target (rlp+zstd)."""
+    payload_files = sort_by_block_number(find_payloads(payloads_dir))[:count]
+    results = run_admission_benchmark(payload_files, list(packers or PACKERS.keys()), level, max_blobs, modes)
+    output_file = save_admission_results(results, output_dir)
+    print(f"Results saved to {output_file}\n")
+
+    print(f"{'mode':9} {'packing':12} {'admitted':>9} {'blobs':>6} {'size':>9} {'one-shot':>9} "
+          f"{'p50 us':>8} {'p99 us':>9} {'total ms':>9}")
+    for r in results:
+        print(f"{r.mode:9} {r.packing:12} {r.admitted:>4}/{r.offered:<4} {r.blob_count:>6} {r.compressed_size:>9,} "
+              f"{r.one_shot_size:>9,} {r.p50_us:>8.1f} {r.p99_us:>9.1f} {r.total_ms:>9.0f}")
+
+
+@cli.command()
+@click.option("--encoder", "-e", "encoders", multiple=True, default=["rlp"], help="Tx list encoders")
+@click.option("--compressor", "-c", "compressors", multiple=True, default=["none", "zstd_3"],
+              help="Compressors (default: none, zstd_3)")
+@click.option("--packer", "-p", "packers", multiple=True, help="Packers (default: all)")
+@click.option("--count", "-n", type=int, default=None, help="Limit number of payloads archived")
+@click.option("--archive-dir", "-a", type=click.Path(path_type=Path), default="archive", help="Archive directory")
+@click.option("--rebuild", is_flag=True, help="Re-encode the archive even if it exists")
+@click.option("--warm-runs", "-r", type=int, default=3, help="Warm passes to average (default: 3)")
+@click.option("--no-validate", is_flag=True, help="Skip decoded transaction validation")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def archive(encoders: tuple[str, ...], compressors: tuple[str, ...], packers: tuple[str, ...], count: int | None,
+            archive_dir: Path, rebuild: bool, warm_runs: int, no_validate: bool, payloads_dir: Path,
+            output_dir: Path):
+    """Decode pre-encoded blobs from a memory-mapped archive, cold and warm."""
+    if rebuild or not (archive_dir / INDEX_FILE).exists():
+        payload_files = find_payloads(payloads_dir)[:count]
+        strategies = strategy_combinations(list(encoders), list(compressors), list(packers or PACKERS.keys()))
+        start = time.perf_counter()
+        entries = build_archive(payload_files, strategies, archive_dir)
+        print(f"Archived {len(entries)} entries to {archive_dir} in {time.perf_counter() - start:.1f}s")
+
+    results = run_archive_benchmark(archive_dir, warm_runs, validate=not no_validate)
+    output_file = save_archive_results(results, output_dir)
+    print(f"Results saved to {output_file}\n")
+
+    if any(r.cache == "cold" and not r.cache_dropped for r in results):
+        print("Note: some cold runs read no pages from disk (eviction unsupported or ignored, e.g. tmpfs); "
+              "they were effectively warm\n")
+    print(f"{'strategy':28} {'cache':>5} {'blocks':>6} {'blobs':>6} {'ms':>9} {'blob MB/s':>10} {'tx MB/s':>8} "
+          f"{'faults':>7}")
+    for r in results:
+        key = f"{r.encoding}+{r.compression}+{r.packing}"
+        print(f"{key:28} {r.cache:>5} {r.blocks:>6} {r.blobs:>6} {r.decode_ms:>9.1f} {r.blob_mb_s:>10.1f} "
+              f"{r.tx_mb_s:>8.1f} {'-' if r.major_faults is None else r.major_faults:>7}")
+
+
+@cli.command()
+@click.option("--train-fraction", type=float, default=0.5, help="Share of blocks (oldest first) used to train")
+@click.option("--encoder", "-e", default="rlp", help="Tx list encoder (default: rlp)")
+@click.option("--model-path", type=click.Path(path_type=Path), default=DEFAULT_MODEL_PATH,
+              help="Where to write the order-1 model")
+@click.option("--count", "-n", type=int, default=None, help="Limit number of test payloads")
+@click.option("--iterations", "-i", type=int, default=1, help="Timing iterations")
+@click.option("--payloads-dir", type=click.Path(path_type=Path), default="payloads", help="Payload directory")
+@click.option("--output-dir", "-o", type=click.Path(path_type=Path), default="results", help="Output directory")
+def fe(train_fraction: float, encoder: str, model_path: Path, count: int | None, iterations: int,
+       payloads_dir: Path, output_dir: Path):
+    """Entropy-code straight into field elements (rANS) vs zstd_22+bitpack."""
+    train, test = split_corpus(find_payloads(payloads_dir), train_fraction)
+    if not train or not test:
+        raise click.UsageError("Need payloads in both the train and test split")
+
+    start = time.perf_counter()
+    model = train_model(train, encoder, order=1)
+    model.save(model_path)
+    print(f"Order-1 model from {len(train)} blocks in {time.perf_counter() - start:.1f}s -> {model_path}")
+
+    test = test[:count]
+    results = run_fe_benchmark(test, encoder, iterations=iterations, model=model)
+    output_file = save_fe_results(results, output_dir)
+    print(f"Evaluated on {len(test)} blocks. Results saved to {output_file}\n")
+
+    print(f"{'strategy':20} {'blobs':>6} {'elements':>9} {'enc MB/s':>9} {'dec MB/s':>9}")
+    for s in summarize_fe(results):
+        print(f"{s['strategy']:20} {s['blobs']:>6} {s['field_elements']:>9} "
+              f"{s['encode_mb_s']:>9.2f} {s['decode_mb_s']:>9.2f}")
+
+
+if __name__ == "__main__":
+    cli()
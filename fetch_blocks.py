@@ -8,8 +8,12 @@ from pathlib import Path
 
 import click
 
+from src.beacon import BlockTransactions, decode_transactions, execution_transactions
+
 DEFAULT_BEACON = "https://ethereum-beacon-api.publicnode.com"
 
+FORMATS = ("json", "ssz")
+
 
 def beacon_get(url: str, timeout: int = 30) -> dict:
     """Make a Beacon API GET request."""
@@ -36,6 +40,40 @@ def fetch_block(beacon_url: str, slot: int | str) -> dict | None:
         return None
 
 
+def beacon_get_ssz(url: str, timeout: int = 30) -> tuple[bytes, str | None]:
+    """Make a Beacon API GET request for SSZ. Returns (body, Eth-Consensus-Version)."""
+    req = urllib.request.Request(
+        url,
+        headers={"Accept": "application/octet-stream", "User-Agent": "blob-experiments"},
+    )
+    with urllib.request.urlopen(req, timeout=timeout) as resp:
+        return resp.read(), resp.headers.get("Eth-Consensus-Version")
+
+
+def fetch_block_ssz(beacon_url: str, slot: int | str) -> BlockTransactions | None:
+    """Fetch an SSZ block and locate its execution payload transactions."""
+    try:
+        data, fork = beacon_get_ssz(f"{beacon_url}/eth/v2/beacon/blocks/{slot}")
+        return execution_transactions(data, fork)
+    except Exception as e:
+        print(f"  Error fetching slot {slot}: {e}")
+        return None
+
+
+def save_payload(payload: dict | BlockTransactions, output_dir: Path) -> tuple[int, int]:
+    """Write a fetched payload as block_{number}.json or .ssz. Returns (block number, tx count)."""
+    if isinstance(payload, BlockTransactions):
+        # The SSZ transaction list is stored as-is
+        with open(output_dir / f"block_{payload.block_number}.ssz", "wb") as f:
+            f.write(payload.transactions)
+        return payload.block_number, len(decode_transactions(payload.transactions))
+
+    block_num = int(payload["block_number"])
+    with open(output_dir / f"block_{block_num}.json", "w") as f:
+        json.dump(payload, f)
+    return block_num, len(payload["transactions"])
+
+
 def get_head_slot(beacon_url: str) -> int:
     """Get the current head slot."""
     data = beacon_get(f"{beacon_url}/eth/v1/beacon/headers/head")
@@ -53,13 +91,18 @@ def get_head_slot(beacon_url: str) -> int:
     "--output-dir", "-o", type=click.Path(path_type=Path), default="payloads", help="Output directory"
 )
 @click.option("--workers", "-w", type=int, default=5, help="Parallel workers (default: 5)")
-def main(start: int | None, end: int | None, count: int, beacon: str, output_dir: Path, workers: int):
+@click.option(
+    "--format", "-f", "fmt", type=click.Choice(FORMATS), default="json",
+    help="json: ExecutionPayload JSON; ssz: SSZ block, transactions stored as binary (default: json)",
+)
+def main(start: int | None, end: int | None, count: int, beacon: str, output_dir: Path, workers: int, fmt: str):
     """Fetch blocks via Beacon API (1 call per block, raw transactions included).
 
     Examples:
       python fetch_blocks.py              # Last 100 slots
       python fetch_blocks.py -c 50        # Last 50 slots
       python fetch_blocks.py -s 9000000   # From specific slot
+      python fetch_blocks.py -f ssz       # SSZ blocks, store block_N.ssz
     """
     print(f"Using Beacon API: {beacon}")
 
@@ -79,19 +122,16 @@ def main(start: int | None, end: int | None, count: int, beacon: str, output_dir
     failed = 0
     skipped = 0
 
+    fetch = fetch_block_ssz if fmt == "ssz" else fetch_block
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = {executor.submit(fetch_block, beacon, s): s for s in slots}
+        futures = {executor.submit(fetch, beacon, s): s for s in slots}
 
         for future in as_completed(futures):
             slot = futures[future]
             try:
                 payload = future.result()
                 if payload:
-                    block_num = int(payload["block_number"])
-                    output_path = output_dir / f"block_{block_num}.json"
-                    with open(output_path, "w") as f:
-                        json.dump(payload, f)
-                    tx_count = len(payload["transactions"])
+                    block_num, tx_count = save_payload(payload, output_dir)
                     completed += 1
                     print(f"[{completed}/{len(slots)}] Slot {slot} (block {block_num}): {tx_count} txs")
                 else:
@@ -1,29 +1,39 @@
 #!/usr/bin/env python3
 """Run all blob encoding experiments."""
 
-from collections import defaultdict
 from pathlib import Path
 
-from src.benchmark import run_benchmark, save_results
+import click
+
+from src.benchmark import iter_benchmark, stream_results
 from src.compression import COMPRESSORS
-from src.tx_list_encoding import ENCODERS, PERTX_COMPRESSIONS
+from src.tx_list_encoding import ENCODERS, PERTX_BATCH_COMPRESSIONS, PERTX_COMPRESSIONS
 from src.packing import PACKERS
+from src.payload import find_payloads
+from src.result_cache import DEFAULT_CACHE_PATH, ResultCache
 
 
-def main():
+@click.command()
+@click.option("--cache", "cache_path", type=click.Path(path_type=Path), default=DEFAULT_CACHE_PATH,
+              help=f"Cell result cache (default: {DEFAULT_CACHE_PATH})")
+@click.option("--no-cache", is_flag=True, help="Measure every cell and leave the cache untouched")
+@click.option("--retime", is_flag=True, help="Re-measure timings of cached cells (sizes are reused either way)")
+def main(cache_path: Path, no_cache: bool, retime: bool):
+    """Run every strategy over payloads/, reusing cached cells."""
     payloads_dir = Path("payloads")
     results_dir = Path("results")
     iterations = 3
 
     # Find payload files
-    payload_files = list(payloads_dir.glob("*.json"))
+    payload_files = find_payloads(payloads_dir)
     if not payload_files:
-        print(f"No JSON files found in {payloads_dir}")
+        print(f"No payload files found in {payloads_dir}")
         return
 
     # Build encoder list including per-tx variants
     base_encoders = list(ENCODERS.keys())
     pertx_encoders = [f"rlp_pertx_{comp}" for comp in PERTX_COMPRESSIONS]
+    pertx_encoders += [f"rlp_pertx_batch_{comp}" for comp in PERTX_BATCH_COMPRESSIONS]
     encoders = base_encoders + pertx_encoders
 
     # Per-tx encoders only use compression=none, others use all compressors
@@ -38,36 +48,36 @@ def main():
     print(f"  Packing:         {list(PACKERS.keys())}")
     print()
 
-    # Run benchmarks
-    results = run_benchmark(payload_files, encoders, None, None, iterations)
-
-    # Save results
-    output_file = save_results(results, results_dir)
-    print(f"\nResults saved to {output_file}")
+    # Run benchmarks, streaming each result to disk as it is measured
+    cache = None if no_cache else ResultCache(cache_path)
+    try:
+        writer = stream_results(
+            iter_benchmark(payload_files, encoders, None, None, iterations, cache, retime), results_dir
+        )
+    finally:
+        if cache is not None:
+            cache.close()
+    print(f"\nResults saved to {writer.output_dir}")
+    if cache is not None:
+        print(f"Cache: {cache.hits} cells {'re-timed' if retime else 'reused'}, {cache.misses} new ({cache_path})")
 
     # Print aggregate summary
     print("\n" + "=" * 60)
     print("AGGREGATE RESULTS")
     print("=" * 60)
 
-    # Group by strategy
-    by_strategy: dict[str, dict[str, int]] = defaultdict(lambda: {"blobs": 0, "raw": 0})
-
-    for r in results:
-        key = f"{r.encoding}+{r.compression}+{r.packing}"
-        by_strategy[key]["blobs"] += r.blob_count
-        by_strategy[key]["raw"] += r.tx_raw_size
+    by_strategy = writer.aggregator.strategies
 
     # Find baseline
     baseline_key = "rlp+none+naive_31"
-    baseline_blobs = by_strategy[baseline_key]["blobs"]
+    baseline_blobs = by_strategy[baseline_key].blobs
 
     # Print sorted by blob count
-    sorted_strategies = sorted(by_strategy.items(), key=lambda x: x[1]["blobs"])
+    sorted_strategies = sorted(by_strategy.items(), key=lambda x: x[1].blobs)
     for key, stats in sorted_strategies:
-        diff = stats["blobs"] - baseline_blobs
+        diff = stats.blobs - baseline_blobs
         pct = (diff / baseline_blobs) * 100 if baseline_blobs > 0 else 0
-        print(f"{key:35} {stats['blobs']:4} blobs ({diff:+4}, {pct:+5.1f}%)")
+        print(f"{key:35} {stats.blobs:4} blobs ({diff:+4}, {pct:+5.1f}%)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,125 @@
+"""Admission benchmark: does the next transaction still fit in N blobs?
+
+Transactions from the corpus are offered one by one, in block order, to
+a blob target. Each offer is answered either by BlobBuilder.try_append or
+by re-encoding the admitted list plus the candidate from scratch through
+BlobEncoder, and the latency of every answer is recorded.
+"""
+
+import json
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .blob import BlobEncoder
+from .builder import BlobBuilder, ZstdFramesCompressor
+from .packing import get_packer
+from .payload import load_transactions, sort_by_block_number
+from .summary import quantile
+from .tx_list_encoding import get_encoder
+
+ADMISSION_MODES = ("builder", "reencode")
+
+
+@dataclass
+class AdmissionResult:
+    """One admission strategy filling one blob target."""
+
+    mode: str                   # "builder" or "reencode"
+    packing: str
+    level: int
+    max_blobs: int
+    offered: int
+    admitted: int
+    rollbacks: int              # Rejected offers
+    compressed_size: int        # Of the final payload
+    one_shot_size: int          # Admitted transactions compressed in one go
+    blob_count: int
+    p50_us: float
+    p99_us: float
+    max_us: float
+    total_ms: float
+
+
+def _offer_builder(transactions: list[bytes], packing: str, level: int, max_blobs: int):
+    builder = BlobBuilder(get_packer(packing), max_blobs, level)
+    latencies = []
+    for tx in transactions:
+        start = time.perf_counter()
+        builder.try_append(tx)
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    blobs, compressed_size = builder.finish()
+    return builder.transactions, blobs, compressed_size, latencies
+
+
+def _offer_reencode(transactions: list[bytes], packing: str, level: int, max_blobs: int):
+    blob_encoder = BlobEncoder.from_names(f"zstd_{level}", packing)
+    tx_encoder = get_encoder("rlp")
+    admitted: list[bytes] = []
+    blobs, compressed_size = blob_encoder.encode(tx_encoder.encode(admitted))
+    latencies = []
+    for tx in transactions:
+        start = time.perf_counter()
+        candidate = blob_encoder.encode(tx_encoder.encode(admitted + [tx]))
+        if len(candidate[0]) <= max_blobs:
+            admitted.append(tx)
+            blobs, compressed_size = candidate
+        latencies.append((time.perf_counter() - start) * 1_000_000)
+    return admitted, blobs, compressed_size, latencies
+
+
+def run_admission_benchmark(
+    payload_files: list[Path],
+    packers: list[str],
+    level: int = 3,
+    max_blobs: int = 6,
+    modes: tuple[str, ...] = ADMISSION_MODES,
+) -> list[AdmissionResult]:
+    """Offer the corpus transactions to each packer's blob target, in block order."""
+    transactions = [tx for f in sort_by_block_number(payload_files) for tx in load_transactions(f)]
+    tx_encoder = get_encoder("rlp")
+    offer = {"builder": _offer_builder, "reencode": _offer_reencode}
+
+    results = []
+    for pack_name in packers:
+        # Reads builder output (several frames) and one-shot output alike
+        blob_encoder = BlobEncoder(ZstdFramesCompressor(level), get_packer(pack_name))
+        for mode in modes:
+            start = time.perf_counter()
+            admitted, blobs, compressed_size, latencies = offer[mode](transactions, pack_name, level, max_blobs)
+            total_ms = (time.perf_counter() - start) * 1000
+
+            if tx_encoder.decode(blob_encoder.decode(blobs)) != admitted:
+                raise RuntimeError(f"Admitted transactions do not decode: {mode} {pack_name}")
+
+            latencies.sort()
+            results.append(AdmissionResult(
+                mode=mode,
+                packing=blob_encoder.packer.name,
+                level=level,
+                max_blobs=max_blobs,
+                offered=len(transactions),
+                admitted=len(admitted),
+                rollbacks=len(transactions) - len(admitted),
+                compressed_size=compressed_size,
+                one_shot_size=len(blob_encoder.compressor.compress(tx_encoder.encode(admitted))),
+                blob_count=len(blobs),
+                p50_us=quantile(latencies, 0.5),
+                p99_us=quantile(latencies, 0.99),
+                max_us=latencies[-1] if latencies else 0.0,
+                total_ms=total_ms,
+            ))
+    return results
+
+
+def save_admission_results(results: list[AdmissionResult], output_dir: Path) -> Path:
+    """Save admission results to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"admission_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump([asdict(r) for r in results], f, indent=2)
+
+    return output_file
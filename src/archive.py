@@ -0,0 +1,336 @@
+"""On-disk blob archive, read back through mmap.
+
+An archive is a directory with two files:
+
+- blobs.bin: a header page, then the packed blobs of every (strategy,
+  block) entry back to back. Each entry starts on an ALIGNMENT boundary,
+  so every blob starts on a page boundary.
+- index.json: the blob geometry and one record per entry (strategy,
+  payload, offset, blob count, and what is needed to validate a decode).
+
+BlobArchive maps blobs.bin read-only and hands out blobs as memoryviews
+into the mapping, so decoding reads straight from the page cache without
+copying blobs into bytes objects first.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .blob import BlobEncoder
+from .packing import DEFAULT_GEOMETRY, BlobGeometry, split_blobs
+from .payload import block_number, load_transactions, sort_by_block_number
+from .tx_list_encoding import get_encoder
+
+ARCHIVE_MAGIC = b"BLOBARC1"
+ARCHIVE_VERSION = 1
+DATA_FILE = "blobs.bin"
+INDEX_FILE = "index.json"
+
+# Entry alignment in blobs.bin: one page on common platforms
+ALIGNMENT = 4096
+
+
+@dataclass
+class ArchiveEntry:
+    """Location and provenance of one block's blobs under one strategy."""
+
+    encoding: str
+    compression: str
+    packing: str
+    payload_file: str
+    block_number: int
+    offset: int             # Byte offset of the first blob in blobs.bin
+    blob_count: int
+    compressed_size: int
+    tx_count: int
+    tx_raw_size: int
+    digest: str             # sha256 of the concatenated transactions, hex
+
+    @property
+    def strategy(self) -> tuple[str, str, str]:
+        return (self.encoding, self.compression, self.packing)
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
+
+
+class BlobArchiveWriter:
+    """Append entries to a new archive; the index is written on close()."""
+
+    def __init__(self, directory: Path, geometry: BlobGeometry = DEFAULT_GEOMETRY):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.geometry = geometry
+        self.entries: list[ArchiveEntry] = []
+        self._file = open(self.directory / DATA_FILE, "wb")
+        self._file.write(ARCHIVE_MAGIC + ARCHIVE_VERSION.to_bytes(4, "little"))
+        self._offset = self._file.tell()
+
+    def add(
+        self,
+        encoding: str,
+        compression: str,
+        packing: str,
+        payload_file: str,
+        blobs: list[bytes],
+        compressed_size: int,
+        transactions: list[bytes],
+    ) -> ArchiveEntry:
+        """Write one block's blobs at the next aligned offset."""
+        blob_size = self.geometry.blob_size
+        if any(len(b) != blob_size for b in blobs):
+            raise ValueError(f"Blobs must be {blob_size} bytes for this archive's geometry")
+
+        start = _align(self._offset)
+        self._file.write(bytes(start - self._offset))
+        for blob in blobs:
+            self._file.write(blob)
+        self._offset = start + len(blobs) * blob_size
+
+        entry = ArchiveEntry(
+            encoding=encoding,
+            compression=compression,
+            packing=packing,
+            payload_file=payload_file,
+            block_number=block_number(Path(payload_file)),
+            offset=start,
+            blob_count=len(blobs),
+            compressed_size=compressed_size,
+            tx_count=len(transactions),
+            tx_raw_size=sum(len(tx) for tx in transactions),
+            digest=hashlib.sha256(b"".join(transactions)).hexdigest(),
+        )
+        self.entries.append(entry)
+        return entry
+
+    def close(self) -> None:
+        # Pad the tail so the last entry also ends on a boundary
+        self._file.write(bytes(_align(self._offset) - self._offset))
+        self._file.close()
+        with open(self.directory / INDEX_FILE, "w") as f:
+            json.dump({
+                "version": ARCHIVE_VERSION,
+                "alignment": ALIGNMENT,
+                "field_elements_per_blob": self.geometry.field_elements_per_blob,
+                "field_elements_per_cell": self.geometry.field_elements_per_cell,
+                "entries": [asdict(e) for e in self.entries],
+            }, f, indent=2)
+
+    def __enter__(self) -> "BlobArchiveWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BlobArchive:
+    """Read-only, memory-mapped view of an archive.
+
+    Blob views returned by blobs() point into the mapping and must be
+    released before close().
+    """
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        with open(self.directory / INDEX_FILE) as f:
+            index = json.load(f)
+        if index["version"] != ARCHIVE_VERSION:
+            raise ValueError(f"Unsupported archive version: {index['version']}")
+        self.geometry = BlobGeometry(index["field_elements_per_blob"], index["field_elements_per_cell"])
+        self.entries = [ArchiveEntry(**e) for e in index["entries"]]
+
+        self._file = open(self.directory / DATA_FILE, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(ARCHIVE_MAGIC)] != ARCHIVE_MAGIC:
+            self.close()
+            raise ValueError(f"Not a blob archive: {self.directory / DATA_FILE}")
+        self._view = memoryview(self._mmap)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of blobs.bin."""
+        return len(self._mmap)
+
+    def strategies(self) -> list[tuple[str, str, str]]:
+        """(encoding, compression, packing) combinations, in archive order."""
+        return list(dict.fromkeys(e.strategy for e in self.entries))
+
+    def select(self, encoding: str, compression: str, packing: str) -> list[ArchiveEntry]:
+        """Entries of one strategy, in block order."""
+        entries = [e for e in self.entries if e.strategy == (encoding, compression, packing)]
+        return sorted(entries, key=lambda e: e.block_number)
+
+    def blobs(self, entry: ArchiveEntry) -> list[memoryview]:
+        """Zero-copy views of an entry's blobs."""
+        blob_size = self.geometry.blob_size
+        end = entry.offset + entry.blob_count * blob_size
+        return split_blobs(self._view[entry.offset : end], entry.blob_count, blob_size)
+
+    def close(self) -> None:
+        """Unmap and close blobs.bin. Raises BufferError while blobs() views are alive.
+
+        The file is closed and the archive is unusable afterwards either
+        way; the mapping itself goes away once the last view does.
+        """
+        if self._mmap is None:
+            return
+        mapping, self._mmap = self._mmap, None
+        try:
+            if getattr(self, "_view", None) is not None:
+                self._view.release()
+                self._view = None
+            try:
+                mapping.close()
+            except BufferError:
+                raise BufferError(
+                    f"Blob views of {self.directory / DATA_FILE} are still alive; release them before close()"
+                ) from None
+        finally:
+            self._file.close()
+
+    def __enter__(self) -> "BlobArchive":
+        return self
+
+    def __exit__(self, exc_type, *exc) -> None:
+        try:
+            self.close()
+        except BufferError:
+            # Views still referenced from a failing decode's traceback; keep its error
+            if exc_type is None:
+                raise
+
+
+def build_archive(
+    payload_files: list[Path],
+    strategies: list[tuple[str, str, str]],
+    directory: Path,
+    geometry: BlobGeometry = DEFAULT_GEOMETRY,
+) -> list[ArchiveEntry]:
+    """Encode every payload with every (encoding, compression, packing) into an archive."""
+    payload_files = sort_by_block_number(payload_files)
+    with BlobArchiveWriter(directory, geometry) as writer:
+        for enc_name, comp_name, pack_name in strategies:
+            tx_encoder = get_encoder(enc_name)
+            blob_encoder = BlobEncoder.from_names(comp_name, pack_name, geometry=geometry)
+            for payload_file in payload_files:
+                transactions = load_transactions(payload_file)
+                blobs, compressed_size = blob_encoder.encode(tx_encoder.encode(transactions))
+                writer.add(enc_name, comp_name, pack_name, payload_file.name, blobs, compressed_size, transactions)
+    return writer.entries
+
+
+def drop_page_cache(path: Path) -> bool:
+    """Ask the kernel to evict a file's cached pages. Returns whether it could.
+
+    Pages still mapped by a process are not evicted, so close archives
+    over the file first.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+    return True
+
+
+def major_faults() -> int | None:
+    """Major page faults of this process so far, or None without getrusage (Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_majflt
+
+
+@dataclass
+class ArchiveDecodeResult:
+    """Decoding every block of one strategy straight from the archive."""
+
+    encoding: str
+    compression: str
+    packing: str
+    cache: str              # "cold" or "warm"
+    cache_dropped: bool     # Cold pass: eviction was requested and the pass faulted pages in from disk
+    blocks: int
+    blobs: int
+    blob_bytes: int
+    tx_raw_size: int
+    decode_ms: float
+    blob_mb_s: float        # Archive bytes decoded per second
+    tx_mb_s: float          # Transaction bytes recovered per second
+    major_faults: int | None  # Page faults that had to read from disk (None where not measurable)
+
+
+def _decode_entries(archive: BlobArchive, entries: list[ArchiveEntry], validate: bool) -> float:
+    entry = entries[0]
+    blob_encoder = BlobEncoder.from_names(entry.compression, entry.packing, geometry=archive.geometry)
+    tx_encoder = get_encoder(entry.encoding)
+
+    start = time.perf_counter()
+    for entry in entries:
+        transactions = tx_encoder.decode(blob_encoder.decode(archive.blobs(entry)))
+        if validate and hashlib.sha256(b"".join(transactions)).hexdigest() != entry.digest:
+            raise RuntimeError(f"Archive entry does not decode: {entry.payload_file} {entry.strategy}")
+    return (time.perf_counter() - start) * 1000
+
+
+def run_archive_benchmark(directory: Path, warm_runs: int = 3, validate: bool = True) -> list[ArchiveDecodeResult]:
+    """Decode each strategy once from a cold page cache, then warm_runs times warm."""
+    with BlobArchive(directory) as archive:
+        strategies = archive.strategies()
+
+    results = []
+    for strategy in strategies:
+        fadvised = drop_page_cache(Path(directory) / DATA_FILE)
+        runs = [("cold", 1), ("warm", warm_runs)]
+        with BlobArchive(directory) as archive:
+            entries = archive.select(*strategy)
+            blob_bytes = sum(e.blob_count for e in entries) * archive.geometry.blob_size
+            tx_raw_size = sum(e.tx_raw_size for e in entries)
+            for cache, count in runs:
+                if not count:
+                    continue
+                faults_before = major_faults()
+                decode_ms = sum(_decode_entries(archive, entries, validate) for _ in range(count)) / count
+                decode_s = decode_ms / 1000
+                faults = None if faults_before is None else major_faults() - faults_before
+                # fadvise is only a request (tmpfs ignores it); a cold read must fault from disk
+                evicted = cache == "cold" and fadvised and bool(faults)
+                results.append(ArchiveDecodeResult(
+                    encoding=strategy[0],
+                    compression=strategy[1],
+                    packing=strategy[2],
+                    cache=cache,
+                    cache_dropped=evicted,
+                    blocks=len(entries),
+                    blobs=sum(e.blob_count for e in entries),
+                    blob_bytes=blob_bytes,
+                    tx_raw_size=tx_raw_size,
+                    decode_ms=decode_ms,
+                    blob_mb_s=(blob_bytes / 1_000_000) / decode_s if decode_s else 0.0,
+                    tx_mb_s=(tx_raw_size / 1_000_000) / decode_s if decode_s else 0.0,
+                    major_faults=faults,
+                ))
+    return results
+
+
+def save_archive_results(results: list[ArchiveDecodeResult], output_dir: Path) -> Path:
+    """Save archive decode results to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"archive_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump([asdict(r) for r in results], f, indent=2)
+
+    return output_file
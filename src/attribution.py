@@ -0,0 +1,270 @@
+"""Attribute compressed payload bytes to transactions and their fields.
+
+The encoded tx list is fed to a zstd compressobj in order, with a block
+flush at every boundary between spans of different (transaction,
+category). The compressed bytes emitted by each flush are charged to the
+span just written. Matches may reference any earlier span, so a
+transaction that repeats an earlier one is charged only for what it
+adds, which is what it costs in a real blob.
+
+Each flush ends a zstd block (3 byte header, fresh entropy tables), so
+the flushed stream is larger than a one-shot compression. The report
+keeps both totals and scales attributed bytes by their ratio.
+"""
+
+import json
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+
+import rlp
+import zstandard as zstd
+from rlp.codec import consume_length_prefix, length_prefix
+
+from .payload import load_transactions
+from .transaction import RLP_STRING_OFFSET, TX_FIELDS, rlp_list_item_spans, tx_type
+from .tx_list_encoding import get_encoder
+
+# Byte categories
+FRAMING = "framing"            # List headers, offsets, type byte, tx list header
+HEADER = "header"              # Nonce, gas, fees, to, value, blob hashes
+CALLDATA = "calldata"
+ACCESS_LIST = "access_list"
+AUTHORIZATION = "authorization"
+SIGNATURE = "signature"
+CATEGORIES = (FRAMING, HEADER, CALLDATA, ACCESS_LIST, AUTHORIZATION, SIGNATURE)
+
+FIELD_CATEGORIES = {
+    "data": CALLDATA,
+    "access_list": ACCESS_LIST,
+    "authorization_list": AUTHORIZATION,
+    "v": SIGNATURE,
+    "y_parity": SIGNATURE,
+    "r": SIGNATURE,
+    "s": SIGNATURE,
+}
+
+# Transaction index for bytes shared by the whole list (outer header, SSZ offsets)
+LIST_LEVEL = -1
+
+ATTRIBUTION_ENCODINGS = ("rlp", "ssz")
+
+
+@dataclass
+class TxAttribution:
+    """Raw and compressed bytes of one transaction, per category."""
+
+    payload_file: str
+    index: int
+    tx_type: int
+    raw_size: int               # Bytes in the encoded list, including its RLP string prefix
+    compressed_size: float      # Flushed bytes (unscaled)
+    raw: dict[str, int] = field(default_factory=dict)
+    compressed: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class PayloadAttribution:
+    """One payload through one encoding and zstd level."""
+
+    payload_file: str
+    encoding: str
+    level: int
+    encoded_size: int
+    compressed_size: int        # One-shot compression, as in a blob
+    flushed_size: int           # Sum of per-span flushes
+    list_level: dict[str, float] = field(default_factory=dict)
+    transactions: list[TxAttribution] = field(default_factory=list)
+
+
+def _tx_spans(tx: bytes) -> list[tuple[int, int, str]]:
+    """(start, end, category) spans covering a raw transaction."""
+    t = tx_type(tx)
+    offset = 0 if t == 0 else 1
+    try:
+        _, typ, length, pos = consume_length_prefix(tx, offset)
+    except rlp.DecodingError:
+        return [(0, len(tx), FRAMING)]
+    if typ is not list or t not in TX_FIELDS or pos + length != len(tx):
+        return [(0, len(tx), FRAMING)]
+
+    spans = [(0, pos, FRAMING)]
+    for name in TX_FIELDS[t]:
+        if pos >= len(tx):
+            break
+        start = pos
+        _, _, length, pos = consume_length_prefix(tx, pos)
+        pos += length
+        spans.append((start, pos, FIELD_CATEGORIES.get(name, HEADER)))
+    if pos < len(tx):
+        spans.append((pos, len(tx), FRAMING))
+    return spans
+
+
+def _tx_offsets(encoding: str, data: bytes, transactions: list[bytes]) -> list[int]:
+    """Start offset of each transaction inside the encoded list."""
+    if encoding == "rlp":
+        return [offset for offset, _ in rlp_list_item_spans(data)]
+    if encoding == "ssz":
+        return [int.from_bytes(data[4 * i : 4 * i + 4], "little") for i in range(len(transactions))]
+    raise ValueError(f"Attribution supports {ATTRIBUTION_ENCODINGS}, got: {encoding}")
+
+
+def _segments(encoding: str, data: bytes, transactions: list[bytes]) -> list[tuple[int, int, int, str]]:
+    """(start, end, tx_index, category) covering data, adjacent same-owner spans merged."""
+    segments: list[tuple[int, int, int, str]] = []
+
+    def add(start: int, end: int, index: int, category: str) -> None:
+        if start == end:
+            return
+        if segments and segments[-1][2:] == (index, category) and segments[-1][1] == start:
+            segments[-1] = (segments[-1][0], end, index, category)
+        else:
+            segments.append((start, end, index, category))
+
+    pos = 0
+    for i, (tx, offset) in enumerate(zip(transactions, _tx_offsets(encoding, data, transactions))):
+        # An RLP string prefix belongs to its transaction; the list header and SSZ offsets to the list
+        prefix = len(length_prefix(len(tx), RLP_STRING_OFFSET)) if encoding == "rlp" else 0
+        add(pos, offset - prefix, LIST_LEVEL, FRAMING)
+        add(offset - prefix, offset, i, FRAMING)
+        for start, end, category in _tx_spans(tx):
+            add(offset + start, offset + end, i, category)
+        pos = offset + len(tx)
+    add(pos, len(data), LIST_LEVEL, FRAMING)
+    return segments
+
+
+def attribute_payload(
+    transactions: list[bytes],
+    encoding: str = "rlp",
+    level: int = 22,
+    payload_file: str = "",
+) -> PayloadAttribution:
+    """Attribute zstd-compressed bytes of one encoded payload."""
+    data = get_encoder(encoding).encode(transactions)
+    compressor = zstd.ZstdCompressor(level=level)
+    cobj = compressor.compressobj(size=len(data))
+    view = memoryview(data)
+
+    txs = [
+        TxAttribution(payload_file, i, tx_type(tx), 0, 0.0,
+                      dict.fromkeys(CATEGORIES, 0), dict.fromkeys(CATEGORIES, 0.0))
+        for i, tx in enumerate(transactions)
+    ]
+    list_level = dict.fromkeys(CATEGORIES, 0.0)
+
+    flushed = 0
+    for start, end, index, category in _segments(encoding, data, transactions):
+        out = len(cobj.compress(view[start:end])) + len(cobj.flush(zstd.COMPRESSOBJ_FLUSH_BLOCK))
+        flushed += out
+        if index == LIST_LEVEL:
+            list_level[category] += out
+        else:
+            txs[index].raw[category] += end - start
+            txs[index].compressed[category] += out
+    # Frame epilogue (checksum, last block marker) is list-level framing
+    epilogue = len(cobj.flush(zstd.COMPRESSOBJ_FLUSH_FINISH))
+    list_level[FRAMING] += epilogue
+    flushed += epilogue
+
+    for tx in txs:
+        tx.raw_size = sum(tx.raw.values())
+        tx.compressed_size = sum(tx.compressed.values())
+
+    return PayloadAttribution(
+        payload_file=payload_file,
+        encoding=encoding,
+        level=level,
+        encoded_size=len(data),
+        compressed_size=len(compressor.compress(data)),
+        flushed_size=flushed,
+        list_level=list_level,
+        transactions=txs,
+    )
+
+
+def _empty_totals() -> dict:
+    return {
+        "count": 0,
+        "raw": dict.fromkeys(CATEGORIES, 0),
+        "compressed": dict.fromkeys(CATEGORIES, 0.0),
+    }
+
+
+def summarize_attribution(payloads: list[PayloadAttribution], top: int = 20) -> dict:
+    """Aggregate per tx type and category, with the costliest transactions.
+
+    Compressed bytes are scaled by compressed_size / flushed_size so they
+    add up to the one-shot compressed size.
+    """
+    by_type: dict[int, dict] = {}
+    totals = _empty_totals()
+    costliest: list[dict] = []
+    compressed_size = flushed_size = encoded_size = 0
+
+    for p in payloads:
+        scale = p.compressed_size / p.flushed_size if p.flushed_size else 0.0
+        compressed_size += p.compressed_size
+        flushed_size += p.flushed_size
+        encoded_size += p.encoded_size
+        for category, size in p.list_level.items():
+            totals["compressed"][category] += size * scale
+        totals["raw"][FRAMING] += p.encoded_size - sum(tx.raw_size for tx in p.transactions)
+
+        for tx in p.transactions:
+            entry = by_type.setdefault(tx.tx_type, _empty_totals())
+            for target in (entry, totals):
+                target["count"] += 1
+                for category in CATEGORIES:
+                    target["raw"][category] += tx.raw[category]
+                    target["compressed"][category] += tx.compressed[category] * scale
+            costliest.append({
+                "payload_file": tx.payload_file,
+                "index": tx.index,
+                "tx_type": tx.tx_type,
+                "raw_size": tx.raw_size,
+                "compressed_size": tx.compressed_size * scale,
+            })
+
+    costliest.sort(key=lambda t: t["compressed_size"], reverse=True)
+    encodings = sorted({p.encoding for p in payloads})
+    levels = sorted({p.level for p in payloads})
+
+    return {
+        "encoding": encodings[0] if len(encodings) == 1 else encodings,
+        "level": levels[0] if len(levels) == 1 else levels,
+        "payloads": len(payloads),
+        "encoded_size": encoded_size,
+        "compressed_size": compressed_size,
+        "flushed_size": flushed_size,
+        "categories": list(CATEGORIES),
+        "totals": totals,
+        "by_type": {str(t): by_type[t] for t in sorted(by_type)},
+        "top_transactions": costliest[:top],
+    }
+
+
+def run_attribution(payload_files: list[Path], encoding: str = "rlp", level: int = 22) -> list[PayloadAttribution]:
+    """Attribute every payload."""
+    return [
+        attribute_payload(load_transactions(f), encoding, level, f.name)
+        for f in payload_files
+    ]
+
+
+def save_attribution(payloads: list[PayloadAttribution], output_dir: Path) -> tuple[Path, Path]:
+    """Save the aggregate (attribution_<ts>.json) and per-tx rows (.jsonl)."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    summary_file = output_dir / f"attribution_{timestamp}.json"
+    rows_file = output_dir / f"attribution_{timestamp}.jsonl"
+
+    with open(summary_file, "w") as f:
+        json.dump(summarize_attribution(payloads), f, indent=2)
+    with open(rows_file, "w") as f:
+        for p in payloads:
+            for tx in p.transactions:
+                f.write(json.dumps(asdict(tx)) + "\n")
+
+    return summary_file, rows_file
@@ -0,0 +1,135 @@
+"""Execution payload transactions straight from SSZ-encoded beacon blocks.
+
+/eth/v2/beacon/blocks/{slot} with Accept: application/octet-stream
+returns a SignedBeaconBlock as SSZ, with its fork named in the
+Eth-Consensus-Version header. Only a handful of fixed-position offsets
+need reading to find the execution payload's transaction list, which is
+itself SSZ List[Transaction] and is stored as-is:
+
+    SignedBeaconBlock    message offset @0
+    BeaconBlock          body offset @80 (slot, proposer, parent/state roots)
+    BeaconBlockBody      execution_payload offset @380, next field's offset @384
+    ExecutionPayload     block_number @404, extra_data offset @436,
+                         transactions offset @504, withdrawals offset @508
+
+extra_data is the payload's first variable-size field, so its offset is
+the size of the fixed part. That pins down the payload layout
+independently of the header, and is checked against it.
+"""
+
+from dataclasses import dataclass
+
+OFFSET_SIZE = 4
+
+SIGNED_BLOCK_MESSAGE_OFFSET = 0
+BLOCK_BODY_OFFSET = 8 + 8 + 32 + 32                 # slot, proposer_index, parent_root, state_root
+# randao_reveal, eth1_data, graffiti, 5 list offsets, sync_aggregate
+BODY_EXECUTION_PAYLOAD_OFFSET = 96 + 72 + 32 + 5 * OFFSET_SIZE + 160
+
+PAYLOAD_BLOCK_NUMBER = 32 + 20 + 32 + 32 + 256 + 32  # after hashes, fee recipient, bloom, prev_randao
+PAYLOAD_EXTRA_DATA_OFFSET = PAYLOAD_BLOCK_NUMBER + 4 * 8
+PAYLOAD_TRANSACTIONS_OFFSET = PAYLOAD_EXTRA_DATA_OFFSET + OFFSET_SIZE + 32 + 32  # base_fee, block_hash
+PAYLOAD_WITHDRAWALS_OFFSET = PAYLOAD_TRANSACTIONS_OFFSET + OFFSET_SIZE
+
+
+@dataclass(frozen=True)
+class PayloadLayout:
+    """ExecutionPayload shape of one fork."""
+
+    fixed_size: int             # Bytes before the first variable-size field
+    has_withdrawals: bool       # Transactions are followed by withdrawals
+    body_is_last: bool          # execution_payload is the body's last field
+
+
+BELLATRIX = PayloadLayout(PAYLOAD_WITHDRAWALS_OFFSET, has_withdrawals=False, body_is_last=True)
+CAPELLA = PayloadLayout(PAYLOAD_WITHDRAWALS_OFFSET + OFFSET_SIZE, has_withdrawals=True, body_is_last=False)
+DENEB = PayloadLayout(CAPELLA.fixed_size + 8 + 8, has_withdrawals=True, body_is_last=False)  # blob gas fields
+
+# Forks before bellatrix have no execution payload
+PAYLOAD_LAYOUTS = {
+    "bellatrix": BELLATRIX,
+    "capella": CAPELLA,
+    "deneb": DENEB,
+    "electra": DENEB,
+    "fulu": DENEB,
+}
+
+
+@dataclass
+class BlockTransactions:
+    """The transaction list of one block, still SSZ encoded."""
+
+    fork: str
+    block_number: int
+    transactions: memoryview    # SSZ List[Transaction]
+
+
+def _offset(data: memoryview, pos: int) -> int:
+    if pos + OFFSET_SIZE > len(data):
+        raise ValueError(f"SSZ offset at {pos} is past the end ({len(data)} bytes)")
+    return int.from_bytes(data[pos : pos + OFFSET_SIZE], "little")
+
+
+def _span(data: memoryview, base: int, start_pos: int, end: int | None) -> tuple[int, int]:
+    """Absolute [start, end) of a variable-size field whose offset sits at base + start_pos."""
+    start = base + _offset(data, base + start_pos)
+    end = len(data) if end is None else end
+    if not base <= start <= end <= len(data):
+        raise ValueError(f"Invalid SSZ field span [{start}, {end}) in {len(data)} bytes")
+    return start, end
+
+
+def execution_transactions(block: bytes, fork: str | None = None) -> BlockTransactions:
+    """Locate the execution payload's transactions in an SSZ SignedBeaconBlock.
+
+    fork comes from the Eth-Consensus-Version header; without it, the
+    layout is inferred from the payload's fixed size. Raises ValueError for
+    forks without an execution payload or malformed offsets.
+    """
+    data = memoryview(block)
+    if fork is not None and fork.lower() not in PAYLOAD_LAYOUTS:
+        raise ValueError(f"Fork {fork!r} has no execution payload")
+
+    message, _ = _span(data, 0, SIGNED_BLOCK_MESSAGE_OFFSET, None)
+    body, _ = _span(data, message, BLOCK_BODY_OFFSET, None)
+    payload_pos = body + BODY_EXECUTION_PAYLOAD_OFFSET
+    fixed_size = _offset(data, body + _offset(data, payload_pos) + PAYLOAD_EXTRA_DATA_OFFSET)
+
+    if fork is None:
+        # Forks sharing a layout are indistinguishable here; report the first
+        candidates = [name for name, layout in PAYLOAD_LAYOUTS.items() if layout.fixed_size == fixed_size]
+        if not candidates:
+            raise ValueError(f"Unknown execution payload layout ({fixed_size} fixed bytes)")
+        fork = candidates[0]
+    fork = fork.lower()
+    layout = PAYLOAD_LAYOUTS[fork]
+    if layout.fixed_size != fixed_size:
+        raise ValueError(f"{fork} payload should have {layout.fixed_size} fixed bytes, has {fixed_size}")
+
+    payload_end = None if layout.body_is_last else body + _offset(data, payload_pos + OFFSET_SIZE)
+    payload, payload_end = _span(data, body, BODY_EXECUTION_PAYLOAD_OFFSET, payload_end)
+
+    tx_end = payload_end
+    if layout.has_withdrawals:
+        tx_end = payload + _offset(data, payload + PAYLOAD_WITHDRAWALS_OFFSET)
+    tx_start, tx_end = _span(data, payload, PAYLOAD_TRANSACTIONS_OFFSET, tx_end)
+
+    number = int.from_bytes(data[payload + PAYLOAD_BLOCK_NUMBER : payload + PAYLOAD_BLOCK_NUMBER + 8], "little")
+    return BlockTransactions(fork, number, data[tx_start:tx_end])
+
+
+def decode_transactions(data: bytes) -> list[bytes]:
+    """Split an SSZ List[Transaction] into raw transactions."""
+    if not data:
+        return []
+    view = memoryview(data)
+    first = _offset(view, 0)
+    if first % OFFSET_SIZE or not OFFSET_SIZE <= first <= len(view):
+        raise ValueError(f"Invalid first offset {first} in SSZ transaction list")
+    offsets = [_offset(view, i) for i in range(0, first, OFFSET_SIZE)] + [len(view)]
+    transactions = []
+    for start, end in zip(offsets, offsets[1:]):
+        if not first <= start <= end <= len(view):
+            raise ValueError(f"Invalid transaction span [{start}, {end}) in SSZ transaction list")
+        transactions.append(bytes(view[start:end]))
+    return transactions
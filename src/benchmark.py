@@ -2,15 +2,20 @@
 
 import json
 import time
-from dataclasses import dataclass, asdict
+import tracemalloc
+from dataclasses import dataclass, asdict, fields
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from .blob import BlobEncoder
+from .buffers import BufferPool
 from .compression import COMPRESSORS
 from .tx_list_encoding import ENCODERS
-from .packing import PACKERS
+from .packing import ENTROPY_PACKERS, PACKERS
 from .payload import load_transactions, get_encoder
+from .result_cache import ResultCache, cell_key, payload_hash, source_fingerprint
+from .summary import ResultsWriter, write_summary
 
 
 @dataclass
@@ -79,14 +84,116 @@ def benchmark_single(
     )
 
 
-def run_benchmark(
+@dataclass
+class AllocationResult:
+    """Transient allocations of encode/decode with and without a buffer pool."""
+
+    encoding: str
+    compression: str
+    packing: str
+    payload_file: str
+    pooled: bool
+    encode_peak_bytes: int  # Peak bytes allocated during one encode
+    decode_peak_bytes: int  # Peak bytes allocated during one decode
+    encode_time_ms: float
+    decode_time_ms: float
+
+
+def _peak_allocation(fn) -> int:
+    """Peak bytes allocated above the starting level while running fn."""
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    fn()
+    return tracemalloc.get_traced_memory()[1] - start
+
+
+def benchmark_allocations(
+    data: bytes,
+    compression: str,
+    packing: str,
+    encoding_name: str,
+    payload_file: str,
+    iterations: int = 10,
+) -> list[AllocationResult]:
+    """Measure encode/decode allocations without and with a BufferPool."""
+    results = []
+
+    for pooled in (False, True):
+        blob_encoder = BlobEncoder.from_names(compression, packing, BufferPool() if pooled else None)
+
+        # Timing runs outside tracemalloc, which slows allocations down.
+        # The first call also warms up the pool.
+        r = benchmark_single(data, blob_encoder, encoding_name, payload_file, 0, iterations)
+        blobs, _ = blob_encoder.encode(data)
+
+        tracemalloc.start()
+        try:
+            encode_peak = max(_peak_allocation(lambda: blob_encoder.encode(data)) for _ in range(iterations))
+            decode_peak = max(_peak_allocation(lambda: blob_encoder.decode(blobs)) for _ in range(iterations))
+        finally:
+            tracemalloc.stop()
+
+        results.append(AllocationResult(
+            encoding=encoding_name,
+            compression=r.compression,
+            packing=r.packing,
+            payload_file=payload_file,
+            pooled=pooled,
+            encode_peak_bytes=encode_peak,
+            decode_peak_bytes=decode_peak,
+            encode_time_ms=r.encode_time_ms,
+            decode_time_ms=r.decode_time_ms,
+        ))
+
+    return results
+
+
+def strategy_combinations(
+    encoders: list[str],
+    compressors: list[str],
+    packers: list[str],
+) -> list[tuple[str, str, str]]:
+    """Expand (encoding, compression, packing) combinations.
+
+    Per-tx encoders already compress, and entropy-coding packers replace
+    compression, so both only pair with "none".
+    """
+    combinations = []
+    for enc_name in encoders:
+        is_pertx = enc_name.startswith("rlp_pertx_")
+        comp_list = ["none"] if is_pertx else compressors
+        for comp_name in comp_list:
+            for pack_name in packers:
+                if pack_name in ENTROPY_PACKERS and comp_name != "none":
+                    continue
+                combinations.append((enc_name, comp_name, pack_name))
+    return combinations
+
+
+def _cached_result(entry: dict, payload_file: str) -> BenchmarkResult:
+    result = BenchmarkResult(**{f.name: entry[f.name] for f in fields(BenchmarkResult)})
+    # Identical content may sit under another file name
+    result.payload_file = payload_file
+    return result
+
+
+def iter_benchmark(
     payload_files: list[Path],
     encoders: list[str] | None = None,
     compressors: list[str] | None = None,
     packers: list[str] | None = None,
     iterations: int = 10,
-) -> list[BenchmarkResult]:
-    """Run benchmark across all combinations."""
+    cache: ResultCache | None = None,
+    retime: bool = False,
+) -> Iterator[BenchmarkResult]:
+    """Run benchmark across all combinations, yielding each result as it is measured.
+
+    With a cache, cells already measured for the same payload content and
+    code are yielded from it, and new cells are added to it. retime
+    re-measures cached cells, so timings come from this machine and run;
+    sizes do not change. Cells cached with a different iteration count
+    are re-measured too.
+    """
     if encoders is None:
         encoders = list(ENCODERS.keys())
     if compressors is None:
@@ -94,37 +201,85 @@ def run_benchmark(
     if packers is None:
         packers = list(PACKERS.keys())
 
-    results = []
+    combinations = strategy_combinations(encoders, compressors, packers)
+    fingerprints = {}
+    if cache is not None:
+        for enc_name, comp_name, pack_name in combinations:
+            blob_encoder = BlobEncoder.from_names(comp_name, pack_name)
+            fingerprints[enc_name, comp_name, pack_name] = source_fingerprint(
+                get_encoder(enc_name), blob_encoder.compressor, blob_encoder.packer, blob_encoder
+            )
 
     for payload_file in payload_files:
         print(f"Processing {payload_file.name}...")
-        transactions = load_transactions(payload_file)
-        # Raw size = sum of all transaction bytes (before any encoding/compression)
-        tx_raw_size = sum(len(tx) for tx in transactions)
-
-        for enc_name in encoders:
-            tx_encoder = get_encoder(enc_name)
-            data = tx_encoder.encode(transactions)
-
-            # Per-tx encoders already compress, so only use "none" for blob compression
-            is_pertx = enc_name.startswith("rlp_pertx_")
-            comp_list = ["none"] if is_pertx else compressors
-
-            for comp_name in comp_list:
-                for pack_name in packers:
-                    blob_encoder = BlobEncoder.from_names(comp_name, pack_name)
-                    result = benchmark_single(
-                        data, blob_encoder, enc_name, payload_file.name, tx_raw_size, iterations
-                    )
-                    results.append(result)
-                    print(f"  {enc_name}+{blob_encoder.name}: {result.blob_count} blobs, "
-                          f"{result.space_efficiency:.2%} efficiency")
+        digest = payload_hash(payload_file) if cache is not None else ""
+        transactions = None
+        tx_raw_size = 0
 
-    return results
+        encoded: dict[str, bytes] = {}
+        for enc_name, comp_name, pack_name in combinations:
+            key = None
+            if cache is not None:
+                key = cell_key(digest, enc_name, comp_name, pack_name, fingerprints[enc_name, comp_name, pack_name])
+                entry = cache.get(key)
+                # Timings from another iteration count are not comparable
+                if entry is not None and not retime and entry["iterations"] == iterations:
+                    yield _cached_result(entry, payload_file.name)
+                    continue
+
+            if transactions is None:
+                transactions = load_transactions(payload_file)
+                # Raw size = sum of all transaction bytes (before any encoding/compression)
+                tx_raw_size = sum(len(tx) for tx in transactions)
+            if enc_name not in encoded:
+                encoded[enc_name] = get_encoder(enc_name).encode(transactions)
+            data = encoded[enc_name]
+
+            blob_encoder = BlobEncoder.from_names(comp_name, pack_name)
+            result = benchmark_single(
+                data, blob_encoder, enc_name, payload_file.name, tx_raw_size, iterations
+            )
+            print(f"  {enc_name}+{blob_encoder.name}: {result.blob_count} blobs, "
+                  f"{result.space_efficiency:.2%} efficiency")
+            if cache is not None:
+                cache.put(key, result, iterations)
+            yield result
+
+
+def run_benchmark(
+    payload_files: list[Path],
+    encoders: list[str] | None = None,
+    compressors: list[str] | None = None,
+    packers: list[str] | None = None,
+    iterations: int = 10,
+    cache: ResultCache | None = None,
+    retime: bool = False,
+) -> list[BenchmarkResult]:
+    """Run benchmark across all combinations."""
+    return list(iter_benchmark(payload_files, encoders, compressors, packers, iterations, cache, retime))
+
+
+def stream_results(results: Iterable[BenchmarkResult], output_dir: Path) -> ResultsWriter:
+    """Write results to benchmark_<timestamp>/ as they arrive.
+
+    Rows go to results.jsonl and per-strategy shards; summary.json is
+    computed from running aggregates. Returns the closed writer, whose
+    aggregator holds the totals.
+    """
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    with ResultsWriter(output_dir / f"benchmark_{timestamp}") as writer:
+        for r in results:
+            writer.write(r)
+    return writer
 
 
 def save_results(results: list[BenchmarkResult], output_dir: Path) -> Path:
-    """Save benchmark results to JSON."""
+    """Save benchmark results to JSON.
+
+    Alongside the full results file, writes benchmark_<timestamp>/ with a
+    pre-aggregated summary.json and per-strategy detail shards for the
+    dashboard.
+    """
     output_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     output_file = output_dir / f"benchmark_{timestamp}.json"
@@ -132,4 +287,6 @@ def save_results(results: list[BenchmarkResult], output_dir: Path) -> Path:
     with open(output_file, "w") as f:
         json.dump([asdict(r) for r in results], f, indent=2)
 
+    write_summary(results, output_dir / f"benchmark_{timestamp}")
+
     return output_file
@@ -1,20 +1,51 @@
 """Blob encoding combining compression and packing strategies."""
 
+from collections.abc import Mapping
+
+from .buffers import BufferPool
 from .compression import Compressor, get_compressor
-from .packing import Packer, get_packer
+from .packing import (
+    DEFAULT_GEOMETRY,
+    BlobGeometry,
+    Packer,
+    cell_byte_range,
+    cells_for_range,
+    get_packer,
+    packed_size,
+    split_blobs,
+    unpack_buffer_size,
+)
+
+# Compressed length prefix: 4 bytes (supports up to ~4 GB)
+LENGTH_PREFIX_SIZE = 4
 
 
 class BlobEncoder:
-    """Encode data into blobs using a compression + packing strategy."""
+    """Encode data into blobs using a compression + packing strategy.
+
+    With a BufferPool, packing and unpacking write into reused buffers:
+    encode() then returns blob views into the pool, valid until the pool
+    hands the same buffer out again.
+
+    With pass-through compression, a byte range of the data can be read
+    from just the cells that hold it (cells_for_range / decode_cells).
+    """
 
-    def __init__(self, compressor: Compressor, packer: Packer):
+    def __init__(self, compressor: Compressor, packer: Packer, pool: BufferPool | None = None):
         self.compressor = compressor
         self.packer = packer
+        self.pool = pool
 
     @classmethod
-    def from_names(cls, compression: str, packing: str) -> "BlobEncoder":
+    def from_names(
+        cls,
+        compression: str,
+        packing: str,
+        pool: BufferPool | None = None,
+        geometry: BlobGeometry = DEFAULT_GEOMETRY,
+    ) -> "BlobEncoder":
         """Create encoder from strategy names."""
-        return cls(get_compressor(compression), get_packer(packing))
+        return cls(get_compressor(compression), get_packer(packing, geometry), pool)
 
     @property
     def name(self) -> str:
@@ -31,27 +62,90 @@ class BlobEncoder:
         compressed = self.compressor.compress(data)
 
         # Prepend compressed length for decoding
-        # Use 4 bytes for length (supports up to ~4 GB)
-        compressed_len_prefix = len(compressed).to_bytes(4, "big")
-        payload = compressed_len_prefix + compressed
+        compressed_len_prefix = len(compressed).to_bytes(LENGTH_PREFIX_SIZE, "big")
+
+        if self.pool is None:
+            # Pack into blobs
+            blobs = self.packer.pack(compressed_len_prefix + compressed)
+            return blobs, len(compressed)
+
+        payload_len = LENGTH_PREFIX_SIZE + len(compressed)
+        payload = self.pool.get("payload", payload_len)
+        payload[:LENGTH_PREFIX_SIZE] = compressed_len_prefix
+        payload[LENGTH_PREFIX_SIZE:] = compressed
 
-        # Pack into blobs
-        blobs = self.packer.pack(payload)
+        out = self.pool.get("blobs", packed_size(self.packer, payload_len))
+        num_blobs = self.packer.pack_into(payload, out)
 
-        return blobs, len(compressed)
+        return split_blobs(out, num_blobs, self.packer.geometry.blob_size), len(compressed)
 
     def decode(self, blobs: list[bytes]) -> bytes:
         """Decode blobs back to original data."""
         # Unpack from blobs
-        payload = self.packer.unpack(blobs)
+        if self.pool is None:
+            payload = self.packer.unpack(blobs)
+        else:
+            payload = self.pool.get("unpacked", unpack_buffer_size(self.packer, blobs))
+            self.packer.unpack_into(blobs, payload)
 
         # Extract compressed length
-        compressed_len = int.from_bytes(payload[:4], "big")
+        compressed_len = int.from_bytes(payload[:LENGTH_PREFIX_SIZE], "big")
 
         # Extract compressed data
-        compressed = payload[4 : 4 + compressed_len]
+        compressed = payload[LENGTH_PREFIX_SIZE : LENGTH_PREFIX_SIZE + compressed_len]
 
         # Decompress
         data = self.compressor.decompress(compressed)
 
-        return data
+        # Pass-through compression hands back a view into the pool
+        return data if isinstance(data, bytes) else bytes(data)
+
+    def _require_passthrough(self) -> None:
+        if self.compressor.name != "none":
+            raise ValueError(f"Partial decode needs compression 'none', not {self.compressor.name!r}")
+
+    def cells_for_range(self, start: int, end: int) -> list[int]:
+        """Global cell indices holding data bytes [start, end)."""
+        self._require_passthrough()
+        return cells_for_range(self.packer, LENGTH_PREFIX_SIZE + start, LENGTH_PREFIX_SIZE + end)
+
+    def decode_cells(self, cells: Mapping[int, bytes]) -> list[tuple[int, bytes]]:
+        """Decode a subset of cells, keyed by global cell index.
+
+        Returns (data offset, bytes) for each contiguous run of cells, in
+        data coordinates (the length prefix removed). When cell 0 is among
+        them, runs are clipped to the data length it records.
+        """
+        self._require_passthrough()
+        runs: list[tuple[int, bytearray]] = []
+        for index in sorted(cells):
+            start, _ = cell_byte_range(self.packer, index)
+            chunk = self.packer.unpack_cell(cells[index])
+            if runs and runs[-1][0] + len(runs[-1][1]) == start:
+                runs[-1][1].extend(chunk)
+            else:
+                runs.append((start, bytearray(chunk)))
+
+        data_len = None
+        if runs and runs[0][0] == 0:
+            data_len = int.from_bytes(runs[0][1][:LENGTH_PREFIX_SIZE], "big")
+
+        decoded = []
+        for start, run in runs:
+            skip = max(0, LENGTH_PREFIX_SIZE - start)
+            offset = start + skip - LENGTH_PREFIX_SIZE
+            end = len(run) if data_len is None else min(len(run), data_len - offset + skip)
+            if end > skip:
+                decoded.append((offset, bytes(run[skip:end])))
+        return decoded
+
+    def decode_range(self, cells: Mapping[int, bytes], start: int, end: int) -> bytes:
+        """Read data bytes [start, end) from the cells that hold them."""
+        if end <= start:
+            return b""
+        indices = self.cells_for_range(start, end)
+        missing = [i for i in indices if i not in cells]
+        if missing:
+            raise ValueError(f"Missing cells {missing} for bytes [{start}, {end})")
+        [(offset, run)] = self.decode_cells({i: cells[i] for i in indices})
+        return run[start - offset : end - offset]
@@ -0,0 +1,34 @@
+"""Reusable byte buffers for allocation-free encode/decode."""
+
+
+class BufferPool:
+    """Reusable bytearrays keyed by role, grown on demand.
+
+    Each key owns a ring of `slots` buffers. A view handed out by get()
+    stays valid until the same key has been requested `slots` more times,
+    so callers that keep blobs around (e.g. a ring of in-flight sidecars)
+    should size `slots` accordingly.
+    """
+
+    def __init__(self, slots: int = 1):
+        if slots < 1:
+            raise ValueError("slots must be >= 1")
+        self.slots = slots
+        self._rings: dict[str, list[bytearray]] = {}
+        self._next: dict[str, int] = {}
+
+    def get(self, key: str, size: int) -> memoryview:
+        """Return a writable view of at least `size` bytes for `key`."""
+        ring = self._rings.setdefault(key, [bytearray() for _ in range(self.slots)])
+        idx = self._next.get(key, 0)
+        self._next[key] = (idx + 1) % self.slots
+
+        if len(ring[idx]) < size:
+            # Replace rather than resize: old views may still be exported
+            ring[idx] = bytearray(size)
+        return memoryview(ring[idx])[:size]
+
+    @property
+    def nbytes(self) -> int:
+        """Total bytes held by the pool."""
+        return sum(len(buf) for ring in self._rings.values() for buf in ring)
@@ -0,0 +1,153 @@
+"""Incremental blob building: admit transactions while they still fit.
+
+The payload is the same as rlp + zstd + packer through BlobEncoder, so
+the result decodes with BlobEncoder.decode and RlpEncoder.decode.
+Transactions are appended to a live zstd stream as RLP items, and each
+append ends with a block flush, so the compressed size after every
+append is known exactly. The RLP list header depends on the final
+length, so finish() compresses it as its own small frame in front.
+
+A rejected append cannot be unwritten from the zstd stream. Instead the
+stream is cut just before it: the bytes flushed for the rejected item are
+dropped, the frame is closed with an empty last block, and later items
+start a new frame. Earlier items are never recompressed, so rollback is
+O(1) at the price of losing match history at each cut. The payload is
+then several frames back to back, so it decodes through
+BlobBuilder.blob_encoder(), whose compressor reads frame by frame.
+"""
+
+import math
+
+import zstandard as zstd
+from rlp.codec import length_prefix
+
+from .blob import LENGTH_PREFIX_SIZE, BlobEncoder
+from .packing import Packer
+from .transaction import RLP_LIST_OFFSET, RLP_STRING_OFFSET
+
+# What FLUSH_FINISH adds after a block flush: an empty raw last block (no checksum)
+FRAME_END = b"\x01\x00\x00"
+
+
+def rlp_item(tx: bytes) -> bytes:
+    """A transaction as an item of the RLP tx list."""
+    if len(tx) == 1 and tx[0] < RLP_STRING_OFFSET:
+        return tx
+    return length_prefix(len(tx), RLP_STRING_OFFSET) + tx
+
+
+class ZstdFramesCompressor:
+    """Zstandard with decompression of concatenated frames.
+
+    Every frame must be complete and nothing may follow the last one;
+    truncated or trailing data raises zstd.ZstdError.
+    """
+
+    def __init__(self, level: int = 3):
+        self.level = level
+        self.name = f"zstd_{level}_frames"
+        self._compressor = zstd.ZstdCompressor(level=level)
+        self._decompressor = zstd.ZstdDecompressor()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def decompress(self, data: bytes) -> bytes:
+        out = []
+        while True:
+            dobj = self._decompressor.decompressobj()
+            out.append(dobj.decompress(data))
+            if not dobj.eof:
+                raise zstd.ZstdError("Truncated zstd frame")
+            data = dobj.unused_data
+            if not data:
+                return b"".join(out)
+
+
+class BlobBuilder:
+    """Append transactions until max_blobs would overflow.
+
+    try_append() admits a transaction only if the finished payload still
+    fits. rollback() undoes the last append by cutting the zstd stream in
+    front of it (see the module docstring).
+    """
+
+    def __init__(self, packer: Packer, max_blobs: int, level: int = 3):
+        self.packer = packer
+        self.max_blobs = max_blobs
+        self.level = level
+        self._compressor = zstd.ZstdCompressor(level=level)
+        # A compressobj shares its compressor's context, so header frames need their own
+        self._header_compressor = zstd.ZstdCompressor(level=level)
+        self._cobj = self._compressor.compressobj()
+        self.transactions: list[bytes] = []
+        self._chunks: list[bytes] = []     # Compressed output, closed frames and the open one
+        self._frame_chunks = 0              # Trailing chunks belonging to the open frame
+        self._body_size = 0                 # Raw RLP items so far
+        self._compressed_body = 0           # Bytes in _chunks
+        self._last_item_size = 0
+        self.rollbacks = 0
+        self.frames = 1
+
+    def blob_encoder(self) -> BlobEncoder:
+        """A BlobEncoder that decodes this builder's blobs (and one-shot zstd blobs)."""
+        return BlobEncoder(ZstdFramesCompressor(self.level), self.packer)
+
+    def _header_frame(self) -> bytes:
+        return self._header_compressor.compress(length_prefix(self._body_size, RLP_LIST_OFFSET))
+
+    @property
+    def compressed_size(self) -> int:
+        """Exact compressed size if finished now."""
+        open_frame = len(FRAME_END) if self._frame_chunks else 0
+        return len(self._header_frame()) + self._compressed_body + open_frame
+
+    @property
+    def blob_count(self) -> int:
+        """Blobs the payload would take if finished now."""
+        return math.ceil((LENGTH_PREFIX_SIZE + self.compressed_size) / self.packer.usable_bytes_per_blob)
+
+    def append(self, tx: bytes) -> None:
+        """Append a transaction unconditionally."""
+        item = rlp_item(tx)
+        chunk = self._cobj.compress(item) + self._cobj.flush(zstd.COMPRESSOBJ_FLUSH_BLOCK)
+        self.transactions.append(tx)
+        self._chunks.append(chunk)
+        self._frame_chunks += 1
+        self._body_size += len(item)
+        self._compressed_body += len(chunk)
+        self._last_item_size = len(item)
+
+    def rollback(self) -> None:
+        """Undo the last append. Only the last append can be undone."""
+        if not self._frame_chunks:
+            raise ValueError("Nothing to roll back")
+        self.transactions.pop()
+        self._compressed_body -= len(self._chunks.pop())
+        self._body_size -= self._last_item_size
+        self._frame_chunks -= 1
+        if self._frame_chunks:
+            # Close the frame before the dropped block; the next append opens a new one
+            self._chunks.append(FRAME_END)
+            self._compressed_body += len(FRAME_END)
+            self._frame_chunks = 0
+            self.frames += 1
+        self._cobj = self._compressor.compressobj()
+        self.rollbacks += 1
+
+    def try_append(self, tx: bytes) -> bool:
+        """Append tx if the payload still fits in max_blobs. Returns whether it was admitted."""
+        self.append(tx)
+        if self.blob_count <= self.max_blobs:
+            return True
+        self.rollback()
+        return False
+
+    def finish(self) -> tuple[list[bytes], int]:
+        """Pack the payload. Returns (blobs, compressed_size) like BlobEncoder.encode.
+
+        The builder cannot be appended to afterwards.
+        """
+        tail = self._cobj.flush(zstd.COMPRESSOBJ_FLUSH_FINISH) if self._frame_chunks else b""
+        compressed = self._header_frame() + b"".join(self._chunks) + tail
+        return self.packer.pack(len(compressed).to_bytes(LENGTH_PREFIX_SIZE, "big") + compressed), len(compressed)
@@ -1,22 +1,25 @@
-"""Compression strategies for blob encoding."""
+"""Compression strategies for blob encoding.
 
+Compressors (and the backends they import) are built on first use; see
+src.lazy.
+"""
+
+from collections.abc import MutableMapping
+
+from ..lazy import LazyRegistry, lazy_exports, lazy_instance
 from .base import Compressor
-from .none import NoCompression
-from .zstd import ZstdCompressor
-from .gzip import GzipCompressor
-from .snappy import SnappyCompressor
 
 
 # Registry of available compressors (instantiated with specific levels)
-COMPRESSORS: dict[str, Compressor] = {
-    "none": NoCompression(),
-    "snappy": SnappyCompressor(),
-    "zstd_1": ZstdCompressor(level=1),
-    "zstd_3": ZstdCompressor(level=3),
-    "zstd_6": ZstdCompressor(level=6),
-    "zstd_22": ZstdCompressor(level=22),
-    "gzip_9": GzipCompressor(level=9),
-}
+COMPRESSORS: MutableMapping[str, Compressor] = LazyRegistry({
+    "none": lazy_instance(f"{__name__}.none", "NoCompression"),
+    "snappy": lazy_instance(f"{__name__}.snappy", "SnappyCompressor"),
+    "zstd_1": lazy_instance(f"{__name__}.zstd", "ZstdCompressor", level=1),
+    "zstd_3": lazy_instance(f"{__name__}.zstd", "ZstdCompressor", level=3),
+    "zstd_6": lazy_instance(f"{__name__}.zstd", "ZstdCompressor", level=6),
+    "zstd_22": lazy_instance(f"{__name__}.zstd", "ZstdCompressor", level=22),
+    "gzip_9": lazy_instance(f"{__name__}.gzip", "GzipCompressor", level=9),
+})
 
 
 def get_compressor(name: str) -> Compressor:
@@ -26,12 +29,22 @@ def get_compressor(name: str) -> Compressor:
     return COMPRESSORS[name]
 
 
+__getattr__ = lazy_exports(__name__, {
+    "NoCompression": ".none",
+    "ZstdCompressor": ".zstd",
+    "GzipCompressor": ".gzip",
+    "SnappyCompressor": ".snappy",
+    "ContextZstdCompressor": ".context",
+}, globals())
+
+
 __all__ = [
     "Compressor",
     "NoCompression",
     "ZstdCompressor",
     "GzipCompressor",
     "SnappyCompressor",
+    "ContextZstdCompressor",
     "COMPRESSORS",
     "get_compressor",
 ]
@@ -0,0 +1,67 @@
+"""Zstandard with previous payloads as a raw-content dictionary."""
+
+from collections import deque
+
+import zstandard as zstd
+
+# Cap on the prefix handed to zstd; older bytes are dropped first
+DEFAULT_MAX_CONTEXT_BYTES = 8 * 1024 * 1024
+
+
+class ContextZstdCompressor:
+    """Stateful zstd: each payload is compressed against the previous N.
+
+    Consecutive blocks share routers, tokens and bot calldata, so the last
+    `depth` payloads are used as a raw-content dictionary (zstd prefix) for
+    the next one. Encoder and decoder sides keep separate rolling contexts,
+    so payloads must be compressed and decompressed in the same order.
+
+    Not in COMPRESSORS: the output depends on call history.
+    """
+
+    def __init__(self, level: int = 22, depth: int = 1, max_context_bytes: int = DEFAULT_MAX_CONTEXT_BYTES):
+        self.level = level
+        self.depth = depth
+        self.max_context_bytes = max_context_bytes
+        self.name = f"zstd_ctx{depth}_{level}"
+        self._compressor = zstd.ZstdCompressor(level=level)
+        self._decompressor = zstd.ZstdDecompressor()
+        self._encode_context: deque[bytes] = deque(maxlen=depth)
+        self._decode_context: deque[bytes] = deque(maxlen=depth)
+
+    def _dictionary(self, context: deque[bytes]) -> zstd.ZstdCompressionDict | None:
+        # Most recent payload last, so the closest matches get the shortest offsets
+        prefix = b"".join(context)[-self.max_context_bytes :]
+        if len(prefix) < 8:
+            return None
+        return zstd.ZstdCompressionDict(prefix, dict_type=zstd.DICT_TYPE_RAWCONTENT)
+
+    def compress(self, data: bytes) -> bytes:
+        dictionary = self._dictionary(self._encode_context)
+        if dictionary is None:
+            compressed = self._compressor.compress(data)
+        else:
+            compressed = zstd.ZstdCompressor(level=self.level, dict_data=dictionary).compress(data)
+        if self.depth:
+            self._encode_context.append(bytes(data))
+        return compressed
+
+    def decompress(self, data: bytes) -> bytes:
+        dictionary = self._dictionary(self._decode_context)
+        if dictionary is None:
+            decompressed = self._decompressor.decompress(data)
+        else:
+            decompressed = zstd.ZstdDecompressor(dict_data=dictionary).decompress(data)
+        if self.depth:
+            self._decode_context.append(decompressed)
+        return decompressed
+
+    @property
+    def context_bytes(self) -> int:
+        """Bytes held by one side's rolling context."""
+        return min(sum(len(p) for p in self._encode_context), self.max_context_bytes)
+
+    def reset(self) -> None:
+        """Drop both rolling contexts."""
+        self._encode_context.clear()
+        self._decode_context.clear()
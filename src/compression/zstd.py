@@ -16,4 +16,4 @@ class ZstdCompressor:
         return self._compressor.compress(data)
 
     def decompress(self, data: bytes) -> bytes:
-        return self._decompressor.decompress(data)
+        return self._decompressor.decompress(data, allow_extra_data=False)
@@ -0,0 +1,135 @@
+"""Cross-block context benchmark: previous blocks as a zstd prefix."""
+
+import json
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .blob import BlobEncoder
+from .compression import ContextZstdCompressor, ZstdCompressor
+from .packing import get_packer
+from .payload import load_transactions, sort_by_block_number
+from .tx_list_encoding import get_encoder
+
+
+@dataclass
+class ContextResult:
+    """One block encoded with and without cross-block context."""
+
+    payload_file: str
+    encoding: str
+    compression: str        # Context compressor name (zstd_ctx{depth}_{level})
+    packing: str
+    depth: int              # Number of previous blocks in the context
+    encoded_size: int
+    plain_compressed_size: int
+    context_compressed_size: int
+    plain_blobs: int
+    context_blobs: int
+    context_bytes: int      # Bytes held by the rolling context (per side)
+    plain_encode_ms: float
+    context_encode_ms: float
+    plain_decode_ms: float
+    context_decode_ms: float
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    value = fn(*args)
+    return value, (time.perf_counter() - start) * 1000
+
+
+def run_context_benchmark(
+    payload_files: list[Path],
+    depths: list[int],
+    level: int = 22,
+    encoding: str = "rlp",
+    packing: str = "bitpack",
+) -> list[ContextResult]:
+    """Encode payloads in block order with a rolling context of each depth."""
+    tx_encoder = get_encoder(encoding)
+    payload_files = sort_by_block_number(payload_files)
+    encoded = [tx_encoder.encode(load_transactions(p)) for p in payload_files]
+
+    plain = BlobEncoder(ZstdCompressor(level=level), get_packer(packing))
+    plain_runs = []
+    for data in encoded:
+        (blobs, compressed_size), encode_ms = _timed(plain.encode, data)
+        _, decode_ms = _timed(plain.decode, blobs)
+        plain_runs.append((len(blobs), compressed_size, encode_ms, decode_ms))
+
+    results = []
+    for depth in depths:
+        # Encoder and decoder sides of one stream, as a sender and a node would hold
+        sender = BlobEncoder(ContextZstdCompressor(level=level, depth=depth), get_packer(packing))
+        receiver = BlobEncoder(ContextZstdCompressor(level=level, depth=depth), get_packer(packing))
+
+        for payload_file, data, plain_run in zip(payload_files, encoded, plain_runs):
+            (blobs, compressed_size), encode_ms = _timed(sender.encode, data)
+            decoded, decode_ms = _timed(receiver.decode, blobs)
+            if decoded != data:
+                raise RuntimeError(f"Context decode mismatch for {payload_file.name} at depth {depth}")
+
+            plain_blobs, plain_size, plain_encode_ms, plain_decode_ms = plain_run
+            results.append(ContextResult(
+                payload_file=payload_file.name,
+                encoding=encoding,
+                compression=sender.compressor.name,
+                packing=sender.packer.name,
+                depth=depth,
+                encoded_size=len(data),
+                plain_compressed_size=plain_size,
+                context_compressed_size=compressed_size,
+                plain_blobs=plain_blobs,
+                context_blobs=len(blobs),
+                context_bytes=sender.compressor.context_bytes,
+                plain_encode_ms=plain_encode_ms,
+                context_encode_ms=encode_ms,
+                plain_decode_ms=plain_decode_ms,
+                context_decode_ms=decode_ms,
+            ))
+
+    return results
+
+
+def summarize_context(results: list[ContextResult]) -> list[dict]:
+    """Totals per depth: blobs saved, bytes saved, latency and memory cost."""
+    by_depth: dict[int, list[ContextResult]] = {}
+    for r in results:
+        by_depth.setdefault(r.depth, []).append(r)
+
+    summary = []
+    for depth, rows in sorted(by_depth.items()):
+        n = len(rows)
+        summary.append({
+            "depth": depth,
+            "compression": rows[0].compression,
+            "blocks": n,
+            "plain_blobs": sum(r.plain_blobs for r in rows),
+            "context_blobs": sum(r.context_blobs for r in rows),
+            "blobs_saved": sum(r.plain_blobs - r.context_blobs for r in rows),
+            "plain_compressed_size": sum(r.plain_compressed_size for r in rows),
+            "context_compressed_size": sum(r.context_compressed_size for r in rows),
+            "max_context_bytes": max(r.context_bytes for r in rows),
+            "plain_encode_ms": sum(r.plain_encode_ms for r in rows) / n,
+            "context_encode_ms": sum(r.context_encode_ms for r in rows) / n,
+            "plain_decode_ms": sum(r.plain_decode_ms for r in rows) / n,
+            "context_decode_ms": sum(r.context_decode_ms for r in rows) / n,
+        })
+    return summary
+
+
+def save_context_results(results: list[ContextResult], output_dir: Path) -> Path:
+    """Save per-block results and per-depth summary to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"context_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump({
+            "results": [asdict(r) for r in results],
+            "summary": summarize_context(results),
+        }, f, indent=2)
+
+    return output_file
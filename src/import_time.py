@@ -0,0 +1,78 @@
+"""Import time of the CLI entry points and strategy packages."""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+# Entry point scripts, imported as modules from the repo root
+ENTRY_POINTS = ["main", "fetch_blocks", "bench"]
+
+# Strategy packages that short-lived workers import
+PACKAGES = ["src.compression", "src.packing", "src.tx_list_encoding", "src.blob"]
+
+# Slow-to-import backends that should only load on first use
+BACKENDS = ("zstandard", "snappy", "ssz", "rlp", "bitarray")
+
+# Runs in a fresh interpreter: time the import and report loaded backends
+_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+importlib.import_module(sys.argv[1])
+elapsed = time.perf_counter() - start
+print(json.dumps({"import_s": elapsed, "backends": [m for m in sys.argv[2:] if m in sys.modules]}))
+"""
+
+
+@dataclass
+class ImportTimeResult:
+    """Cold import of one module, over several fresh interpreters."""
+
+    module: str
+    runs: int
+    import_ms: float        # Median time inside the import statement
+    import_min_ms: float
+    process_ms: float       # Median wall time of the whole interpreter run
+    backends: list[str]     # Backends loaded as a side effect of the import
+
+
+def measure_import(module: str, runs: int = 5, cwd: Path | None = None) -> ImportTimeResult:
+    """Import a module in `runs` fresh interpreters and time it."""
+    import_times = []
+    process_times = []
+    backends: list[str] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-c", _PROBE, module, *BACKENDS],
+            cwd=cwd, capture_output=True, text=True, check=True,
+        )
+        process_times.append(time.perf_counter() - start)
+        probe = json.loads(proc.stdout.strip().splitlines()[-1])
+        import_times.append(probe["import_s"])
+        backends = probe["backends"]
+
+    return ImportTimeResult(
+        module=module,
+        runs=runs,
+        import_ms=statistics.median(import_times) * 1000,
+        import_min_ms=min(import_times) * 1000,
+        process_ms=statistics.median(process_times) * 1000,
+        backends=backends,
+    )
+
+
+def save_import_times(results: list[ImportTimeResult], output_dir: Path) -> Path:
+    """Save import times to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"imports_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump([asdict(r) for r in results], f, indent=2)
+
+    return output_file
@@ -0,0 +1,91 @@
+"""Lazily built registries and re-exports.
+
+Strategy registries map names to compressors, packers or encoders whose
+backends (zstandard, snappy, ssz, bitarray, ...) are slow to import and
+whose contexts are costly to build. Entries are created on first lookup
+and cached, so a process only pays for the strategies it uses.
+"""
+
+import importlib
+from collections.abc import Callable, Iterator, MutableMapping
+from typing import Any, TypeVar
+
+V = TypeVar("V")
+
+
+def lazy_attr(module: str, attr: str) -> Callable[[], Any]:
+    """Factory returning `module.attr`, importing the module when called."""
+
+    def load():
+        return getattr(importlib.import_module(module), attr)
+
+    return load
+
+
+def lazy_instance(module: str, attr: str, *args, **kwargs) -> Callable[[], Any]:
+    """Factory returning `module.attr(*args, **kwargs)`, importing the module when called."""
+
+    def build():
+        return getattr(importlib.import_module(module), attr)(*args, **kwargs)
+
+    return build
+
+
+class LazyRegistry(MutableMapping[str, V]):
+    """Name -> value mapping built from factories on first access.
+
+    Iterating, len() and `in` only look at the names; indexing (and
+    values()/items()) builds and caches the entries. Assigning stores a
+    ready-built entry, as with the plain dicts registries used to be.
+    """
+
+    def __init__(self, factories: dict[str, Callable[[], V]]):
+        self._factories = factories
+        self._cache: dict[str, V] = {}
+
+    def __getitem__(self, name: str) -> V:
+        if name not in self._cache:
+            self._cache[name] = self._factories[name]()
+        return self._cache[name]
+
+    def __setitem__(self, name: str, value: V) -> None:
+        self._factories[name] = lambda: value
+        self._cache[name] = value
+
+    def __delitem__(self, name: str) -> None:
+        del self._factories[name]
+        self._cache.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._factories
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._factories)
+
+    def __len__(self) -> int:
+        return len(self._factories)
+
+    def is_loaded(self, name: str) -> bool:
+        """Whether an entry has been built yet."""
+        return name in self._cache
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._factories)})"
+
+
+def lazy_exports(package: str, exports: dict[str, str], namespace: dict) -> Callable[[str], Any]:
+    """Module __getattr__ (PEP 562) importing re-exported names on first access.
+
+    exports maps attribute name -> relative submodule (e.g. ".zstd").
+    Resolved names are stored in the package namespace, so later lookups
+    skip __getattr__.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(exports[name], package), name)
+        namespace[name] = value
+        return value
+
+    return __getattr__
@@ -1,27 +1,60 @@
-"""Packing strategies for blob encoding."""
+"""Packing strategies for blob encoding.
 
+Packer classes (and bitarray) are imported on first use; see src.lazy.
+"""
+
+from collections.abc import MutableMapping
+
+from ..lazy import LazyRegistry, lazy_attr, lazy_exports
 from .base import (
     Packer,
     FIELD_ELEMENTS_PER_BLOB,
     BYTES_PER_FIELD_ELEMENT,
     BLOB_SIZE,
     BLS_MODULUS,
+    FIELD_ELEMENTS_PER_CELL,
+    CELL_SIZE,
+    BlobGeometry,
+    DEFAULT_GEOMETRY,
+    blob_count,
+    packed_size,
+    unpacked_size,
+    unpack_buffer_size,
+    split_blobs,
+    split_cells,
+    cell_byte_range,
+    cells_for_range,
 )
-from .naive import NaivePacker
-from .bitpack import BitPacker
 
 # Registry of available packers
-PACKERS: dict[str, type[Packer]] = {
-    "naive": NaivePacker,
-    "bitpack": BitPacker,
-}
+PACKERS: MutableMapping[str, type[Packer]] = LazyRegistry({
+    "naive": lazy_attr(f"{__name__}.naive", "NaivePacker"),
+    "bitpack": lazy_attr(f"{__name__}.bitpack", "BitPacker"),
+})
+
+
+# Entropy coders writing field elements directly; they replace compression, so pair with "none"
+ENTROPY_PACKERS = ["rans_o0", "rans_o1"]
 
 
-def get_packer(name: str) -> Packer:
+def get_packer(name: str, geometry: BlobGeometry = DEFAULT_GEOMETRY) -> Packer:
     """Get a packer by name."""
+    # rANS variants ("rans_o1" loads its static model from disk)
+    if name in ENTROPY_PACKERS:
+        from .rans import make_rans_packer
+        return make_rans_packer(name, geometry)
+
     if name not in PACKERS:
         raise ValueError(f"Unknown packer: {name}. Available: {list(PACKERS.keys())}")
-    return PACKERS[name]()
+    return PACKERS[name](geometry)
+
+
+__getattr__ = lazy_exports(__name__, {
+    "NaivePacker": ".naive",
+    "BitPacker": ".bitpack",
+    "RansPacker": ".rans",
+    "RansModel": ".rans",
+}, globals())
 
 
 __all__ = [
@@ -30,8 +63,23 @@ __all__ = [
     "BYTES_PER_FIELD_ELEMENT",
     "BLOB_SIZE",
     "BLS_MODULUS",
+    "FIELD_ELEMENTS_PER_CELL",
+    "CELL_SIZE",
+    "BlobGeometry",
+    "DEFAULT_GEOMETRY",
+    "blob_count",
+    "packed_size",
+    "unpacked_size",
+    "unpack_buffer_size",
+    "split_blobs",
+    "split_cells",
+    "cell_byte_range",
+    "cells_for_range",
     "NaivePacker",
     "BitPacker",
+    "RansPacker",
+    "RansModel",
     "PACKERS",
+    "ENTROPY_PACKERS",
     "get_packer",
 ]
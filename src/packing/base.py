@@ -1,5 +1,6 @@
 """Base protocol and constants for packing strategies."""
 
+from dataclasses import dataclass
 from typing import Protocol
 
 # Blob constants
@@ -7,14 +8,59 @@ FIELD_ELEMENTS_PER_BLOB = 4096
 BYTES_PER_FIELD_ELEMENT = 32
 BLOB_SIZE = FIELD_ELEMENTS_PER_BLOB * BYTES_PER_FIELD_ELEMENT  # 131072 bytes (~128KB)
 
+# PeerDAS cell: the unit nodes custody and sample
+FIELD_ELEMENTS_PER_CELL = 64
+CELL_SIZE = FIELD_ELEMENTS_PER_CELL * BYTES_PER_FIELD_ELEMENT  # 2048 bytes
+
 # BLS12-381 scalar field modulus
 BLS_MODULUS = 0x73eda753299d7d483339d80809a1d80553bda402fffe5bfeffffffff00000001
 
 
+# Writable buffer accepted by pack_into / unpack_into
+WritableBuffer = bytearray | memoryview
+
+
+@dataclass(frozen=True)
+class BlobGeometry:
+    """Blob and cell sizes, in field elements."""
+
+    field_elements_per_blob: int = FIELD_ELEMENTS_PER_BLOB
+    field_elements_per_cell: int = FIELD_ELEMENTS_PER_CELL
+
+    def __post_init__(self):
+        if self.field_elements_per_blob % self.field_elements_per_cell:
+            raise ValueError(
+                f"{self.field_elements_per_blob} field elements per blob is not a multiple of "
+                f"{self.field_elements_per_cell} per cell"
+            )
+
+    @property
+    def blob_size(self) -> int:
+        return self.field_elements_per_blob * BYTES_PER_FIELD_ELEMENT
+
+    @property
+    def cell_size(self) -> int:
+        return self.field_elements_per_cell * BYTES_PER_FIELD_ELEMENT
+
+    @property
+    def cells_per_blob(self) -> int:
+        return self.field_elements_per_blob // self.field_elements_per_cell
+
+
+DEFAULT_GEOMETRY = BlobGeometry()
+
+
 class Packer(Protocol):
-    """Protocol for packing strategies."""
+    """Protocol for packing strategies.
+
+    Packers lay data out cell by cell: global cell c (blob c // cells_per_blob)
+    holds data[c * usable_bytes_per_cell : (c + 1) * usable_bytes_per_cell],
+    so any cell can be unpacked on its own.
+    """
 
     name: str
+    geometry: BlobGeometry
+    usable_bytes_per_cell: int
     usable_bytes_per_blob: int
 
     def pack(self, data: bytes) -> list[bytes]:
@@ -24,3 +70,88 @@ class Packer(Protocol):
     def unpack(self, blobs: list[bytes]) -> bytes:
         """Unpack blobs back to original data."""
         ...
+
+    def pack_into(self, data: bytes, out: WritableBuffer) -> int:
+        """Pack data into consecutive blobs in out. Returns the blob count."""
+        ...
+
+    def unpack_into(self, blobs: list[bytes], out: WritableBuffer) -> int:
+        """Unpack blobs into out. Returns the number of bytes written."""
+        ...
+
+    def unpack_cell(self, cell: bytes) -> bytes:
+        """Unpack the data held by one cell (usable_bytes_per_cell bytes)."""
+        ...
+
+
+def blob_count(packer: Packer, data_len: int) -> int:
+    """Number of blobs needed to pack data_len bytes."""
+    return -(-data_len // packer.usable_bytes_per_blob)
+
+
+def packed_size(packer: Packer, data_len: int) -> int:
+    """Buffer size pack_into needs for data_len bytes.
+
+    Entropy-coding packers, whose output size depends on the data, give
+    their worst case through max_packed_size.
+    """
+    max_packed_size = getattr(packer, "max_packed_size", None)
+    if max_packed_size is not None:
+        return max_packed_size(data_len)
+    return blob_count(packer, data_len) * packer.geometry.blob_size
+
+
+def unpacked_size(packer: Packer, num_blobs: int) -> int:
+    """Buffer size unpack_into needs for num_blobs blobs."""
+    return num_blobs * packer.usable_bytes_per_blob
+
+
+def unpack_buffer_size(packer: Packer, blobs: list[bytes]) -> int:
+    """Buffer size unpack_into needs for these blobs.
+
+    Entropy-coding packers record the length in the stream and report it
+    through unpacked_length; others need unpacked_size.
+    """
+    unpacked_length = getattr(packer, "unpacked_length", None)
+    if unpacked_length is not None:
+        return unpacked_length(blobs)
+    return unpacked_size(packer, len(blobs))
+
+
+def check_buffer(out: WritableBuffer, required: int) -> memoryview:
+    """Return out as a byte memoryview, or raise if it is too small."""
+    view = memoryview(out).cast("B")
+    if view.readonly:
+        raise ValueError("Output buffer is read-only")
+    if len(view) < required:
+        raise ValueError(f"Output buffer too small: need {required} bytes, got {len(view)}")
+    return view
+
+
+def split_blobs(buf: bytes | memoryview, num_blobs: int, blob_size: int = BLOB_SIZE) -> list[memoryview]:
+    """Zero-copy views of consecutive blobs in buf."""
+    view = memoryview(buf)
+    return [view[i * blob_size : (i + 1) * blob_size] for i in range(num_blobs)]
+
+
+def split_cells(blobs: list[bytes], geometry: BlobGeometry = DEFAULT_GEOMETRY) -> dict[int, memoryview]:
+    """Zero-copy views of every cell, keyed by global cell index."""
+    cells = {}
+    for blob_idx, blob in enumerate(blobs):
+        view = memoryview(blob)
+        for i in range(geometry.cells_per_blob):
+            cells[blob_idx * geometry.cells_per_blob + i] = view[i * geometry.cell_size : (i + 1) * geometry.cell_size]
+    return cells
+
+
+def cell_byte_range(packer: Packer, cell_index: int) -> tuple[int, int]:
+    """Unpacked byte range [start, end) held by a global cell index."""
+    start = cell_index * packer.usable_bytes_per_cell
+    return start, start + packer.usable_bytes_per_cell
+
+
+def cells_for_range(packer: Packer, start: int, end: int) -> list[int]:
+    """Global cell indices holding unpacked bytes [start, end)."""
+    if end <= start:
+        return []
+    return list(range(start // packer.usable_bytes_per_cell, (end - 1) // packer.usable_bytes_per_cell + 1))
@@ -1,9 +1,19 @@
 """Bit-packing: 254 bits per field element."""
 
 from bitarray import bitarray
-from bitarray.util import ba2int, int2ba
 
-from .base import FIELD_ELEMENTS_PER_BLOB, BYTES_PER_FIELD_ELEMENT, BLOB_SIZE
+from .base import (
+    BYTES_PER_FIELD_ELEMENT,
+    DEFAULT_GEOMETRY,
+    BlobGeometry,
+    WritableBuffer,
+    blob_count,
+    check_buffer,
+    split_blobs,
+    unpacked_size,
+)
+
+BITS_PER_FIELD_ELEMENT = BYTES_PER_FIELD_ELEMENT * 8
 
 
 class BitPacker:
@@ -12,63 +22,101 @@ class BitPacker:
     The BLS12-381 scalar field modulus is ~255 bits, but to guarantee
     we stay under it, we use 254 bits per element. This gives us
     254 * 4096 = 1040384 bits = 130048 bytes per blob.
+
+    A 64-element cell holds exactly 254 * 64 / 8 = 2032 bytes, so cells
+    start on byte boundaries of the data stream and unpack independently.
+    That needs field_elements_per_cell to be a multiple of 4.
     """
 
     name = "bitpack_254"
     bits_per_element = 254
-    usable_bytes_per_blob = (254 * FIELD_ELEMENTS_PER_BLOB) // 8  # 130048 bytes
-    _data_mask = (1 << bits_per_element) - 1
+
+    def __init__(self, geometry: BlobGeometry = DEFAULT_GEOMETRY):
+        if (geometry.field_elements_per_cell * self.bits_per_element) % 8:
+            raise ValueError(
+                f"Cells of {geometry.field_elements_per_cell} field elements do not end on a byte boundary"
+            )
+        self.geometry = geometry
+        self.usable_bytes_per_cell = geometry.field_elements_per_cell * self.bits_per_element // 8
+        self.usable_bytes_per_blob = self.usable_bytes_per_cell * geometry.cells_per_blob  # 130048 bytes
+        self._zero_blob = bytes(geometry.blob_size)
 
     def pack(self, data: bytes) -> list[bytes]:
         """Pack data using 254 bits per field element."""
         if not data:
             return []
 
-        blobs = []
+        buf = bytearray(blob_count(self, len(data)) * self.geometry.blob_size)
+        num_blobs = self.pack_into(data, buf)
+        return [bytes(blob) for blob in split_blobs(buf, num_blobs, self.geometry.blob_size)]
+
+    def pack_into(self, data: bytes, out: WritableBuffer) -> int:
+        """Pack data into out, which must hold blob_count(len(data)) blobs.
+
+        Each 32-byte element holds 2 leading zero bits followed by 254 data
+        bits, so the value is guaranteed < 2^254. The last element is padded
+        with zeros on the LSB side.
+        """
+        num_blobs = blob_count(self, len(data))
+        blob_size = self.geometry.blob_size
+        view = check_buffer(out, num_blobs * blob_size)
 
         # Convert data to bit stream
         bits = bitarray(endian="big")
         bits.frombytes(data)
         total_bits = len(bits)
-        offset = 0
-        while offset < total_bits:
-            blob = bytearray(BLOB_SIZE)
+        pad = 2
+        width = self.bits_per_element
 
-            for elem_idx in range(FIELD_ELEMENTS_PER_BLOB):
+        offset = 0
+        for blob_idx in range(num_blobs):
+            blob_view = view[blob_idx * blob_size : (blob_idx + 1) * blob_size]
+            # out may be a reused buffer, so clear padding bits first
+            blob_view[:] = self._zero_blob
+            # Write bits straight into the caller's buffer
+            blob_bits = bitarray(buffer=blob_view, endian="big")
+
+            for elem_idx in range(self.geometry.field_elements_per_blob):
                 if offset >= total_bits:
                     break
+                take = min(width, total_bits - offset)
+                start = elem_idx * BITS_PER_FIELD_ELEMENT + pad
+                blob_bits[start : start + take] = bits[offset : offset + take]
+                offset += take
 
-                # Extract 254 bits for this field element
-                elem_bits = bits[offset : offset + self.bits_per_element]
-                offset += len(elem_bits)
-
-                # Pad to 254 bits if needed (pad on LSB side)
-                missing = self.bits_per_element - len(elem_bits)
-                if missing:
-                    elem_bits.extend([0] * missing)
-
-                # Convert 254 bits to 32 bytes (256 bits), with 2 leading zero bits.
-                # The value is guaranteed < 2^254, so top 2 bits are zero.
-                elem_bytes = ba2int(elem_bits).to_bytes(32, "big")
-
-                blob_offset = elem_idx * BYTES_PER_FIELD_ELEMENT
-                blob[blob_offset : blob_offset + 32] = elem_bytes
-
-            blobs.append(bytes(blob))
-
-        return blobs if blobs else [bytes(BLOB_SIZE)]
+        return num_blobs
 
     def unpack(self, blobs: list[bytes]) -> bytes:
         """Unpack blobs back to data."""
-        all_bits = bitarray(endian="big")
-
+        buf = bytearray(unpacked_size(self, len(blobs)))
+        self.unpack_into(blobs, buf)
+        return bytes(buf)
+
+    def _unpack_elements(self, source: bytes, count: int, out_bits: bitarray, pos: int) -> int:
+        src_bits = bitarray(buffer=source, endian="big")
+        pad = 2
+        width = self.bits_per_element
+        for elem_idx in range(count):
+            # Extract the 254 data bits (skip the 2 padding bits)
+            start = elem_idx * BITS_PER_FIELD_ELEMENT + pad
+            out_bits[pos : pos + width] = src_bits[start : start + width]
+            pos += width
+        return pos
+
+    def unpack_into(self, blobs: list[bytes], out: WritableBuffer) -> int:
+        """Unpack blobs into out, which must hold unpacked_size(len(blobs)) bytes."""
+        size = unpacked_size(self, len(blobs))
+        view = check_buffer(out, size)
+        out_bits = bitarray(buffer=view[:size], endian="big")
+
+        pos = 0
         for blob in blobs:
-            for elem_idx in range(FIELD_ELEMENTS_PER_BLOB):
-                offset = elem_idx * BYTES_PER_FIELD_ELEMENT
-                elem_bytes = blob[offset : offset + 32]
+            pos = self._unpack_elements(blob, self.geometry.field_elements_per_blob, out_bits, pos)
 
-                # Extract the 254 data bits (skip the 2 padding bits)
-                value = int.from_bytes(elem_bytes, "big") & self._data_mask
-                all_bits.extend(int2ba(value, length=self.bits_per_element, endian="big"))
+        return size
 
-        return all_bits.tobytes()
+    def unpack_cell(self, cell: bytes) -> bytes:
+        """Unpack the 2032 bytes (with 64-element cells) held by one cell."""
+        buf = bytearray(self.usable_bytes_per_cell)
+        self._unpack_elements(cell, self.geometry.field_elements_per_cell, bitarray(buffer=buf, endian="big"), 0)
+        return bytes(buf)
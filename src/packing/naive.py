@@ -1,54 +1,96 @@
 """Naive packing: 31 bytes per field element."""
 
-from .base import FIELD_ELEMENTS_PER_BLOB, BYTES_PER_FIELD_ELEMENT, BLOB_SIZE
+from .base import (
+    BYTES_PER_FIELD_ELEMENT,
+    DEFAULT_GEOMETRY,
+    BlobGeometry,
+    WritableBuffer,
+    blob_count,
+    check_buffer,
+    split_blobs,
+    unpacked_size,
+)
 
 
 class NaivePacker:
     """Naive packing: 31 bytes per field element, 1 byte wasted.
 
     Each field element uses bytes [1:32], leaving byte [0] as 0x00.
-    This guarantees we stay under the field modulus.
+    This guarantees we stay under the field modulus. Data fills elements
+    in order, so each cell holds a contiguous 31 * field_elements_per_cell
+    bytes (1984 with 64-element cells).
     """
 
     name = "naive_31"
     usable_bytes_per_element = 31
-    usable_bytes_per_blob = FIELD_ELEMENTS_PER_BLOB * 31  # 126976 bytes
+
+    def __init__(self, geometry: BlobGeometry = DEFAULT_GEOMETRY):
+        self.geometry = geometry
+        self.usable_bytes_per_cell = geometry.field_elements_per_cell * self.usable_bytes_per_element
+        self.usable_bytes_per_blob = geometry.field_elements_per_blob * self.usable_bytes_per_element  # 126976 bytes
+        self._zero_blob = bytes(geometry.blob_size)
 
     def pack(self, data: bytes) -> list[bytes]:
         """Pack data into blobs using 31 bytes per field element."""
         if not data:
             return []
 
-        blobs = []
-        offset = 0
+        buf = bytearray(blob_count(self, len(data)) * self.geometry.blob_size)
+        num_blobs = self.pack_into(data, buf)
+        return [bytes(blob) for blob in split_blobs(buf, num_blobs, self.geometry.blob_size)]
+
+    def pack_into(self, data: bytes, out: WritableBuffer) -> int:
+        """Pack data into out, which must hold blob_count(len(data)) blobs."""
         data_len = len(data)
+        num_blobs = blob_count(self, data_len)
+        blob_size = self.geometry.blob_size
+        view = check_buffer(out, num_blobs * blob_size)
+        src = memoryview(data)
         chunk_size = self.usable_bytes_per_element
 
-        while offset < data_len:
-            blob = bytearray(BLOB_SIZE)
+        offset = 0
+        for blob_idx in range(num_blobs):
+            blob_start = blob_idx * blob_size
+            # out may be a reused buffer, so clear padding bytes first
+            view[blob_start : blob_start + blob_size] = self._zero_blob
 
-            for elem_idx in range(FIELD_ELEMENTS_PER_BLOB):
+            for elem_idx in range(self.geometry.field_elements_per_blob):
                 if offset >= data_len:
                     break
                 # Leave first byte as 0, pack 31 bytes into bytes 1-31
                 take = min(chunk_size, data_len - offset)
-                blob_offset = elem_idx * BYTES_PER_FIELD_ELEMENT
-                blob[blob_offset + 1 : blob_offset + 1 + take] = data[offset : offset + take]
+                blob_offset = blob_start + elem_idx * BYTES_PER_FIELD_ELEMENT
+                view[blob_offset + 1 : blob_offset + 1 + take] = src[offset : offset + take]
                 offset += take
 
-            blobs.append(bytes(blob))
-
-        return blobs
+        return num_blobs
 
     def unpack(self, blobs: list[bytes]) -> bytes:
         """Unpack blobs back to data."""
-        result = bytearray()
+        buf = bytearray(unpacked_size(self, len(blobs)))
+        self.unpack_into(blobs, buf)
+        return bytes(buf)
+
+    def unpack_into(self, blobs: list[bytes], out: WritableBuffer) -> int:
+        """Unpack blobs into out, which must hold unpacked_size(len(blobs)) bytes."""
+        view = check_buffer(out, unpacked_size(self, len(blobs)))
+        chunk_size = self.usable_bytes_per_element
 
+        pos = 0
         for blob in blobs:
-            for i in range(FIELD_ELEMENTS_PER_BLOB):
+            blob = memoryview(blob)
+            for i in range(self.geometry.field_elements_per_blob):
                 offset = i * BYTES_PER_FIELD_ELEMENT
                 # Extract 31 bytes (skip the first byte)
-                chunk = blob[offset + 1 : offset + BYTES_PER_FIELD_ELEMENT]
-                result.extend(chunk)
+                view[pos : pos + chunk_size] = blob[offset + 1 : offset + BYTES_PER_FIELD_ELEMENT]
+                pos += chunk_size
+
+        return pos
 
-        return bytes(result)
+    def unpack_cell(self, cell: bytes) -> bytes:
+        """Unpack the 31 * field_elements_per_cell bytes held by one cell."""
+        cell = memoryview(cell)
+        return b"".join(
+            cell[offset + 1 : offset + BYTES_PER_FIELD_ELEMENT]
+            for offset in range(0, self.geometry.cell_size, BYTES_PER_FIELD_ELEMENT)
+        )
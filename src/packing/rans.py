@@ -0,0 +1,353 @@
+"""rANS entropy coding straight into field elements.
+
+Other strategies compress to bytes and then repack those bytes at 31
+bytes or 254 bits per field element. This packer merges both stages. It
+runs an rANS coder whose output digits are in base BLS_MODULUS instead of
+base 2^8 or 2^16. The coder state lives in [STATE_LOW, STATE_LOW * p).
+Renormalising emits state % p, which is already a canonical field
+element, so every element carries the full log2(p) ~ 254.86 bits. There
+is no intermediate byte stream and no padding bits.
+
+Models are byte frequency tables with PROB_BITS precision:
+
+- order 0, semi-static: fitted to each payload, with the table stored in
+  the stream (rans_o0).
+- order 0 or 1, static: trained on a corpus and shared out of band, like
+  the symbol registry (rans_o1, stored at DEFAULT_MODEL_PATH).
+
+Stream layout, one field element per item, across consecutive blobs:
+
+    header | [frequency table] | final state (2 elements) | digits
+
+The header packs format version, model order, whether a table follows,
+the static model's checksum, the data length and the digit count. The
+stream is a single rANS state, so cells do not decode independently.
+"""
+
+import math
+import zlib
+from pathlib import Path
+
+from .base import (
+    BLS_MODULUS,
+    BYTES_PER_FIELD_ELEMENT,
+    DEFAULT_GEOMETRY,
+    BlobGeometry,
+    WritableBuffer,
+    check_buffer,
+    split_blobs,
+)
+
+PROB_BITS = 14
+PROB_SCALE = 1 << PROB_BITS
+ALPHABET = 256
+
+# rANS state interval is [STATE_LOW, STATE_LOW * BLS_MODULUS)
+STATE_LOW = PROB_SCALE << 64
+
+FORMAT_VERSION = 1
+# Bits per stored frequency (a lone symbol gets all of PROB_SCALE)
+FREQ_BITS = PROB_BITS + 1
+# Bits packed per field element for tables, safely below the modulus
+TABLE_BITS_PER_ELEMENT = 254
+
+MODEL_MAGIC = b"RANS"
+DEFAULT_MODEL_PATH = Path("registry/rans_o1.bin")
+
+
+def normalize_frequencies(counts: list[int], cover_all: bool = False) -> list[int]:
+    """Scale symbol counts to sum to PROB_SCALE.
+
+    Every counted symbol keeps a frequency >= 1. With cover_all, so does
+    every symbol, which static models need to code unseen data.
+    """
+    total = sum(counts)
+    if total == 0:
+        return [PROB_SCALE // ALPHABET] * ALPHABET
+    freqs = [max(1, c * PROB_SCALE // total) if c or cover_all else 0 for c in counts]
+    excess = sum(freqs) - PROB_SCALE
+    # Hand the rounding difference to the most frequent symbols
+    for s in sorted(range(ALPHABET), key=lambda s: -freqs[s]):
+        if excess == 0:
+            break
+        take = min(excess, freqs[s] - 1) if excess > 0 else excess
+        freqs[s] -= take
+        excess -= take
+    return freqs
+
+
+class RansModel:
+    """Frequency tables: one (order 0) or one per previous byte (order 1)."""
+
+    def __init__(self, order: int, tables: list[list[int]]):
+        if order not in (0, 1) or len(tables) != ALPHABET ** order:
+            raise ValueError(f"Order {order} model needs {ALPHABET ** order} tables, got {len(tables)}")
+        if any(sum(t) != PROB_SCALE for t in tables):
+            raise ValueError(f"Model tables must sum to {PROB_SCALE}")
+        self.order = order
+        self.tables = tables
+        self.checksum = zlib.crc32(self._serialize_tables())
+
+        self._cumulative = []
+        self._slots = []
+        for freqs in tables:
+            cum = [0] * ALPHABET
+            for s in range(1, ALPHABET):
+                cum[s] = cum[s - 1] + freqs[s - 1]
+            self._cumulative.append(cum)
+            # slot -> symbol lookup for decoding
+            self._slots.append(b"".join(bytes([s]) * f for s, f in enumerate(freqs)))
+
+    @classmethod
+    def fit(cls, streams: list[bytes], order: int = 1, cover_all: bool = True) -> "RansModel":
+        """Count (previous byte, byte) or byte frequencies over streams."""
+        counts = [[0] * ALPHABET for _ in range(ALPHABET ** order)]
+        for data in streams:
+            if order == 0:
+                for s, n in enumerate(_byte_counts(data)):
+                    counts[0][s] += n
+            else:
+                for ctx, s in zip(b"\0" + data[:-1], data):
+                    counts[ctx][s] += 1
+        return cls(order, [normalize_frequencies(c, cover_all) for c in counts])
+
+    def _serialize_tables(self) -> bytes:
+        return b"".join(f.to_bytes(2, "little") for freqs in self.tables for f in freqs)
+
+    def save(self, path: Path) -> None:
+        """Write as: magic "RANS" | order u32 | prob_bits u32 | u16 frequencies."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(MODEL_MAGIC)
+            for n in (self.order, PROB_BITS):
+                f.write(n.to_bytes(4, "big"))
+            f.write(self._serialize_tables())
+
+    @classmethod
+    def load(cls, path: Path) -> "RansModel":
+        """Read a model written by save()."""
+        data = Path(path).read_bytes()
+        if data[:4] != MODEL_MAGIC:
+            raise ValueError(f"Not an rANS model: {path}")
+        order, prob_bits = (int.from_bytes(data[i : i + 4], "big") for i in (4, 8))
+        if prob_bits != PROB_BITS:
+            raise ValueError(f"Model has {prob_bits} probability bits, expected {PROB_BITS}")
+        freqs = [int.from_bytes(data[i : i + 2], "little") for i in range(12, len(data), 2)]
+        return cls(order, [freqs[i : i + ALPHABET] for i in range(0, len(freqs), ALPHABET)])
+
+
+def _byte_counts(data: bytes) -> list[int]:
+    return [data.count(bytes([s])) for s in range(ALPHABET)]
+
+
+def _pack_table(freqs: list[int]) -> list[int]:
+    value = 0
+    for f in reversed(freqs):
+        value = (value << FREQ_BITS) | f
+    count = math.ceil(ALPHABET * FREQ_BITS / TABLE_BITS_PER_ELEMENT)
+    mask = (1 << TABLE_BITS_PER_ELEMENT) - 1
+    return [(value >> (i * TABLE_BITS_PER_ELEMENT)) & mask for i in range(count)]
+
+
+def _unpack_table(elements: list[int]) -> list[int]:
+    value = 0
+    for e in reversed(elements):
+        value = (value << TABLE_BITS_PER_ELEMENT) | e
+    mask = (1 << FREQ_BITS) - 1
+    return [(value >> (s * FREQ_BITS)) & mask for s in range(ALPHABET)]
+
+
+TABLE_ELEMENTS = len(_pack_table([0] * ALPHABET))
+
+
+def _header(order: int, has_table: bool, checksum: int, length: int, digits: int) -> int:
+    return (
+        (FORMAT_VERSION << 136) | (order << 128) | (int(has_table) << 120)
+        | (checksum << 88) | (length << 32) | digits
+    )
+
+
+def _parse_header(value: int) -> tuple[int, int, bool, int, int, int]:
+    return (
+        value >> 136, (value >> 128) & 0xFF, bool((value >> 120) & 0xFF),
+        (value >> 88) & 0xFFFFFFFF, (value >> 32) & ((1 << 56) - 1), value & 0xFFFFFFFF,
+    )
+
+
+class RansPacker:
+    """Entropy-code data into canonical field elements (compression and packing in one).
+
+    Pair it with compression "none". Without a model, each payload gets
+    its own order-0 table (rans_o0); with a static model, its order names
+    the strategy.
+
+    Blobs are one rANS stream, so unpack_cell is not supported. Coded size
+    depends on the data rather than a fixed ratio, so buffers for
+    pack_into/unpack_into are sized by max_packed_size and unpacked_length.
+    """
+
+    def __init__(self, geometry: BlobGeometry = DEFAULT_GEOMETRY, model: RansModel | None = None):
+        self.geometry = geometry
+        self.model = model
+        self.name = f"rans_o{model.order}" if model is not None else "rans_o0"
+        # Coded bytes an element holds at best: log2(p) bits
+        bits_per_element = math.log2(BLS_MODULUS)
+        self.usable_bytes_per_cell = int(geometry.field_elements_per_cell * bits_per_element / 8)
+        self.usable_bytes_per_blob = int(geometry.field_elements_per_blob * bits_per_element / 8)  # 130486
+
+    def encode_elements(self, data: bytes) -> list[int]:
+        """Code data into field element values."""
+        data = bytes(data)
+        model = self.model
+        if model is None:
+            model = RansModel(0, [normalize_frequencies(_byte_counts(data))])
+        p = BLS_MODULUS
+        # Renormalise before coding s when the state would overflow: x >= bound[s]
+        bounds = [[(STATE_LOW >> PROB_BITS) * f * p for f in freqs] for freqs in model.tables]
+
+        x = STATE_LOW
+        digits = []
+        if model.order == 0:
+            freqs, cum, bound = model.tables[0], model._cumulative[0], bounds[0]
+            for s in reversed(data):
+                if x >= bound[s]:
+                    digits.append(x % p)
+                    x //= p
+                q, r = divmod(x, freqs[s])
+                x = (q << PROB_BITS) + r + cum[s]
+        else:
+            tables, cumulative = model.tables, model._cumulative
+            for s, ctx in zip(reversed(data), reversed(b"\0" + data[:-1])):
+                if x >= bounds[ctx][s]:
+                    digits.append(x % p)
+                    x //= p
+                q, r = divmod(x, tables[ctx][s])
+                x = (q << PROB_BITS) + r + cumulative[ctx][s]
+
+        table = _pack_table(model.tables[0]) if self.model is None else []
+        checksum = 0 if self.model is None else model.checksum
+        header = _header(model.order, self.model is None, checksum, len(data), len(digits))
+        digits.reverse()
+        return [header] + table + [x // p, x % p] + digits
+
+    def decode_elements(self, elements: list[int]) -> bytes:
+        """Inverse of encode_elements."""
+        version, order, has_table, checksum, length, num_digits = _parse_header(elements[0])
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported rANS stream version: {version}")
+        pos = 1
+        if has_table:
+            model = RansModel(0, [_unpack_table(elements[pos : pos + TABLE_ELEMENTS])])
+            pos += TABLE_ELEMENTS
+        else:
+            model = self.model
+            if model is None or model.order != order or model.checksum != checksum:
+                raise ValueError("rANS stream was coded with a different static model")
+
+        p = BLS_MODULUS
+        x = elements[pos] * p + elements[pos + 1]
+        digits = iter(elements[pos + 2 : pos + 2 + num_digits])
+        out = bytearray(length)
+        mask = PROB_SCALE - 1
+        if model.order == 0:
+            freqs, cum, slots = model.tables[0], model._cumulative[0], model._slots[0]
+            for i in range(length):
+                slot = x & mask
+                s = slots[slot]
+                x = freqs[s] * (x >> PROB_BITS) + slot - cum[s]
+                if x < STATE_LOW:
+                    x = x * p + next(digits)
+                out[i] = s
+        else:
+            tables, cumulative, all_slots = model.tables, model._cumulative, model._slots
+            ctx = 0
+            for i in range(length):
+                slot = x & mask
+                s = all_slots[ctx][slot]
+                x = tables[ctx][s] * (x >> PROB_BITS) + slot - cumulative[ctx][s]
+                if x < STATE_LOW:
+                    x = x * p + next(digits)
+                out[i] = ctx = s
+        if x != STATE_LOW:
+            raise ValueError("Corrupt rANS stream")
+        return bytes(out)
+
+    def max_packed_size(self, data_len: int) -> int:
+        """Worst-case bytes pack_into writes for data_len bytes.
+
+        Every symbol has a frequency of at least 1 / PROB_SCALE, so it
+        costs at most PROB_BITS bits; digits carry more than
+        TABLE_BITS_PER_ELEMENT bits each, plus one for the final state.
+        """
+        digits = -(-data_len * PROB_BITS // TABLE_BITS_PER_ELEMENT) + 2
+        elements = 1 + (TABLE_ELEMENTS if self.model is None else 0) + 2 + digits
+        return -(-elements // self.geometry.field_elements_per_blob) * self.geometry.blob_size
+
+    def unpacked_length(self, blobs: list[bytes]) -> int:
+        """Bytes unpack_into writes for blobs, read from the stream header."""
+        if not blobs:
+            return 0
+        return _parse_header(int.from_bytes(blobs[0][:BYTES_PER_FIELD_ELEMENT], "big"))[4]
+
+    def _to_blobs(self, elements: list[int], out: WritableBuffer | None = None) -> tuple[bytearray | memoryview, int]:
+        per_blob = self.geometry.field_elements_per_blob
+        num_blobs = -(-len(elements) // per_blob)
+        size = num_blobs * self.geometry.blob_size
+        coded = b"".join(e.to_bytes(BYTES_PER_FIELD_ELEMENT, "big") for e in elements)
+        buf = bytearray(size) if out is None else check_buffer(out, size)
+        buf[: len(coded)] = coded
+        buf[len(coded) : size] = bytes(size - len(coded))
+        return buf, num_blobs
+
+    def pack(self, data: bytes) -> list[bytes]:
+        """Code data into blobs."""
+        buf, num_blobs = self._to_blobs(self.encode_elements(data))
+        return [bytes(blob) for blob in split_blobs(buf, num_blobs, self.geometry.blob_size)]
+
+    def pack_into(self, data: bytes, out: WritableBuffer) -> int:
+        """Code data into out. Raises ValueError if the coded blobs do not fit."""
+        return self._to_blobs(self.encode_elements(data), out)[1]
+
+    def _elements(self, blobs: list[bytes]) -> list[int]:
+        elements = []
+        for blob in blobs:
+            blob = memoryview(blob)
+            for i in range(0, len(blob), BYTES_PER_FIELD_ELEMENT):
+                elements.append(int.from_bytes(blob[i : i + BYTES_PER_FIELD_ELEMENT], "big"))
+        if elements and elements[0] >= BLS_MODULUS:
+            raise ValueError("Not a canonical field element")
+        return elements
+
+    def unpack(self, blobs: list[bytes]) -> bytes:
+        """Decode blobs back to data."""
+        if not blobs:
+            return b""
+        return self.decode_elements(self._elements(blobs))
+
+    def unpack_into(self, blobs: list[bytes], out: WritableBuffer) -> int:
+        """Decode blobs into out. Raises ValueError if the data does not fit."""
+        data = self.unpack(blobs)
+        check_buffer(out, len(data))[: len(data)] = data
+        return len(data)
+
+    def unpack_cell(self, cell: bytes) -> bytes:
+        raise ValueError("rANS blobs are a single stream; cells do not decode on their own")
+
+    def coded_elements(self, blobs: list[bytes]) -> int:
+        """Field elements the stream occupies (the rest of the last blob is padding)."""
+        if not blobs:
+            return 0
+        _, _, has_table, _, _, num_digits = _parse_header(int.from_bytes(blobs[0][:BYTES_PER_FIELD_ELEMENT], "big"))
+        return 1 + (TABLE_ELEMENTS if has_table else 0) + 2 + num_digits
+
+
+def make_rans_packer(name: str, geometry: BlobGeometry = DEFAULT_GEOMETRY, model_path: Path = DEFAULT_MODEL_PATH) -> RansPacker:
+    """Factory for "rans_o0" (per-payload table) and "rans_o1" (static model at model_path)."""
+    if name == "rans_o0":
+        return RansPacker(geometry)
+    if name == "rans_o1":
+        if not Path(model_path).exists():
+            raise ValueError(f"No rANS model at {model_path}. Train one with: python bench.py fe")
+        return RansPacker(geometry, RansModel.load(model_path))
+    raise ValueError(f"Unknown rANS packer: {name}")
@@ -0,0 +1,121 @@
+"""Partial decode benchmark: read a slice of a payload from its cells."""
+
+import json
+import random
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .blob import BlobEncoder
+from .packing import split_cells
+from .payload import load_transactions
+from .transaction import rlp_list_item_spans
+from .tx_list_encoding import get_encoder
+
+# Slices read per payload: one transaction, or a contiguous share of the payload
+DEFAULT_FRACTIONS = (0.1, 0.5)
+
+
+@dataclass
+class PartialDecodeResult:
+    """Reading one slice of one payload: all blobs vs only the needed cells."""
+
+    packing: str
+    payload_file: str
+    slice: str              # "tx" or a share of the payload, e.g. "10%"
+    slice_bytes: int
+    cells_needed: int
+    cells_total: int
+    full_decode_ms: float   # Unpack every blob, then slice
+    partial_decode_ms: float
+
+
+def _time_ms(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def run_partial_decode_benchmark(
+    payload_files: list[Path],
+    packers: list[str],
+    fractions: tuple[float, ...] = DEFAULT_FRACTIONS,
+    iterations: int = 3,
+    seed: int = 0,
+) -> list[PartialDecodeResult]:
+    """Compare full and cell-level decode of slices of rlp-encoded payloads."""
+    rng = random.Random(seed)
+    results = []
+    for payload_file in payload_files:
+        data = get_encoder("rlp").encode(load_transactions(payload_file))
+        tx_spans = rlp_list_item_spans(data)
+
+        slices = []
+        if tx_spans:
+            offset, length = rng.choice(tx_spans)
+            slices.append(("tx", offset, offset + length))
+        for fraction in fractions:
+            length = int(len(data) * fraction)
+            offset = rng.randrange(len(data) - length + 1)
+            slices.append((f"{fraction:.0%}", offset, offset + length))
+
+        for pack_name in packers:
+            blob_encoder = BlobEncoder.from_names("none", pack_name)
+            blobs, _ = blob_encoder.encode(data)
+            cells = split_cells(blobs, blob_encoder.packer.geometry)
+
+            for label, start, end in slices:
+                needed = blob_encoder.cells_for_range(start, end)
+                if blob_encoder.decode_range(cells, start, end) != data[start:end]:
+                    raise RuntimeError(f"Partial decode mismatch: {pack_name} {payload_file.name} {label}")
+
+                results.append(PartialDecodeResult(
+                    packing=blob_encoder.packer.name,
+                    payload_file=payload_file.name,
+                    slice=label,
+                    slice_bytes=end - start,
+                    cells_needed=len(needed),
+                    cells_total=len(cells),
+                    full_decode_ms=_time_ms(lambda: blob_encoder.decode(blobs)[start:end], iterations),
+                    partial_decode_ms=_time_ms(lambda: blob_encoder.decode_range(cells, start, end), iterations),
+                ))
+    return results
+
+
+def summarize_partial_decode(results: list[PartialDecodeResult]) -> list[dict]:
+    """Cell share and decode time per packer and slice kind."""
+    groups: dict[tuple[str, str], list[PartialDecodeResult]] = {}
+    for r in results:
+        groups.setdefault((r.packing, r.slice), []).append(r)
+
+    summary = []
+    for (packing, label), rows in groups.items():
+        full_ms = sum(r.full_decode_ms for r in rows)
+        partial_ms = sum(r.partial_decode_ms for r in rows)
+        summary.append({
+            "packing": packing,
+            "slice": label,
+            "slice_bytes": sum(r.slice_bytes for r in rows) / len(rows),
+            "cell_share": sum(r.cells_needed for r in rows) / sum(r.cells_total for r in rows),
+            "full_decode_ms": full_ms / len(rows),
+            "partial_decode_ms": partial_ms / len(rows),
+            "speedup": full_ms / partial_ms if partial_ms else 0.0,
+        })
+    return summary
+
+
+def save_partial_decode_results(results: list[PartialDecodeResult], output_dir: Path) -> Path:
+    """Save per-slice results and summary to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"partial_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump({
+            "results": [asdict(r) for r in results],
+            "summary": summarize_partial_decode(results),
+        }, f, indent=2)
+
+    return output_file
@@ -1,10 +1,21 @@
-"""Load ExecutionPayload JSON and extract transactions."""
+"""Load stored payloads and extract transactions.
+
+Payloads are either ExecutionPayload JSON (block_N.json, hex-encoded
+transactions) or the payload's SSZ transaction list as fetched from the
+beacon node (block_N.ssz), which loads without any parsing beyond its
+offset table.
+"""
 
 import json
+import re
 from pathlib import Path
 
+from .beacon import decode_transactions
 from .tx_list_encoding import get_encoder
 
+# In order of preference when a block is stored in both formats
+PAYLOAD_SUFFIXES = (".ssz", ".json")
+
 
 def load_payload(path: Path) -> dict:
     """Load an ExecutionPayload from a JSON file."""
@@ -29,15 +40,43 @@ def extract_transactions(payload: dict) -> list[bytes]:
 
 def load_transactions(path: Path) -> list[bytes]:
     """Load payload and return list of raw transaction bytes."""
+    if Path(path).suffix == ".ssz":
+        return decode_transactions(Path(path).read_bytes())
     payload = load_payload(path)
     return extract_transactions(payload)
 
 
+def find_payloads(payloads_dir: Path) -> list[Path]:
+    """Payload files (JSON and SSZ) in a directory, sorted by name.
+
+    A block stored in both formats (e.g. re-fetched with -f ssz) is
+    listed once, as its .ssz file.
+    """
+    by_stem: dict[str, Path] = {}
+    for suffix in PAYLOAD_SUFFIXES:
+        for p in Path(payloads_dir).glob(f"*{suffix}"):
+            by_stem.setdefault(p.stem, p)
+    return sorted(by_stem.values())
+
+
+def block_number(path: Path) -> int:
+    """Block number of a payload file, taken from its block_{number} name."""
+    match = re.search(r"(\d+)", path.stem)
+    if match is None:
+        raise ValueError(f"No block number in payload file name: {path.name}")
+    return int(match.group(1))
+
+
+def sort_by_block_number(paths: list[Path]) -> list[Path]:
+    """Order payload files by block number."""
+    return sorted(paths, key=block_number)
+
+
 def load_and_encode(path: Path, encoder_name: str = "rlp") -> bytes:
     """Load payload and encode transactions.
 
     Args:
-        path: Path to payload JSON file
+        path: Path to payload JSON or SSZ file
         encoder_name: Encoder to use ("rlp" or "ssz")
 
     Returns:
@@ -0,0 +1,126 @@
+"""Field-element-native rANS against byte compressors plus packing."""
+
+import json
+import math
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .benchmark import benchmark_single
+from .blob import LENGTH_PREFIX_SIZE, BlobEncoder
+from .compression import get_compressor
+from .packing import BlobGeometry, DEFAULT_GEOMETRY, RansModel, RansPacker
+from .payload import load_transactions
+from .tx_list_encoding import get_encoder
+
+# Baseline first, then the rANS variants
+DEFAULT_STRATEGIES = (("zstd_22", "bitpack"), ("none", "rans_o0"), ("none", "rans_o1"))
+
+
+@dataclass
+class FeCodingResult:
+    """One payload through one compression + packing strategy."""
+
+    strategy: str
+    payload_file: str
+    tx_raw_size: int
+    encoded_size: int
+    blob_count: int
+    field_elements: int     # Elements holding data; the rest of the last blob is padding
+    encode_time_ms: float
+    decode_time_ms: float
+
+
+def field_elements_used(blob_encoder: BlobEncoder, blobs: list[bytes], compressed_size: int,
+                        geometry: BlobGeometry = DEFAULT_GEOMETRY) -> int:
+    """Field elements a payload occupies before blob padding."""
+    packer = blob_encoder.packer
+    if isinstance(packer, RansPacker):
+        return packer.coded_elements(blobs)
+    bits_per_element = packer.usable_bytes_per_blob * 8 / geometry.field_elements_per_blob
+    return math.ceil((LENGTH_PREFIX_SIZE + compressed_size) * 8 / bits_per_element)
+
+
+def train_model(payload_files: list[Path], encoding: str = "rlp", order: int = 1) -> RansModel:
+    """Fit a static model to the encoded tx lists of payload_files."""
+    encoder = get_encoder(encoding)
+    return RansModel.fit([encoder.encode(load_transactions(f)) for f in payload_files], order)
+
+
+def run_fe_benchmark(
+    payload_files: list[Path],
+    encoding: str = "rlp",
+    strategies: tuple[tuple[str, str], ...] = DEFAULT_STRATEGIES,
+    iterations: int = 1,
+    model: RansModel | None = None,
+) -> list[FeCodingResult]:
+    """Measure blobs, field elements and speed of each strategy on every payload.
+
+    A static rANS strategy uses model if its order matches, otherwise the
+    model at the default model path.
+    """
+    tx_encoder = get_encoder(encoding)
+    blob_encoders = [
+        BlobEncoder(get_compressor(comp), RansPacker(model=model))
+        if model is not None and pack == f"rans_o{model.order}" and model.order > 0
+        else BlobEncoder.from_names(comp, pack)
+        for comp, pack in strategies
+    ]
+    results = []
+    for payload_file in payload_files:
+        transactions = load_transactions(payload_file)
+        data = tx_encoder.encode(transactions)
+        tx_raw_size = sum(len(tx) for tx in transactions)
+        for blob_encoder in blob_encoders:
+            r = benchmark_single(data, blob_encoder, encoding, payload_file.name, tx_raw_size, iterations)
+            blobs, compressed_size = blob_encoder.encode(data)
+            if blob_encoder.decode(blobs) != data:
+                raise RuntimeError(f"{blob_encoder.name} does not round-trip {payload_file.name}")
+            results.append(FeCodingResult(
+                strategy=blob_encoder.name,
+                payload_file=payload_file.name,
+                tx_raw_size=tx_raw_size,
+                encoded_size=len(data),
+                blob_count=r.blob_count,
+                field_elements=field_elements_used(blob_encoder, blobs, compressed_size),
+                encode_time_ms=r.encode_time_ms,
+                decode_time_ms=r.decode_time_ms,
+            ))
+    return results
+
+
+def summarize_fe(results: list[FeCodingResult]) -> list[dict]:
+    """Totals and throughput per strategy."""
+    groups: dict[str, list[FeCodingResult]] = {}
+    for r in results:
+        groups.setdefault(r.strategy, []).append(r)
+
+    summary = []
+    for strategy, rows in groups.items():
+        raw_mb = sum(r.tx_raw_size for r in rows) / 1_000_000
+        encode_s = sum(r.encode_time_ms for r in rows) / 1000
+        decode_s = sum(r.decode_time_ms for r in rows) / 1000
+        summary.append({
+            "strategy": strategy,
+            "payloads": len(rows),
+            "blobs": sum(r.blob_count for r in rows),
+            "field_elements": sum(r.field_elements for r in rows),
+            "encode_mb_s": raw_mb / encode_s if encode_s else 0.0,
+            "decode_mb_s": raw_mb / decode_s if decode_s else 0.0,
+        })
+    return summary
+
+
+def save_fe_results(results: list[FeCodingResult], output_dir: Path) -> Path:
+    """Save per-payload results and summary to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"fe_coding_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump({
+            "results": [asdict(r) for r in results],
+            "summary": summarize_fe(results),
+        }, f, indent=2)
+
+    return output_file
@@ -0,0 +1,217 @@
+"""Slot-replay benchmark: steady-state decode as a node would ingest it.
+
+Payloads are encoded up front, grouped into slots in block order, then
+decoded slot by slot at a fixed cadence through BlobEncoder.decode and
+the tx list decoder, with validation of every decoded transaction.
+"""
+
+import gc
+import hashlib
+import json
+import time
+from dataclasses import dataclass, asdict, field
+from datetime import datetime
+from pathlib import Path
+
+from .blob import BlobEncoder
+from .payload import load_transactions, sort_by_block_number
+from .summary import quantile
+from .transaction import decode_transaction
+from .tx_list_encoding import get_encoder
+
+
+@dataclass
+class _EncodedBlock:
+    payload_file: str
+    blobs: list[bytes]
+    tx_raw_size: int
+    tx_count: int
+    digest: bytes
+
+
+@dataclass
+class SlotResult:
+    """Decode of one slot's blobs."""
+
+    slot: int
+    payload_files: list[str]
+    blob_count: int
+    tx_raw_size: int
+    latency_ms: float       # From the slot's scheduled start to fully decoded
+    decode_ms: float        # Time spent decoding this slot
+    gc_pause_ms: float      # Garbage collection pauses while decoding
+    missed_deadline: bool
+
+
+@dataclass
+class ReplayResult:
+    """Steady-state decode of one strategy over the replayed corpus."""
+
+    encoding: str
+    compression: str
+    packing: str
+    slots: int
+    blobs_per_slot: int     # Target; slots hold whole blocks, so actual may exceed it
+    slot_time_ms: float     # Cadence (0 = back to back)
+    deadline_ms: float
+    tx_raw_size: int
+    sustained_mb_s: float   # Tx bytes decoded per second of decode time
+    p50_ms: float
+    p99_ms: float
+    p999_ms: float
+    max_ms: float
+    deadline_misses: int
+    gc_collections: int
+    gc_pause_total_ms: float
+    gc_pause_max_ms: float
+    slot_results: list[SlotResult] = field(default_factory=list, repr=False)
+
+
+class _GcTimer:
+    """Record GC pause durations via gc.callbacks."""
+
+    def __init__(self):
+        self.pauses: list[float] = []
+        self._start = 0.0
+
+    def __call__(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._start = time.perf_counter()
+        else:
+            self.pauses.append((time.perf_counter() - self._start) * 1000)
+
+    def __enter__(self) -> "_GcTimer":
+        gc.callbacks.append(self)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        gc.callbacks.remove(self)
+
+
+def group_slots(blocks: list, blob_counts: list[int], blobs_per_slot: int) -> list[list]:
+    """Group consecutive blocks into slots of at least blobs_per_slot blobs.
+
+    A target of 0 puts every block in its own slot.
+    """
+    slots = []
+    current = []
+    current_blobs = 0
+    for block, count in zip(blocks, blob_counts):
+        current.append(block)
+        current_blobs += count
+        if current_blobs >= blobs_per_slot:
+            slots.append(current)
+            current = []
+            current_blobs = 0
+    if current:
+        slots.append(current)
+    return slots
+
+
+def _encode_corpus(payload_files: list[Path], encoding: str, blob_encoder: BlobEncoder) -> list[_EncodedBlock]:
+    tx_encoder = get_encoder(encoding)
+    blocks = []
+    for payload_file in payload_files:
+        transactions = load_transactions(payload_file)
+        blobs, _ = blob_encoder.encode(tx_encoder.encode(transactions))
+        blocks.append(_EncodedBlock(
+            payload_file=payload_file.name,
+            blobs=blobs,
+            tx_raw_size=sum(len(tx) for tx in transactions),
+            tx_count=len(transactions),
+            digest=hashlib.sha256(b"".join(transactions)).digest(),
+        ))
+    return blocks
+
+
+def _decode_block(block: _EncodedBlock, blob_encoder: BlobEncoder, tx_encoder, validate: bool) -> None:
+    transactions = tx_encoder.decode(blob_encoder.decode(block.blobs))
+    if not validate:
+        return
+    if len(transactions) != block.tx_count or hashlib.sha256(b"".join(transactions)).digest() != block.digest:
+        raise RuntimeError(f"Decoded transactions do not match {block.payload_file}")
+    for tx in transactions:
+        decode_transaction(tx)
+
+
+def replay_strategy(
+    payload_files: list[Path],
+    encoding: str,
+    compression: str,
+    packing: str,
+    blobs_per_slot: int = 6,
+    slot_time_ms: float = 0.0,
+    deadline_ms: float = 4000.0,
+    loops: int = 1,
+    validate: bool = True,
+) -> ReplayResult:
+    """Replay the corpus slot by slot and measure decode latency."""
+    blob_encoder = BlobEncoder.from_names(compression, packing)
+    tx_encoder = get_encoder(encoding)
+    blocks = _encode_corpus(sort_by_block_number(payload_files), encoding, blob_encoder)
+    slots = group_slots(blocks, [len(b.blobs) for b in blocks], blobs_per_slot) * loops
+
+    slot_results = []
+    with _GcTimer() as gc_timer:
+        t0 = time.perf_counter()
+        for i, slot in enumerate(slots):
+            scheduled = t0 + i * slot_time_ms / 1000
+            now = time.perf_counter()
+            if now < scheduled:
+                time.sleep(scheduled - now)
+
+            pauses_before = len(gc_timer.pauses)
+            start = time.perf_counter()
+            for block in slot:
+                _decode_block(block, blob_encoder, tx_encoder, validate)
+            end = time.perf_counter()
+
+            # Back to back, latency is decode time; on a cadence it includes queueing
+            latency_ms = (end - (scheduled if slot_time_ms else start)) * 1000
+            slot_results.append(SlotResult(
+                slot=i,
+                payload_files=[b.payload_file for b in slot],
+                blob_count=sum(len(b.blobs) for b in slot),
+                tx_raw_size=sum(b.tx_raw_size for b in slot),
+                latency_ms=latency_ms,
+                decode_ms=(end - start) * 1000,
+                gc_pause_ms=sum(gc_timer.pauses[pauses_before:]),
+                missed_deadline=latency_ms > deadline_ms,
+            ))
+
+    latencies = sorted(s.latency_ms for s in slot_results)
+    tx_raw_size = sum(s.tx_raw_size for s in slot_results)
+    decode_s = sum(s.decode_ms for s in slot_results) / 1000
+
+    return ReplayResult(
+        encoding=encoding,
+        compression=blob_encoder.compressor.name,
+        packing=blob_encoder.packer.name,
+        slots=len(slot_results),
+        blobs_per_slot=blobs_per_slot,
+        slot_time_ms=slot_time_ms,
+        deadline_ms=deadline_ms,
+        tx_raw_size=tx_raw_size,
+        sustained_mb_s=(tx_raw_size / 1_000_000) / decode_s if decode_s else 0.0,
+        p50_ms=quantile(latencies, 0.5),
+        p99_ms=quantile(latencies, 0.99),
+        p999_ms=quantile(latencies, 0.999),
+        max_ms=latencies[-1] if latencies else 0.0,
+        deadline_misses=sum(s.missed_deadline for s in slot_results),
+        gc_collections=len(gc_timer.pauses),
+        gc_pause_total_ms=sum(gc_timer.pauses),
+        gc_pause_max_ms=max(gc_timer.pauses, default=0.0),
+        slot_results=slot_results,
+    )
+
+
+def save_replay_results(results: list[ReplayResult], output_dir: Path) -> Path:
+    """Save replay summaries with per-slot latencies to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"replay_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump([asdict(r) for r in results], f, indent=2)
+
+    return output_file
@@ -0,0 +1,187 @@
+"""Persistent cache of benchmark cells.
+
+A cell is one (payload, encoding, compression, packing) measurement. Its
+key hashes:
+
+- the payload file's content,
+- the strategy names,
+- a source fingerprint of the code that produced it.
+
+The fingerprint covers the modules defining the encoder, compressor,
+packer and BlobEncoder classes, plus every src module those import,
+transitively. It also covers the versions of third-party backends they
+use, and the scalar attributes of each instance (e.g. a zstd level).
+Attributes that are themselves src objects, such as the compressor
+inside a per-tx encoder, are followed the same way: their modules join
+the closure and their scalar attributes are hashed. Objects holding
+trained data (a symbol registry, an rANS model) carry a content
+checksum among those scalars.
+
+Package __init__ modules are registries and are not followed, so
+registering a new strategy leaves existing cells valid, while editing
+the implementation of one invalidates exactly its cells.
+
+Entries are appended to a JSONL file; on load, later lines win. When
+re-timed cells have superseded earlier lines, close() rewrites the file
+with one line per key.
+"""
+
+import hashlib
+import inspect
+import json
+import os
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from types import ModuleType
+
+# Bump when the meaning of cached metrics changes
+CACHE_VERSION = 1
+
+DEFAULT_CACHE_PATH = Path("results/cell_cache.jsonl")
+
+# Metrics that depend only on the inputs and code, never on the machine
+SIZE_FIELDS = ("tx_raw_size", "encoded_size", "compressed_size", "blob_count", "space_efficiency")
+TIMING_FIELDS = ("encode_time_ms", "decode_time_ms")
+
+_PACKAGE = __name__.rsplit(".", 1)[0]
+
+
+def payload_hash(path: Path) -> str:
+    """sha256 of a payload file's content."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _is_package(name: str) -> bool:
+    return hasattr(sys.modules.get(name), "__path__")
+
+
+def _dependencies(module: ModuleType) -> tuple[set[str], set[str]]:
+    """(src modules, third-party top-level packages) referenced by a module's globals."""
+    local, external = set(), set()
+    for value in vars(module).values():
+        name = value.__name__ if isinstance(value, ModuleType) else getattr(value, "__module__", None)
+        if not isinstance(name, str) or name == module.__name__:
+            continue
+        if name == _PACKAGE or name.startswith(_PACKAGE + "."):
+            local.add(name)
+        elif name.split(".")[0] not in sys.stdlib_module_names | {"builtins"}:
+            external.add(name.split(".")[0])
+    return local, external
+
+
+def _is_local_instance(value) -> bool:
+    if inspect.isclass(value) or isinstance(value, ModuleType):
+        return False
+    return type(value).__module__.startswith(_PACKAGE + ".")
+
+
+def _state(obj, modules: list[str], visiting: set[int]) -> dict:
+    """Scalar attributes of obj, recursing into src objects it holds (whose modules join modules)."""
+    modules.append(type(obj).__module__)
+    visiting.add(id(obj))
+    state = {}
+    for key, value in getattr(obj, "__dict__", {}).items():
+        if isinstance(value, (bool, int, float, str)):
+            state[key] = value
+        elif _is_local_instance(value) and id(value) not in visiting:
+            state[key] = _state(value, modules, visiting)
+    return state
+
+
+def source_fingerprint(*objects) -> str:
+    """Fingerprint of the code and configuration behind objects (instances or classes)."""
+    pending = [o.__module__ for o in objects if inspect.isclass(o)]
+    states = [_state(o, pending, set()) for o in objects if not inspect.isclass(o)]
+    seen: set[str] = set()
+    external: set[str] = set()
+    while pending:
+        name = pending.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        local, ext = _dependencies(sys.modules[name])
+        external |= ext
+        pending.extend(m for m in local if not _is_package(m))
+
+    h = hashlib.sha256(f"v{CACHE_VERSION}".encode())
+    for name in sorted(seen):
+        h.update(name.encode())
+        h.update(hashlib.sha256(Path(inspect.getfile(sys.modules[name])).read_bytes()).digest())
+    for name in sorted(external):
+        version = getattr(sys.modules.get(name), "__version__", "")
+        h.update(f"{name}={version}".encode())
+    for state in states:
+        h.update(json.dumps(state, sort_keys=True).encode())
+    return h.hexdigest()
+
+
+def cell_key(payload_sha256: str, encoding: str, compression: str, packing: str, fingerprint: str) -> str:
+    return hashlib.sha256(f"{payload_sha256}|{encoding}|{compression}|{packing}|{fingerprint}".encode()).hexdigest()
+
+
+class ResultCache:
+    """Cell results keyed by cell_key, persisted to a JSONL file."""
+
+    def __init__(self, path: Path = DEFAULT_CACHE_PATH):
+        self.path = Path(path)
+        self._entries: dict[str, dict] = {}
+        self._lines = 0     # Lines in the file, including superseded ones
+        if self.path.exists():
+            with open(self.path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._entries[entry["key"]] = entry
+                        self._lines += 1
+        self.hits = 0
+        self.misses = 0
+        self._file = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> dict | None:
+        """Cached metrics for a cell, counting hits and misses."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, key: str, result, iterations: int) -> None:
+        """Store a BenchmarkResult (sizes and timings) for a cell."""
+        entry = {"key": key, "iterations": iterations, **asdict(result)}
+        self._entries[key] = entry
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a")
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+        self._lines += 1
+
+    def compact(self) -> None:
+        """Rewrite the file with only the latest entry per key."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            for entry in self._entries.values():
+                f.write(json.dumps(entry) + "\n")
+        os.replace(tmp_path, self.path)
+        self._lines = len(self._entries)
+
+    def close(self) -> None:
+        if self._lines > len(self._entries):
+            self.compact()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "ResultCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,153 @@
+"""Size-scaling benchmark: throughput of each strategy across a size ladder."""
+
+import json
+import math
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .benchmark import benchmark_single
+from .blob import BlobEncoder
+from .synthetic import TxModel, generate_transactions
+from .tx_list_encoding import get_encoder
+
+MB = 1_000_000
+
+# Default ladder covers today's blocks up to very high gas limits
+DEFAULT_SIZES_MB = [0.25, 0.5, 1, 2, 5, 10, 20, 30]
+
+
+@dataclass
+class ScalingResult:
+    """One strategy measured at one payload size."""
+
+    encoding: str
+    compression: str
+    packing: str
+    target_mb: float
+    tx_raw_size: int
+    encoded_size: int
+    compressed_size: int
+    blob_count: int
+    encode_time_ms: float   # Time to compress + pack
+    decode_time_ms: float   # Time to unpack + decompress
+    encode_mb_s: float      # tx_raw_size / encode time
+    decode_mb_s: float      # tx_raw_size / decode time
+
+
+def _mb_s(size: int, time_ms: float) -> float:
+    return (size / MB) / (time_ms / 1000) if time_ms > 0 else 0.0
+
+
+def run_scaling(
+    sizes_mb: list[float],
+    strategies: list[tuple[str, str, str]],
+    mode: str = "sample",
+    corpus: list[bytes] | None = None,
+    model: TxModel | None = None,
+    iterations: int = 1,
+    seed: int = 0,
+) -> list[ScalingResult]:
+    """Run every strategy on a synthetic payload of each size."""
+    results = []
+
+    for size_mb in sizes_mb:
+        transactions = generate_transactions(int(size_mb * MB), mode, corpus, model, seed)
+        tx_raw_size = sum(len(tx) for tx in transactions)
+        print(f"Size {size_mb} MB: {len(transactions)} txs, {tx_raw_size / MB:.2f} MB raw")
+
+        encoded: dict[str, bytes] = {}
+        for enc_name, comp_name, pack_name in strategies:
+            if enc_name not in encoded:
+                encoded[enc_name] = get_encoder(enc_name).encode(transactions)
+
+            blob_encoder = BlobEncoder.from_names(comp_name, pack_name)
+            r = benchmark_single(
+                encoded[enc_name], blob_encoder, enc_name, f"synthetic_{size_mb}MB",
+                tx_raw_size, iterations,
+            )
+            result = ScalingResult(
+                encoding=r.encoding,
+                compression=r.compression,
+                packing=r.packing,
+                target_mb=size_mb,
+                tx_raw_size=r.tx_raw_size,
+                encoded_size=r.encoded_size,
+                compressed_size=r.compressed_size,
+                blob_count=r.blob_count,
+                encode_time_ms=r.encode_time_ms,
+                decode_time_ms=r.decode_time_ms,
+                encode_mb_s=_mb_s(tx_raw_size, r.encode_time_ms),
+                decode_mb_s=_mb_s(tx_raw_size, r.decode_time_ms),
+            )
+            results.append(result)
+            print(f"  {enc_name}+{blob_encoder.name}: {result.blob_count} blobs, "
+                  f"enc {result.encode_mb_s:.1f} MB/s, dec {result.decode_mb_s:.1f} MB/s")
+
+    return results
+
+
+def scaling_exponents(results: list[ScalingResult]) -> dict[str, list[dict]]:
+    """Local complexity exponent between consecutive sizes, per strategy.
+
+    An exponent k means time grows like size^k over that step: 1.0 is
+    linear, above 1.0 is super-linear. Points of equal size are averaged
+    into one. A phase whose time rounds to 0 ms at either end of a step
+    has no exponent (None) for that step.
+    """
+    by_strategy: dict[str, dict[int, list[ScalingResult]]] = {}
+    for r in results:
+        key = f"{r.encoding}+{r.compression}+{r.packing}"
+        by_strategy.setdefault(key, {}).setdefault(r.tx_raw_size, []).append(r)
+
+    exponents = {}
+    for key, by_size in by_strategy.items():
+        points = []
+        for size in sorted(by_size):
+            same = by_size[size]
+            points.append({
+                "size": size,
+                "mb": same[0].target_mb,
+                "encode": sum(r.encode_time_ms for r in same) / len(same),
+                "decode": sum(r.decode_time_ms for r in same) / len(same),
+            })
+        steps = []
+        for a, b in zip(points, points[1:]):
+            size_ratio = math.log(b["size"] / a["size"])
+            step = {"from_mb": a["mb"], "to_mb": b["mb"]}
+            for phase in ("encode", "decode"):
+                timed = a[phase] > 0 and b[phase] > 0
+                step[phase] = math.log(b[phase] / a[phase]) / size_ratio if timed else None
+            steps.append(step)
+        exponents[key] = steps
+    return exponents
+
+
+def linearity_breaks(
+    exponents: dict[str, list[dict]], tolerance: float = 0.25
+) -> dict[str, dict[str, float | None]]:
+    """First size (MB) at which each strategy stops scaling linearly."""
+    breaks = {}
+    for key, steps in exponents.items():
+        breaks[key] = {
+            phase: next((s["to_mb"] for s in steps if s[phase] is not None and s[phase] > 1 + tolerance), None)
+            for phase in ("encode", "decode")
+        }
+    return breaks
+
+
+def save_scaling(results: list[ScalingResult], output_dir: Path) -> Path:
+    """Save scaling results and exponents to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"scaling_{timestamp}.json"
+
+    exponents = scaling_exponents(results)
+    with open(output_file, "w") as f:
+        json.dump({
+            "results": [asdict(r) for r in results],
+            "exponents": exponents,
+            "linearity_breaks": linearity_breaks(exponents),
+        }, f, indent=2)
+
+    return output_file
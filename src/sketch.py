@@ -0,0 +1,99 @@
+"""Mergeable quantile sketch for streaming aggregation."""
+
+import math
+
+# Values kept exactly before switching to log buckets
+DEFAULT_EXACT_LIMIT = 1024
+
+# Relative error of bucketed quantiles
+DEFAULT_RELATIVE_ACCURACY = 0.01
+
+
+def quantile(sorted_values: list[float], q: float) -> float:
+    """Linearly interpolated quantile of pre-sorted values."""
+    if not sorted_values:
+        return 0.0
+    pos = q * (len(sorted_values) - 1)
+    lo = int(pos)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+class QuantileSketch:
+    """Quantiles of a stream in bounded memory, mergeable across workers.
+
+    Small streams keep their values and report exact interpolated
+    quantiles. Past `exact_limit` values the sketch collapses into
+    logarithmic buckets (DDSketch): bucket i holds
+    values in (gamma^(i-1), gamma^i], so any reported quantile is within
+    `relative_accuracy` of a true value. Values <= 0 share a zero bucket.
+    """
+
+    def __init__(self, relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY, exact_limit: int = DEFAULT_EXACT_LIMIT):
+        self.relative_accuracy = relative_accuracy
+        self.exact_limit = exact_limit
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._values: list[float] | None = []
+        self._buckets: dict[int, int] = {}
+        self._zero_count = 0
+        self.count = 0
+
+    def _bucket_add(self, value: float, n: int = 1) -> None:
+        if value <= 0:
+            self._zero_count += n
+            return
+        i = math.ceil(math.log(value) / self._log_gamma)
+        self._buckets[i] = self._buckets.get(i, 0) + n
+
+    def _collapse(self) -> None:
+        values, self._values = self._values, None
+        for v in values:
+            self._bucket_add(v)
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        if self._values is not None:
+            self._values.append(value)
+            if len(self._values) > self.exact_limit:
+                self._collapse()
+        else:
+            self._bucket_add(value)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Fold another sketch (same relative accuracy) into this one."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        self.count += other.count
+        if self._values is not None and other._values is not None:
+            self._values.extend(other._values)
+            if len(self._values) > self.exact_limit:
+                self._collapse()
+            return
+
+        if self._values is not None:
+            self._collapse()
+        if other._values is not None:
+            for v in other._values:
+                self._bucket_add(v)
+        else:
+            self._zero_count += other._zero_count
+            for i, n in other._buckets.items():
+                self._buckets[i] = self._buckets.get(i, 0) + n
+
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        if self._values is not None:
+            return quantile(sorted(self._values), q)
+
+        rank = q * (self.count - 1)
+        seen = self._zero_count
+        if rank < seen:
+            return 0.0
+        for i in sorted(self._buckets):
+            seen += self._buckets[i]
+            if rank < seen:
+                # Midpoint (in relative terms) of (gamma^(i-1), gamma^i]
+                return 2 * self._gamma ** i / (self._gamma + 1)
+        return 2 * self._gamma ** max(self._buckets) / (self._gamma + 1)
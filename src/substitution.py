@@ -0,0 +1,130 @@
+"""Registry substitution benchmark against the plain rlp/ssz paths."""
+
+import json
+import time
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from pathlib import Path
+
+from .benchmark import benchmark_single
+from .blob import BlobEncoder
+from .payload import load_transactions, sort_by_block_number
+from .symbol_registry import SymbolRegistry
+from .tx_list_encoding import RegistryEncoder, get_encoder
+
+
+@dataclass
+class SubstitutionResult:
+    """One payload through one tx list encoder and blob strategy."""
+
+    encoding: str
+    compression: str
+    packing: str
+    payload_file: str
+    tx_raw_size: int
+    encoded_size: int
+    compressed_size: int
+    blob_count: int
+    tx_encode_time_ms: float  # Tx list encoding, including substitution
+    tx_decode_time_ms: float  # Tx list decoding, including restoration
+    encode_time_ms: float     # Compress + pack
+    decode_time_ms: float     # Unpack + decompress
+
+
+def split_corpus(payload_files: list[Path], train_fraction: float) -> tuple[list[Path], list[Path]]:
+    """Split payloads in block order: older blocks train, newer blocks test."""
+    ordered = sort_by_block_number(payload_files)
+    cut = int(len(ordered) * train_fraction)
+    return ordered[:cut], ordered[cut:]
+
+
+def run_substitution_benchmark(
+    payload_files: list[Path],
+    registry: SymbolRegistry,
+    inner_encoders: list[str],
+    compressors: list[str],
+    packing: str = "bitpack",
+    iterations: int = 3,
+) -> list[SubstitutionResult]:
+    """Run each plain encoder and its registry variant on every payload."""
+    encoders = []
+    for name in inner_encoders:
+        encoders.append(get_encoder(name))
+        encoders.append(RegistryEncoder(get_encoder(name), registry))
+
+    results = []
+    for payload_file in payload_files:
+        transactions = load_transactions(payload_file)
+        tx_raw_size = sum(len(tx) for tx in transactions)
+
+        for tx_encoder in encoders:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                data = tx_encoder.encode(transactions)
+            tx_encode_ms = (time.perf_counter() - start) * 1000 / iterations
+
+            start = time.perf_counter()
+            for _ in range(iterations):
+                decoded = tx_encoder.decode(data)
+            tx_decode_ms = (time.perf_counter() - start) * 1000 / iterations
+            if decoded != transactions:
+                raise RuntimeError(f"{tx_encoder.name} roundtrip failed on {payload_file.name}")
+
+            for comp_name in compressors:
+                r = benchmark_single(
+                    data, BlobEncoder.from_names(comp_name, packing), tx_encoder.name,
+                    payload_file.name, tx_raw_size, iterations,
+                )
+                results.append(SubstitutionResult(
+                    encoding=r.encoding,
+                    compression=r.compression,
+                    packing=r.packing,
+                    payload_file=r.payload_file,
+                    tx_raw_size=tx_raw_size,
+                    encoded_size=r.encoded_size,
+                    compressed_size=r.compressed_size,
+                    blob_count=r.blob_count,
+                    tx_encode_time_ms=tx_encode_ms,
+                    tx_decode_time_ms=tx_decode_ms,
+                    encode_time_ms=r.encode_time_ms,
+                    decode_time_ms=r.decode_time_ms,
+                ))
+
+    return results
+
+
+def summarize_substitution(results: list[SubstitutionResult]) -> list[dict]:
+    """Totals and end-to-end throughput per strategy."""
+    by_strategy: dict[str, list[SubstitutionResult]] = {}
+    for r in results:
+        by_strategy.setdefault(f"{r.encoding}+{r.compression}+{r.packing}", []).append(r)
+
+    summary = []
+    for key, rows in by_strategy.items():
+        raw_mb = sum(r.tx_raw_size for r in rows) / 1_000_000
+        encode_s = sum(r.tx_encode_time_ms + r.encode_time_ms for r in rows) / 1000
+        decode_s = sum(r.tx_decode_time_ms + r.decode_time_ms for r in rows) / 1000
+        summary.append({
+            "key": key,
+            "blobs": sum(r.blob_count for r in rows),
+            "encoded_size": sum(r.encoded_size for r in rows),
+            "compressed_size": sum(r.compressed_size for r in rows),
+            "encode_mb_s": raw_mb / encode_s if encode_s else 0.0,
+            "decode_mb_s": raw_mb / decode_s if decode_s else 0.0,
+        })
+    return summary
+
+
+def save_substitution_results(results: list[SubstitutionResult], output_dir: Path) -> Path:
+    """Save per-payload results and per-strategy summary to JSON."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    output_file = output_dir / f"substitution_{timestamp}.json"
+
+    with open(output_file, "w") as f:
+        json.dump({
+            "results": [asdict(r) for r in results],
+            "summary": summarize_substitution(results),
+        }, f, indent=2)
+
+    return output_file
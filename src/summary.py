@@ -0,0 +1,205 @@
+"""Pre-aggregated results for the dashboard.
+
+The dashboard loads a small summary.json (per-strategy totals, quantiles
+and Pareto points) and fetches per-payload rows lazily from one shard
+file per strategy.
+
+Summaries are built from running per-strategy aggregates, so a run can
+stream rows to disk (ResultsWriter) without holding them in memory.
+"""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import TextIO
+
+from .sketch import QuantileSketch, quantile
+
+SUMMARY_VERSION = 1
+
+BASELINE_KEY = "rlp+none+naive_31"
+
+# Per-payload metrics that get quantiles in the summary
+QUANTILE_METRICS = ("blob_count", "encode_time_ms", "decode_time_ms")
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def strategy_key(result) -> str:
+    """Strategy name as encoding+compression+packing."""
+    return f"{result.encoding}+{result.compression}+{result.packing}"
+
+
+def shard_path(key: str) -> str:
+    """Relative path of a strategy's detail shard."""
+    return f"shards/{key.replace('+', '-')}.jsonl"
+
+
+def pareto_front(points: dict[str, tuple[float, float]]) -> list[str]:
+    """Keys not dominated on (x, y), both minimised. Sorted by x."""
+    front = []
+    best_y = float("inf")
+    for key, (x, y) in sorted(points.items(), key=lambda kv: (kv[1][0], kv[1][1])):
+        if y < best_y:
+            front.append(key)
+            best_y = y
+    return front
+
+
+class StrategyAggregate:
+    """Running totals and latency sketches for one strategy."""
+
+    def __init__(self, encoding: str, compression: str, packing: str):
+        self.encoding = encoding
+        self.compression = compression
+        self.packing = packing
+        self.count = 0
+        self.blobs = 0
+        self.tx_raw_size = 0
+        self.encoded_size = 0
+        self.compressed_size = 0
+        self.encode_time_ms = 0.0
+        self.decode_time_ms = 0.0
+        self.sketches = {metric: QuantileSketch() for metric in QUANTILE_METRICS}
+
+    def add(self, result) -> None:
+        self.count += 1
+        self.blobs += result.blob_count
+        self.tx_raw_size += result.tx_raw_size
+        self.encoded_size += result.encoded_size
+        self.compressed_size += result.compressed_size
+        self.encode_time_ms += result.encode_time_ms
+        self.decode_time_ms += result.decode_time_ms
+        for metric, sketch in self.sketches.items():
+            sketch.add(getattr(result, metric))
+
+    def merge(self, other: "StrategyAggregate") -> None:
+        self.count += other.count
+        self.blobs += other.blobs
+        self.tx_raw_size += other.tx_raw_size
+        self.encoded_size += other.encoded_size
+        self.compressed_size += other.compressed_size
+        self.encode_time_ms += other.encode_time_ms
+        self.decode_time_ms += other.decode_time_ms
+        for metric, sketch in self.sketches.items():
+            sketch.merge(other.sketches[metric])
+
+    def entry(self) -> dict:
+        key = f"{self.encoding}+{self.compression}+{self.packing}"
+        return {
+            "key": key,
+            "encoding": self.encoding,
+            "compression": self.compression,
+            "packing": self.packing,
+            "count": self.count,
+            "blobs": self.blobs,
+            "tx_raw_size": self.tx_raw_size,
+            "encoded_size": self.encoded_size,
+            "compressed_size": self.compressed_size,
+            "encode_time_ms": self.encode_time_ms / self.count,
+            "decode_time_ms": self.decode_time_ms / self.count,
+            "quantiles": {
+                metric: {f"p{round(q * 100)}": sketch.quantile(q) for q in QUANTILES}
+                for metric, sketch in self.sketches.items()
+            },
+            "shard": shard_path(key),
+        }
+
+
+class SummaryAggregator:
+    """Per-strategy aggregates for a stream of BenchmarkResults."""
+
+    def __init__(self):
+        self.strategies: dict[str, StrategyAggregate] = {}
+        self.blocks: set[str] = set()
+
+    def add(self, result) -> None:
+        key = strategy_key(result)
+        if key not in self.strategies:
+            self.strategies[key] = StrategyAggregate(result.encoding, result.compression, result.packing)
+        self.strategies[key].add(result)
+        self.blocks.add(result.payload_file)
+
+    def merge(self, other: "SummaryAggregator") -> None:
+        for key, aggregate in other.strategies.items():
+            if key in self.strategies:
+                self.strategies[key].merge(aggregate)
+            else:
+                self.strategies[key] = aggregate
+        self.blocks |= other.blocks
+
+    def summary(self) -> dict:
+        strategies = sorted((a.entry() for a in self.strategies.values()), key=lambda s: s["blobs"])
+        return {
+            "version": SUMMARY_VERSION,
+            "baseline": BASELINE_KEY,
+            "blocks": sorted(self.blocks),
+            "strategies": strategies,
+            "pareto": {
+                phase: pareto_front({s["key"]: (s["blobs"], s[f"{phase}_time_ms"]) for s in strategies})
+                for phase in ("encode", "decode")
+            },
+        }
+
+
+def summarize(results) -> dict:
+    """Aggregate BenchmarkResults into the dashboard summary."""
+    aggregator = SummaryAggregator()
+    for r in results:
+        aggregator.add(r)
+    return aggregator.summary()
+
+
+class ResultsWriter:
+    """Stream BenchmarkResults to disk as they are produced.
+
+    Each row is appended to results.jsonl and to its strategy's shard,
+    and flushed, so a crashed run keeps everything written so far.
+    summary.json is written from the running aggregates on close().
+    """
+
+    def __init__(self, output_dir: Path, rows_file: str | None = "results.jsonl"):
+        self.output_dir = output_dir
+        (output_dir / "shards").mkdir(parents=True, exist_ok=True)
+        self.aggregator = SummaryAggregator()
+        self._rows = open(output_dir / rows_file, "w") if rows_file else None
+        self._shards: dict[str, TextIO] = {}
+
+    def write(self, result) -> None:
+        line = json.dumps(asdict(result)) + "\n"
+        if self._rows:
+            self._rows.write(line)
+            self._rows.flush()
+
+        rel_path = shard_path(strategy_key(result))
+        if rel_path not in self._shards:
+            self._shards[rel_path] = open(self.output_dir / rel_path, "w")
+        self._shards[rel_path].write(line)
+        self._shards[rel_path].flush()
+
+        self.aggregator.add(result)
+
+    def close(self) -> Path:
+        """Close row files and write summary.json."""
+        if self._rows:
+            self._rows.close()
+        for f in self._shards.values():
+            f.close()
+
+        summary_file = self.output_dir / "summary.json"
+        with open(summary_file, "w") as f:
+            json.dump(self.aggregator.summary(), f, indent=2)
+        return summary_file
+
+    def __enter__(self) -> "ResultsWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def write_summary(results, output_dir: Path) -> Path:
+    """Write summary.json and one JSONL detail shard per strategy."""
+    with ResultsWriter(output_dir, rows_file=None) as writer:
+        for r in results:
+            writer.write(r)
+    return output_dir / "summary.json"
@@ -0,0 +1,155 @@
+"""Versioned registry of frequent addresses and function selectors.
+
+The registry maps hot 20-byte addresses and 4-byte selectors to small
+integer indices, ordered by corpus frequency so the most common symbols
+get the shortest varints. It is persisted as a flat binary file:
+
+    magic "BREG" | version u32 | n_addresses u32 | n_selectors u32
+    | addresses (20 bytes each) | selectors (4 bytes each)
+"""
+
+import zlib
+from collections import Counter
+from pathlib import Path
+
+from .transaction import decode_transaction, field_index
+
+REGISTRY_MAGIC = b"BREG"
+ADDRESS_SIZE = 20
+SELECTOR_SIZE = 4
+WORD_SIZE = 32
+# An ABI-encoded address argument: 12 zero bytes then the address
+ADDRESS_WORD_PAD = bytes(WORD_SIZE - ADDRESS_SIZE)
+# Smaller values are amounts and flags, not addresses
+MIN_ADDRESS_VALUE = 1 << 64
+
+DEFAULT_REGISTRY_PATH = Path("registry/symbols.bin")
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    """Append an unsigned LEB128 varint."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(data: bytes, pos: int = 0) -> tuple[int, int]:
+    """Read one unsigned LEB128 varint at pos. Returns (value, next_pos)."""
+    value = shift = 0
+    while pos < len(data):
+        byte = data[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return value, pos
+        shift += 7
+    raise ValueError("Truncated varint")
+
+
+def decode_varints(data: bytes) -> list[int]:
+    """Decode a concatenation of unsigned LEB128 varints."""
+    values = []
+    value = shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = shift = 0
+    if shift:
+        raise ValueError("Truncated varint")
+    return values
+
+
+def address_words(data: bytes) -> list[tuple[int, bytes]]:
+    """(word index, address) of every ABI address-shaped word after the selector."""
+    words = []
+    for k, pos in enumerate(range(SELECTOR_SIZE, len(data) - WORD_SIZE + 1, WORD_SIZE)):
+        if data[pos : pos + len(ADDRESS_WORD_PAD)] == ADDRESS_WORD_PAD:
+            address = data[pos + len(ADDRESS_WORD_PAD) : pos + WORD_SIZE]
+            if int.from_bytes(address, "big") >= MIN_ADDRESS_VALUE:
+                words.append((k, address))
+    return words
+
+
+class SymbolRegistry:
+    """Frequency-ordered address and selector tables with hash lookup."""
+
+    def __init__(self, version: int, addresses: list[bytes], selectors: list[bytes]):
+        self.version = version
+        self.addresses = addresses
+        self.selectors = selectors
+        # Content digest: rebuilds under the same version still differ
+        self.checksum = zlib.crc32(b"".join(addresses) + b"|" + b"".join(selectors))
+        self._address_index = {a: i for i, a in enumerate(addresses)}
+        self._selector_index = {s: i for i, s in enumerate(selectors)}
+
+    def address_index(self, address: bytes) -> int | None:
+        return self._address_index.get(address)
+
+    def selector_index(self, selector: bytes) -> int | None:
+        return self._selector_index.get(selector)
+
+    def save(self, path: Path) -> None:
+        """Write the registry to disk."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(REGISTRY_MAGIC)
+            for n in (self.version, len(self.addresses), len(self.selectors)):
+                f.write(n.to_bytes(4, "big"))
+            f.write(b"".join(self.addresses))
+            f.write(b"".join(self.selectors))
+
+    @classmethod
+    def load(cls, path: Path) -> "SymbolRegistry":
+        """Read a registry written by save()."""
+        data = Path(path).read_bytes()
+        if data[:4] != REGISTRY_MAGIC:
+            raise ValueError(f"Not a symbol registry: {path}")
+        version, n_addresses, n_selectors = (
+            int.from_bytes(data[i : i + 4], "big") for i in (4, 8, 12)
+        )
+        pos = 16
+        addresses = [data[pos + i * ADDRESS_SIZE : pos + (i + 1) * ADDRESS_SIZE] for i in range(n_addresses)]
+        pos += n_addresses * ADDRESS_SIZE
+        selectors = [data[pos + i * SELECTOR_SIZE : pos + (i + 1) * SELECTOR_SIZE] for i in range(n_selectors)]
+        return cls(version, addresses, selectors)
+
+
+def build_registry(
+    transactions: list[bytes],
+    version: int = 1,
+    max_addresses: int = 16384,
+    max_selectors: int = 4096,
+    min_count: int = 2,
+) -> SymbolRegistry:
+    """Build a registry of the most frequent symbols in transactions.
+
+    Addresses are counted as recipients and as ABI address arguments.
+    The default caps keep every index within a 2-byte varint.
+    """
+    address_counts: Counter[bytes] = Counter()
+    selector_counts: Counter[bytes] = Counter()
+
+    for tx in transactions:
+        try:
+            t, fields = decode_transaction(tx)
+        except ValueError:
+            continue
+        to = fields[field_index(t, "to")]
+        if len(to) == ADDRESS_SIZE:
+            address_counts[to] += 1
+        data = fields[field_index(t, "data")]
+        if len(data) >= SELECTOR_SIZE:
+            selector_counts[data[:SELECTOR_SIZE]] += 1
+            for _, address in address_words(data):
+                address_counts[address] += 1
+
+    def top(counts: Counter[bytes], limit: int) -> list[bytes]:
+        # Deterministic order: frequency, then bytes
+        ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+        return [symbol for symbol, count in ranked[:limit] if count >= min_count]
+
+    return SymbolRegistry(version, top(address_counts, max_addresses), top(selector_counts, max_selectors))
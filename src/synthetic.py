@@ -0,0 +1,220 @@
+"""Generate synthetic ExecutionPayloads at configurable sizes.
+
+Two modes:
+- sample: draw real transactions (with replacement) from the corpus
+- model: build transactions from a statistical model of the corpus
+  (tx type mix, blob-tx share, calldata length and entropy)
+"""
+
+import json
+import random
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .payload import find_payloads, load_transactions
+from .transaction import TX_FIELDS, decode_transaction, encode_transaction, field_index
+
+WORD_SIZE = 32
+
+
+@dataclass
+class TxModel:
+    """Statistical model of a transaction list."""
+
+    type_shares: dict[int, float] = field(
+        default_factory=lambda: {0: 0.13, 1: 0.001, 2: 0.86, 4: 0.004}
+    )
+    blob_share: float = 0.005       # Share of type-3 (blob) transactions
+    calldata_mean: int = 450        # Mean calldata length in bytes
+    calldata_entropy: float = 0.3   # Share of non-address ABI words that are random
+    address_word_share: float = 0.25  # Share of ABI words that hold an address
+    address_pool: int = 2000        # Distinct addresses (recipients and ABI args)
+    selector_pool: int = 500        # Distinct function selectors
+
+
+def load_corpus(payloads_dir: Path) -> list[bytes]:
+    """Load every transaction from the payload corpus."""
+    transactions = []
+    for path in find_payloads(payloads_dir):
+        transactions.extend(load_transactions(path))
+    return transactions
+
+
+def _classify_word(word: bytes) -> str:
+    if word[:12] == bytes(12) and any(word[12:]):
+        return "address" if word[12:14] != bytes(2) else "small"
+    if word[:16] == bytes(16):
+        return "small"
+    return "random"
+
+
+def fit_model(transactions: list[bytes]) -> TxModel:
+    """Estimate a TxModel from real transactions."""
+    if not transactions:
+        return TxModel()
+
+    type_counts: dict[int, int] = {}
+    calldata_total = 0
+    words = {"address": 0, "small": 0, "random": 0}
+    addresses = set()
+    selectors = set()
+
+    for tx in transactions:
+        t, fields = decode_transaction(tx)
+        type_counts[t] = type_counts.get(t, 0) + 1
+        to = fields[field_index(t, "to")]
+        if to:
+            addresses.add(to)
+        data = fields[field_index(t, "data")]
+        calldata_total += len(data)
+        if len(data) >= 4:
+            selectors.add(data[:4])
+        for i in range(4, len(data) - WORD_SIZE + 1, WORD_SIZE):
+            word = data[i : i + WORD_SIZE]
+            kind = _classify_word(word)
+            words[kind] += 1
+            if kind == "address":
+                addresses.add(word[12:])
+
+    n = len(transactions)
+    blob_share = type_counts.pop(3, 0) / n
+    non_blob = sum(type_counts.values()) or 1
+    non_address = words["small"] + words["random"]
+    total_words = non_address + words["address"]
+
+    return TxModel(
+        type_shares={t: c / non_blob for t, c in sorted(type_counts.items())},
+        blob_share=blob_share,
+        calldata_mean=calldata_total // n,
+        calldata_entropy=words["random"] / non_address if non_address else 0.0,
+        address_word_share=words["address"] / total_words if total_words else 0.0,
+        address_pool=max(len(addresses), 1),
+        selector_pool=max(len(selectors), 1),
+    )
+
+
+class _ModelTxFactory:
+    """Build synthetic transactions from a TxModel."""
+
+    def __init__(self, model: TxModel, rng: random.Random):
+        self.model = model
+        self.rng = rng
+        self.addresses = [rng.randbytes(20) for _ in range(model.address_pool)]
+        self.selectors = [rng.randbytes(4) for _ in range(model.selector_pool)]
+        types = list(model.type_shares)
+        weights = [model.type_shares[t] * (1 - model.blob_share) for t in types]
+        self.types = types + [3]
+        self.type_weights = weights + [model.blob_share]
+
+    def _int(self, max_bits: int) -> int:
+        return self.rng.getrandbits(self.rng.randint(1, max_bits))
+
+    def _pick_address(self) -> bytes:
+        # Skewed popularity: a few routers and tokens dominate
+        idx = min(int(self.rng.paretovariate(1.2)) - 1, len(self.addresses) - 1)
+        return self.addresses[idx]
+
+    def _calldata(self) -> bytes:
+        if not self.model.calldata_mean:
+            return b""
+        length = int(self.rng.expovariate(1 / self.model.calldata_mean))
+        if length < 4:
+            return b""
+        data = bytearray(self.rng.choice(self.selectors))
+        for _ in range((length - 4) // WORD_SIZE):
+            if self.rng.random() < self.model.address_word_share:
+                data += bytes(12) + self._pick_address()
+            elif self.rng.random() < self.model.calldata_entropy:
+                data += self.rng.randbytes(WORD_SIZE)
+            else:
+                data += self._int(64).to_bytes(WORD_SIZE, "big")
+        return bytes(data)
+
+    def make(self) -> bytes:
+        t = self.rng.choices(self.types, self.type_weights)[0]
+        values = {
+            "chain_id": 1,
+            "nonce": self._int(20),
+            "gas_price": self._int(40),
+            "max_priority_fee_per_gas": self._int(32),
+            "max_fee_per_gas": self._int(40),
+            "gas": 21000 + self._int(22),
+            "to": self._pick_address(),
+            "value": self._int(64) if self.rng.random() < 0.3 else 0,
+            "data": self._calldata(),
+            "access_list": [],
+            "max_fee_per_blob_gas": self._int(32),
+            "blob_versioned_hashes": [
+                b"\x01" + self.rng.randbytes(31) for _ in range(self.rng.randint(1, 6))
+            ],
+            "authorization_list": [],
+            "v": 37 + self.rng.getrandbits(1),
+            "y_parity": self.rng.getrandbits(1),
+            "r": self.rng.randbytes(32),
+            "s": self.rng.randbytes(32),
+        }
+        return encode_transaction(t, [values[name] for name in TX_FIELDS[t]])
+
+
+def generate_transactions(
+    target_bytes: int,
+    mode: str = "sample",
+    corpus: list[bytes] | None = None,
+    model: TxModel | None = None,
+    seed: int = 0,
+) -> list[bytes]:
+    """Generate a transaction list whose raw size reaches target_bytes."""
+    rng = random.Random(seed)
+
+    if mode == "sample":
+        if not corpus:
+            raise ValueError("sample mode requires a non-empty corpus")
+
+        def make() -> bytes:
+            return rng.choice(corpus)
+    elif mode == "model":
+        make = _ModelTxFactory(model or TxModel(), rng).make
+    else:
+        raise ValueError(f"Unknown mode: {mode}. Available: ['sample', 'model']")
+
+    transactions = []
+    size = 0
+    while size < target_bytes:
+        tx = make()
+        transactions.append(tx)
+        size += len(tx)
+    return transactions
+
+
+def make_payload(transactions: list[bytes], block_number: int, seed: int = 0) -> dict:
+    """Wrap transactions in an ExecutionPayload JSON object."""
+    rng = random.Random(seed)
+
+    def h(n: int) -> str:
+        return "0x" + rng.randbytes(n).hex()
+
+    return {
+        "parentHash": h(32),
+        "feeRecipient": h(20),
+        "stateRoot": h(32),
+        "receiptsRoot": h(32),
+        "logsBloom": "0x" + "00" * 256,
+        "prevRandao": h(32),
+        "blockNumber": str(block_number),
+        "gasLimit": "0",
+        "gasUsed": "0",
+        "timestamp": "0",
+        "extraData": "0x",
+        "baseFeePerGas": "0",
+        "blockHash": h(32),
+        "transactions": ["0x" + tx.hex() for tx in transactions],
+    }
+
+
+def write_payload(payload: dict, output_dir: Path) -> Path:
+    """Write a payload as block_{number}.json."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    output_path = output_dir / f"block_{payload['blockNumber']}.json"
+    with open(output_path, "w") as f:
+        json.dump(payload, f)
+    return output_path
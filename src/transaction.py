@@ -0,0 +1,86 @@
+"""Typed transaction field layouts.
+
+Transactions in a payload are EIP-2718 envelopes: a type byte followed by
+an RLP list of fields, or a bare RLP list for legacy transactions. Tx
+lists are RLP lists of such envelopes; rlp_list_item_spans locates them
+without decoding.
+"""
+
+import rlp
+from rlp.codec import consume_length_prefix
+
+LEGACY_TX_TYPE = 0
+
+# RLP length prefix offsets for strings and lists
+RLP_STRING_OFFSET = 0x80
+RLP_LIST_OFFSET = 0xC0
+
+# Field order of each transaction type
+TX_FIELDS: dict[int, tuple[str, ...]] = {
+    0: ("nonce", "gas_price", "gas", "to", "value", "data", "v", "r", "s"),
+    1: (
+        "chain_id", "nonce", "gas_price", "gas", "to", "value", "data",
+        "access_list", "y_parity", "r", "s",
+    ),
+    2: (
+        "chain_id", "nonce", "max_priority_fee_per_gas", "max_fee_per_gas", "gas",
+        "to", "value", "data", "access_list", "y_parity", "r", "s",
+    ),
+    3: (
+        "chain_id", "nonce", "max_priority_fee_per_gas", "max_fee_per_gas", "gas",
+        "to", "value", "data", "access_list", "max_fee_per_blob_gas",
+        "blob_versioned_hashes", "y_parity", "r", "s",
+    ),
+    4: (
+        "chain_id", "nonce", "max_priority_fee_per_gas", "max_fee_per_gas", "gas",
+        "to", "value", "data", "access_list", "authorization_list", "y_parity", "r", "s",
+    ),
+}
+
+
+def tx_type(tx: bytes) -> int:
+    """Return the EIP-2718 type of a raw transaction (0 for legacy)."""
+    return tx[0] if tx and tx[0] < 0x7F else LEGACY_TX_TYPE
+
+
+def field_index(tx_type_: int, name: str) -> int:
+    """Return the position of a named field in a transaction type."""
+    return TX_FIELDS[tx_type_].index(name)
+
+
+def decode_transaction(tx: bytes) -> tuple[int, list]:
+    """Split a raw transaction into (type, RLP fields)."""
+    t = tx_type(tx)
+    body = tx if t == LEGACY_TX_TYPE else tx[1:]
+    try:
+        fields = rlp.decode(body)
+    except rlp.DecodingError as e:
+        raise ValueError(f"Malformed transaction: {e}") from e
+    if t not in TX_FIELDS or not isinstance(fields, list) or len(fields) != len(TX_FIELDS[t]):
+        raise ValueError(f"Unsupported transaction layout: type {t}, {len(fields)} fields")
+    return t, fields
+
+
+def encode_transaction(tx_type_: int, fields: list) -> bytes:
+    """Inverse of decode_transaction."""
+    body = rlp.encode(fields)
+    return body if tx_type_ == LEGACY_TX_TYPE else bytes([tx_type_]) + body
+
+
+def rlp_list_item_spans(data: bytes) -> list[tuple[int, int]]:
+    """Return (offset, length) of each string payload in an RLP list, without copying."""
+    _, typ, length, pos = consume_length_prefix(data, 0)
+    if typ is not list:
+        raise ValueError("Expected an RLP list")
+    end = pos + length
+    if end != len(data):
+        raise ValueError(f"RLP list length {length} does not match data size {len(data) - pos}")
+
+    spans = []
+    while pos < end:
+        _, typ, length, pos = consume_length_prefix(data, pos)
+        if typ is not bytes:
+            raise ValueError(f"Expected RLP string at offset {pos}")
+        spans.append((pos, length))
+        pos += length
+    return spans
@@ -1,39 +1,74 @@
-"""Transaction list encoding strategies."""
+"""Transaction list encoding strategies.
 
+Encoder classes (and the rlp/ssz/zstandard backends) are imported on
+first use; see src.lazy.
+"""
+
+from collections.abc import MutableMapping
+
+from ..lazy import LazyRegistry, lazy_attr, lazy_exports
 from .base import TransactionListEncoder
-from .rlp_encoder import RlpEncoder
-from .ssz_encoder import SszEncoder
-from .pertx_rlp_encoder import PerTxRlpEncoder, make_pertx_encoder
 
 # Registry of available encoders (classes that take no args)
-ENCODERS: dict[str, type[TransactionListEncoder]] = {
-    "rlp": RlpEncoder,
-    "ssz": SszEncoder,
-}
+ENCODERS: MutableMapping[str, type[TransactionListEncoder]] = LazyRegistry({
+    "rlp": lazy_attr(f"{__name__}.rlp_encoder", "RlpEncoder"),
+    "ssz": lazy_attr(f"{__name__}.ssz_encoder", "SszEncoder"),
+})
 
 # Per-tx compression variants to test
 PERTX_COMPRESSIONS = ["zstd_3", "snappy"]
 
+# Per-tx variants compressed in one zstd multi-buffer call
+PERTX_BATCH_COMPRESSIONS = ["zstd_3"]
+
 
 def get_encoder(name: str) -> TransactionListEncoder:
     """Get an encoder by name."""
+    # Batched per-tx variants (e.g., "rlp_pertx_batch_zstd_3")
+    if name.startswith("rlp_pertx_batch_"):
+        from .batch_pertx_encoder import make_batch_pertx_encoder
+        return make_batch_pertx_encoder(name.removeprefix("rlp_pertx_batch_"))
+
     # Check for per-tx variants (e.g., "rlp_pertx_zstd_3")
     if name.startswith("rlp_pertx_"):
+        from .pertx_rlp_encoder import make_pertx_encoder
         compression = name.replace("rlp_pertx_", "")
         return make_pertx_encoder(compression)
 
+    # Registry substitution variants (e.g., "ssz_registry")
+    if name.endswith("_registry"):
+        from .registry_encoder import make_registry_encoder
+        return make_registry_encoder(name.removesuffix("_registry"))
+
     if name not in ENCODERS:
         raise ValueError(f"Unknown encoder: {name}. Available: {list(ENCODERS.keys())}")
     return ENCODERS[name]()
 
 
+__getattr__ = lazy_exports(__name__, {
+    "RlpEncoder": ".rlp_encoder",
+    "SszEncoder": ".ssz_encoder",
+    "PerTxRlpEncoder": ".pertx_rlp_encoder",
+    "BatchPerTxRlpEncoder": ".batch_pertx_encoder",
+    "RegistryEncoder": ".registry_encoder",
+    "make_pertx_encoder": ".pertx_rlp_encoder",
+    "make_batch_pertx_encoder": ".batch_pertx_encoder",
+    "make_registry_encoder": ".registry_encoder",
+}, globals())
+
+
 __all__ = [
     "TransactionListEncoder",
     "RlpEncoder",
     "SszEncoder",
     "PerTxRlpEncoder",
+    "BatchPerTxRlpEncoder",
+    "RegistryEncoder",
     "ENCODERS",
     "PERTX_COMPRESSIONS",
+    "PERTX_BATCH_COMPRESSIONS",
     "get_encoder",
     "make_pertx_encoder",
+    "make_batch_pertx_encoder",
+    "make_registry_encoder",
 ]
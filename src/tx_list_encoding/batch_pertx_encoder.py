@@ -0,0 +1,76 @@
+"""Per-transaction zstd compression through the multi-buffer APIs."""
+
+from array import array
+
+import zstandard as zstd
+from rlp.codec import length_prefix
+
+from ..transaction import RLP_LIST_OFFSET, RLP_STRING_OFFSET, rlp_list_item_spans
+
+
+def _segments(spans: list[tuple[int, int]]) -> array:
+    """Pack (offset, length) pairs as the uint64 layout BufferWithSegments expects."""
+    segments = array("Q")
+    for offset, length in spans:
+        segments.append(offset)
+        segments.append(length)
+    return segments
+
+
+class BatchPerTxRlpEncoder:
+    """Per-tx zstd like PerTxRlpEncoder, compressed and decompressed in one batch call.
+
+    Produces the same bytes as PerTxRlpEncoder with ZstdCompressor(level):
+    RLP([zstd(tx1), zstd(tx2), ...]). The compressed frames stay in a
+    zstd buffer collection and are copied once, straight into the RLP list.
+
+    threads follows zstandard: 0 runs on the calling thread, -1 uses one
+    thread per CPU.
+    """
+
+    def __init__(self, level: int = 3, threads: int = 0):
+        self.level = level
+        self.threads = threads
+        self._compressor = zstd.ZstdCompressor(level=level)
+        self._decompressor = zstd.ZstdDecompressor()
+
+    @property
+    def name(self) -> str:
+        return f"rlp_pertx_batch_zstd_{self.level}"
+
+    def encode(self, transactions: list[bytes]) -> bytes:
+        if not transactions:
+            return length_prefix(0, RLP_LIST_OFFSET)
+
+        spans = []
+        offset = 0
+        for tx in transactions:
+            spans.append((offset, len(tx)))
+            offset += len(tx)
+        batch = zstd.BufferWithSegments(b"".join(transactions), _segments(spans))
+        frames = self._compressor.multi_compress_to_buffer(batch, threads=self.threads)
+
+        body = bytearray()
+        for i in range(len(frames)):
+            frame = frames[i]
+            body += length_prefix(len(frame), RLP_STRING_OFFSET)
+            body += frame
+        return length_prefix(len(body), RLP_LIST_OFFSET) + bytes(body)
+
+    def decode(self, data: bytes) -> list[bytes]:
+        return [bytes(tx) for tx in self.decode_buffers(data)]
+
+    def decode_buffers(self, data: bytes) -> "zstd.BufferWithSegmentsCollection | list":
+        """Decompress into a buffer collection, indexable per transaction."""
+        spans = rlp_list_item_spans(data)
+        if not spans:
+            return []
+        frames = zstd.BufferWithSegments(data, _segments(spans))
+        return self._decompressor.multi_decompress_to_buffer(frames, threads=self.threads)
+
+
+def make_batch_pertx_encoder(compression: str, threads: int = 0) -> BatchPerTxRlpEncoder:
+    """Factory for rlp_pertx_batch_<compression> (zstd levels only)."""
+    if not compression.startswith("zstd_"):
+        raise ValueError(f"Batched per-tx compression needs zstd, got: {compression}")
+    return BatchPerTxRlpEncoder(int(compression.removeprefix("zstd_")), threads)
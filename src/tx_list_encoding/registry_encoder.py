@@ -0,0 +1,149 @@
+"""Address and selector substitution ahead of tx list encoding."""
+
+from pathlib import Path
+
+import rlp
+
+from ..symbol_registry import (
+    ADDRESS_WORD_PAD,
+    DEFAULT_REGISTRY_PATH,
+    SELECTOR_SIZE,
+    WORD_SIZE,
+    SymbolRegistry,
+    address_words,
+    decode_varints,
+    encode_varint,
+    read_varint,
+)
+from ..transaction import TX_FIELDS, decode_transaction, encode_transaction, field_index
+from . import get_encoder
+from .base import TransactionListEncoder
+
+
+class RegistryEncoder:
+    """Replace registered addresses and selectors with varint indices.
+
+    Each transaction becomes one of:
+      RLP(tx)                        - verbatim, when nothing can be substituted exactly
+      RLP([type, fields, subs])      - `to`, selector and ABI address words removed
+
+    where subs is a varint stream:
+      to_code, selector_code, n_words, (word_index_delta, address_index) * n_words
+    and a code of 0 means "not substituted", otherwise index + 1.
+
+    The transformed transactions are then encoded by the inner list encoder,
+    prefixed with the registry version as a varint.
+    """
+
+    def __init__(self, inner: TransactionListEncoder, registry: SymbolRegistry):
+        self.inner = inner
+        self.registry = registry
+
+    @property
+    def name(self) -> str:
+        return f"{self.inner.name}_registry"
+
+    def _substitute(self, tx: bytes) -> bytes:
+        try:
+            t, fields = decode_transaction(tx)
+        except ValueError:
+            return rlp.encode(tx)
+        # Decode must reproduce the exact bytes, so skip non-canonical RLP
+        if encode_transaction(t, fields) != tx:
+            return rlp.encode(tx)
+
+        subs = bytearray()
+        to_i = field_index(t, "to")
+        data_i = field_index(t, "data")
+
+        to_idx = self.registry.address_index(fields[to_i])
+        if to_idx is not None:
+            fields[to_i] = b""
+        encode_varint(0 if to_idx is None else to_idx + 1, subs)
+
+        data = fields[data_i]
+        sel_idx = self.registry.selector_index(data[:SELECTOR_SIZE]) if len(data) >= SELECTOR_SIZE else None
+        encode_varint(0 if sel_idx is None else sel_idx + 1, subs)
+
+        words = []
+        for k, address in address_words(data):
+            addr_idx = self.registry.address_index(address)
+            if addr_idx is not None:
+                words.append((k, addr_idx))
+        encode_varint(len(words), subs)
+
+        if words:
+            kept = bytearray(data[:SELECTOR_SIZE])
+            prev_end = SELECTOR_SIZE
+            prev_k = 0
+            for k, addr_idx in words:
+                start = SELECTOR_SIZE + k * WORD_SIZE
+                kept += data[prev_end:start]
+                prev_end = start + WORD_SIZE
+                encode_varint(k - prev_k, subs)
+                encode_varint(addr_idx, subs)
+                prev_k = k
+            kept += data[prev_end:]
+            data = bytes(kept)
+        if sel_idx is not None:
+            data = data[SELECTOR_SIZE:]
+        fields[data_i] = data
+
+        return rlp.encode([t, fields, bytes(subs)])
+
+    def _restore(self, item: bytes) -> bytes:
+        decoded = rlp.decode(item)
+        if isinstance(decoded, bytes):
+            return decoded
+
+        type_bytes, fields, subs = decoded
+        t = int.from_bytes(type_bytes, "big")
+        if t not in TX_FIELDS:
+            raise ValueError(f"Unknown transaction type in registry stream: {t}")
+        codes = decode_varints(subs)
+        to_code, sel_code, n_words = codes[:3]
+
+        to_i = field_index(t, "to")
+        data_i = field_index(t, "data")
+        if to_code:
+            fields[to_i] = self.registry.addresses[to_code - 1]
+
+        data = fields[data_i]
+        if sel_code:
+            data = self.registry.selectors[sel_code - 1] + data
+        if n_words:
+            restored = bytearray(data[:SELECTOR_SIZE])
+            pos = SELECTOR_SIZE
+            k = 0
+            for i in range(n_words):
+                k += codes[3 + 2 * i]
+                address = self.registry.addresses[codes[4 + 2 * i]]
+                # Copy kept words up to the substituted word's original position
+                start = SELECTOR_SIZE + k * WORD_SIZE
+                take = start - len(restored)
+                restored += data[pos : pos + take]
+                pos += take
+                restored += ADDRESS_WORD_PAD + address
+            restored += data[pos:]
+            data = bytes(restored)
+        fields[data_i] = data
+
+        return encode_transaction(t, fields)
+
+    def encode(self, transactions: list[bytes]) -> bytes:
+        header = bytearray()
+        encode_varint(self.registry.version, header)
+        return bytes(header) + self.inner.encode([self._substitute(tx) for tx in transactions])
+
+    def decode(self, data: bytes) -> list[bytes]:
+        version, end = read_varint(data)
+        if version != self.registry.version:
+            raise ValueError(f"Registry version mismatch: data v{version}, registry v{self.registry.version}")
+        return [self._restore(item) for item in self.inner.decode(data[end:])]
+
+
+def make_registry_encoder(inner: str, registry_path: Path = DEFAULT_REGISTRY_PATH) -> RegistryEncoder:
+    """Factory to wrap an encoder with the symbol registry stored at registry_path."""
+    if not registry_path.exists():
+        raise ValueError(f"No symbol registry at {registry_path}. Build one with: python bench.py registry")
+    return RegistryEncoder(get_encoder(inner), SymbolRegistry.load(registry_path))
@@ -3,5 +3,27 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.synthetic import generate_transactions, make_payload, write_payload  # noqa: E402
+
+
+@pytest.fixture
+def tmp_payloads(tmp_path):
+    """Write synthetic payloads to tmp_path/payloads; returns their paths, sorted.
+
+    Call as tmp_payloads(n, size, first_block, seed): payload i holds
+    `size` bytes of model-mode transactions (seed + i) as block first_block + i.
+    """
+
+    def write(n: int = 2, size: int = 50_000, first_block: int = 10, seed: int = 0) -> list[Path]:
+        payload_dir = tmp_path / "payloads"
+        for i in range(n):
+            transactions = generate_transactions(size, "model", seed=seed + i)
+            write_payload(make_payload(transactions, first_block + i, seed=seed + i), payload_dir)
+        return sorted(payload_dir.glob("*.json"))
+
+    return write
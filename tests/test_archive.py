@@ -0,0 +1,71 @@
+"""Tests for the memory-mapped blob archive."""
+
+import pytest
+
+from src.archive import ALIGNMENT, DATA_FILE, BlobArchive, BlobArchiveWriter, build_archive, run_archive_benchmark
+from src.blob import BlobEncoder
+from src.packing import BlobGeometry
+from src.tx_list_encoding import get_encoder
+
+
+def test_archive_roundtrip_is_aligned_and_zero_copy(tmp_path, tmp_payloads):
+    strategies = [("rlp", "zstd_3", "bitpack"), ("ssz", "none", "naive")]
+    entries = build_archive(tmp_payloads(3, 200_000, first_block=18), strategies, tmp_path / "archive")
+
+    assert len(entries) == 6
+    assert all(e.offset % ALIGNMENT == 0 for e in entries)
+
+    with BlobArchive(tmp_path / "archive") as archive:
+        assert archive.strategies() == strategies
+        assert archive.nbytes % ALIGNMENT == 0
+        rlp_entries = archive.select("rlp", "zstd_3", "bitpack")
+        assert [e.block_number for e in rlp_entries] == [18, 19, 20]
+
+        blob_encoder = BlobEncoder.from_names("zstd_3", "bitpack")
+        for entry in rlp_entries:
+            blobs = archive.blobs(entry)
+            assert all(isinstance(b, memoryview) and b.readonly for b in blobs)
+            transactions = get_encoder("rlp").decode(blob_encoder.decode(blobs))
+            assert len(transactions) == entry.tx_count
+            del blobs
+
+
+def test_archive_rejects_wrong_blob_size(tmp_path):
+    with BlobArchiveWriter(tmp_path, BlobGeometry(field_elements_per_blob=256, field_elements_per_cell=16)) as writer:
+        with pytest.raises(ValueError):
+            writer.add("rlp", "none", "naive", "block_1.json", [bytes(100)], 100, [])
+
+
+def test_archive_rejects_other_files(tmp_path):
+    with BlobArchiveWriter(tmp_path):
+        pass
+    (tmp_path / DATA_FILE).write_bytes(b"not an archive")
+    with pytest.raises(ValueError):
+        BlobArchive(tmp_path)
+
+
+def test_archive_benchmark_reports_cold_and_warm(tmp_path, tmp_payloads):
+    build_archive(tmp_payloads(2, 200_000), [("rlp", "none", "bitpack")], tmp_path / "archive")
+    results = run_archive_benchmark(tmp_path / "archive", warm_runs=1)
+
+    assert [r.cache for r in results] == ["cold", "warm"]
+    assert all(r.blocks == 2 and r.tx_mb_s > 0 for r in results)
+
+
+def test_archive_close_with_live_views(tmp_path):
+    with BlobArchiveWriter(tmp_path) as writer:
+        writer.add("rlp", "none", "naive", "block_1.json", [bytes(BlobGeometry().blob_size)], 100, [])
+
+    archive = BlobArchive(tmp_path)
+    views = archive.blobs(archive.entries[0])
+    with pytest.raises(BufferError):
+        archive.close()
+    assert archive._file.closed
+    archive.close()
+    del views
+
+    # A failing decode inside `with` keeps its own error
+    with pytest.raises(RuntimeError):
+        with BlobArchive(tmp_path) as archive:
+            views = archive.blobs(archive.entries[0])
+            raise RuntimeError("decode failed")
@@ -0,0 +1,38 @@
+"""Tests for compressed byte attribution."""
+
+import os
+
+import pytest
+
+from src.attribution import CALLDATA, FRAMING, SIGNATURE, attribute_payload, summarize_attribution
+from src.synthetic import generate_transactions
+from src.transaction import decode_transaction, encode_transaction, field_index
+
+
+@pytest.mark.parametrize("encoding", ["rlp", "ssz"])
+def test_attribution_covers_every_byte(encoding: str):
+    transactions = generate_transactions(50_000, "model", seed=3)
+
+    p = attribute_payload(transactions, encoding, level=3)
+
+    tx_raw = sum(tx.raw_size for tx in p.transactions)
+    assert tx_raw <= p.encoded_size
+    assert all(tx.raw_size >= len(raw) for tx, raw in zip(p.transactions, transactions))
+    assert p.flushed_size == sum(p.list_level.values()) + sum(tx.compressed_size for tx in p.transactions)
+
+    summary = summarize_attribution([p])
+    assert sum(summary["totals"]["raw"].values()) == p.encoded_size
+    assert sum(summary["totals"]["compressed"].values()) == pytest.approx(p.compressed_size)
+
+
+def test_random_calldata_is_charged_to_calldata():
+    t, fields = decode_transaction(generate_transactions(1, "model", seed=4)[0])
+    fields[field_index(t, "data")] = os.urandom(4000)
+    tx = encode_transaction(t, fields)
+
+    p = attribute_payload([tx], "rlp", level=3)
+    compressed = p.transactions[0].compressed
+
+    assert compressed[CALLDATA] > 4000
+    assert compressed[SIGNATURE] < 100
+    assert p.transactions[0].raw[FRAMING] > 0
@@ -0,0 +1,124 @@
+"""Tests for incremental blob building."""
+
+import os
+import random
+
+import pytest
+import rlp
+import zstandard as zstd
+
+from src.blob import BlobEncoder
+from src.builder import BlobBuilder, ZstdFramesCompressor
+from src.compression import get_compressor
+from src.packing import PACKERS, BlobGeometry, get_packer
+from src.tx_list_encoding import get_encoder
+
+GEOMETRY = BlobGeometry(field_elements_per_blob=256, field_elements_per_cell=16)
+
+
+def _transactions(n: int, seed: int = 0) -> list[bytes]:
+    rng = random.Random(seed)
+    return [
+        bytes([2]) + os.urandom(rng.randrange(60, 120)) + bytes(rng.randrange(0, 400))
+        for _ in range(n)
+    ]
+
+
+def _decode(blobs: list[bytes], packing: str, level: int = 3) -> list[bytes]:
+    encoder = BlobEncoder(ZstdFramesCompressor(level), get_packer(packing, GEOMETRY))
+    return get_encoder("rlp").decode(encoder.decode(blobs))
+
+
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_fills_up_to_max_blobs(packing: str):
+    builder = BlobBuilder(get_packer(packing, GEOMETRY), max_blobs=3)
+    offered = _transactions(300)
+    admitted = [tx for tx in offered if builder.try_append(tx)]
+
+    assert builder.rollbacks > 0
+    assert builder.transactions == admitted
+    predicted = builder.compressed_size
+    blobs, compressed_size = builder.finish()
+
+    assert compressed_size == predicted
+    assert len(blobs) <= 3
+    assert _decode(blobs, packing) == admitted
+
+
+def test_size_is_exact_after_every_append():
+    builder = BlobBuilder(get_packer("bitpack", GEOMETRY), max_blobs=100)
+    for tx in _transactions(20):
+        builder.append(tx)
+    predicted = builder.compressed_size
+    assert builder.finish()[1] == predicted
+
+
+def test_rollback_restores_size():
+    builder = BlobBuilder(get_packer("naive", GEOMETRY), max_blobs=100)
+    txs = _transactions(10)
+    for tx in txs[:5]:
+        builder.append(tx)
+    before = builder.compressed_size
+    builder.append(txs[5])
+    builder.rollback()
+
+    assert builder.transactions == txs[:5]
+    # Closing the frame costs the 3 byte empty last block it would have had anyway
+    assert builder.compressed_size == before
+    with pytest.raises(ValueError):
+        builder.rollback()
+
+    for tx in txs[5:]:
+        builder.append(tx)
+    predicted = builder.compressed_size
+    blobs, compressed_size = builder.finish()
+    assert compressed_size == predicted
+    assert builder.frames == 2
+    assert _decode(blobs, "naive") == txs
+
+
+def test_empty_builder():
+    builder = BlobBuilder(get_packer("bitpack", GEOMETRY), max_blobs=1)
+    predicted = builder.compressed_size
+    blobs, compressed_size = builder.finish()
+    assert compressed_size == predicted
+    assert _decode(blobs, "bitpack") == []
+
+
+def test_oversized_transaction_rejected():
+    builder = BlobBuilder(get_packer("bitpack", GEOMETRY), max_blobs=1)
+    assert not builder.try_append(os.urandom(20_000))
+    assert builder.transactions == []
+    assert builder.try_append(b"\x02" + bytes(100))
+
+
+def test_frames_compressor_reads_concatenated_frames():
+    txs = _transactions(4)
+    frames = zstd.ZstdCompressor(level=3).compress(rlp.encode(txs[:2]))
+    frames += zstd.ZstdCompressor(level=3).compress(rlp.encode(txs[2:]))
+    compressor = ZstdFramesCompressor(3)
+    assert compressor.decompress(frames) == rlp.encode(txs[:2]) + rlp.encode(txs[2:])
+
+    for bad in (frames[:-3], frames + b"\x00"):
+        with pytest.raises(zstd.ZstdError):
+            compressor.decompress(bad)
+    # One-shot decompression stays strict about anything after the first frame
+    with pytest.raises(zstd.ZstdError):
+        get_compressor("zstd_3").decompress(frames)
+
+
+def test_truncated_payload_raises():
+    builder = BlobBuilder(get_packer("naive", GEOMETRY), max_blobs=100)
+    for tx in _transactions(20):
+        builder.append(tx)
+    builder.append(_transactions(1, seed=1)[0])
+    builder.rollback()
+    blob_encoder = builder.blob_encoder()
+
+    blobs, compressed_size = builder.finish()
+    payload = bytearray(blob_encoder.packer.unpack(blobs))
+    # Claim fewer compressed bytes than were written: the last frame is cut short
+    payload[:4] = (compressed_size - 5).to_bytes(4, "big")
+    truncated = blob_encoder.packer.pack(bytes(payload))
+    with pytest.raises(zstd.ZstdError):
+        blob_encoder.decode(truncated)
@@ -0,0 +1,54 @@
+"""Tests for cell-granular packing and partial decode."""
+
+import os
+
+import pytest
+
+from src.blob import BlobEncoder
+from src.packing import PACKERS, BlobGeometry, get_packer, split_cells
+
+
+def test_geometry_validation():
+    assert BlobGeometry().cells_per_blob == 64
+    assert BlobGeometry().cell_size == 2048
+    with pytest.raises(ValueError):
+        BlobGeometry(field_elements_per_blob=100, field_elements_per_cell=64)
+    with pytest.raises(ValueError):
+        get_packer("bitpack", BlobGeometry(field_elements_per_blob=1024, field_elements_per_cell=2))
+
+
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_cells_unpack_independently(packing: str):
+    geometry = BlobGeometry(field_elements_per_blob=256, field_elements_per_cell=16)
+    packer = get_packer(packing, geometry)
+    data = os.urandom(3 * packer.usable_bytes_per_blob - 100)
+
+    blobs = packer.pack(data)
+    unpacked = packer.unpack(blobs)
+
+    assert all(len(b) == geometry.blob_size for b in blobs)
+    assert unpacked[: len(data)] == data
+    for index, cell in split_cells(blobs, geometry).items():
+        start = index * packer.usable_bytes_per_cell
+        assert packer.unpack_cell(cell) == unpacked[start : start + packer.usable_bytes_per_cell]
+
+
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_decode_range_reads_only_needed_cells(packing: str):
+    encoder = BlobEncoder.from_names("none", packing)
+    data = os.urandom(200_000)
+    cells = split_cells(encoder.encode(data)[0])
+
+    needed = encoder.cells_for_range(100_000, 101_000)
+    subset = {i: cells[i] for i in needed}
+
+    assert len(needed) <= 2
+    assert encoder.decode_range(subset, 100_000, 101_000) == data[100_000:101_000]
+    assert encoder.decode_cells(cells) == [(0, data)]
+    with pytest.raises(ValueError):
+        encoder.decode_range(subset, 0, 10)
+
+
+def test_partial_decode_needs_passthrough_compression():
+    with pytest.raises(ValueError):
+        BlobEncoder.from_names("zstd_3", "naive").cells_for_range(0, 10)
@@ -0,0 +1,35 @@
+"""Tests for cross-block context compression."""
+
+import os
+from pathlib import Path
+
+from src.compression import ContextZstdCompressor, ZstdCompressor
+from src.payload import sort_by_block_number
+
+
+def test_context_roundtrip_in_order():
+    blocks = [os.urandom(2000) + b"shared router calldata" * 50 for _ in range(4)]
+    sender = ContextZstdCompressor(level=3, depth=2)
+    receiver = ContextZstdCompressor(level=3, depth=2)
+
+    frames = [sender.compress(b) for b in blocks]
+
+    assert [receiver.decompress(f) for f in frames] == blocks
+
+
+def test_context_shrinks_repeated_content():
+    shared = os.urandom(5000)
+    previous, current = shared + b"a" * 10, shared + b"b" * 10
+    compressor = ContextZstdCompressor(level=3, depth=1)
+
+    compressor.compress(previous)
+    with_context = compressor.compress(current)
+
+    assert len(with_context) < len(ZstdCompressor(level=3).compress(current)) // 10
+    assert compressor.context_bytes == len(current)
+
+
+def test_sort_by_block_number_is_numeric():
+    paths = [Path("block_100.json"), Path("block_99.json"), Path("block_1000.json")]
+
+    assert sort_by_block_number(paths) == [Path("block_99.json"), Path("block_100.json"), Path("block_1000.json")]
@@ -0,0 +1,130 @@
+"""Tests for SSZ block fetching against a local stand-in beacon node."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from click.testing import CliRunner
+
+import fetch_blocks
+from src.beacon import execution_transactions
+from src.payload import find_payloads, load_transactions
+from src.synthetic import generate_transactions
+from src.tx_list_encoding import get_encoder
+
+
+def _offsets(fixed: bytes, variable: list[bytes], fixed_size: int) -> bytes:
+    """Fill in the 4-byte offsets (marked b"OFFS") of a container's variable fields."""
+    pos = fixed_size
+    for part in variable:
+        fixed = fixed.replace(b"OFFS", pos.to_bytes(4, "little"), 1)
+        pos += len(part)
+    assert b"OFFS" not in fixed
+    return fixed + b"".join(variable)
+
+
+def signed_block(fork: str, block_number: int, transactions: list[bytes]) -> bytes:
+    """A SignedBeaconBlock with the given execution payload transactions, as SSZ."""
+    capella = fork != "bellatrix"
+    deneb = fork in ("deneb", "electra")
+
+    tx_list = get_encoder("ssz").encode(transactions)
+    payload_fixed = (
+        bytes(404) + block_number.to_bytes(8, "little") + bytes(24) + b"OFFS" + bytes(64) + b"OFFS"
+        + (b"OFFS" if capella else b"") + (bytes(16) if deneb else b"")
+    )
+    payload_variable = [b"extra data", tx_list] + ([bytes(44 * 2)] if capella else [])
+    payload = _offsets(payload_fixed, payload_variable, len(payload_fixed))
+
+    body_fixed = bytes(200) + b"OFFS" * 5 + bytes(160) + b"OFFS"
+    body_variable = [b"", b"", b"attestations", b"", b"", payload]
+    if capella:
+        body_fixed += b"OFFS"
+        body_variable.append(b"")
+    if deneb:
+        body_fixed += b"OFFS"
+        body_variable.append(bytes(48))
+    if fork == "electra":
+        body_fixed += b"OFFS"
+        body_variable.append(b"requests")
+    body = _offsets(body_fixed, body_variable, len(body_fixed))
+
+    message = _offsets(bytes(80) + b"OFFS", [body], 84)
+    return _offsets(b"OFFS" + bytes(96), [message], 100)
+
+
+@pytest.fixture
+def beacon_node():
+    """Serve {slot: (fork, ssz block)} at /eth/v2/beacon/blocks/{slot}."""
+    blocks: dict[str, tuple[str, bytes]] = {}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            slot = self.path.rsplit("/", 1)[-1]
+            if self.headers.get("Accept") != "application/octet-stream":
+                self.send_error(406)
+            elif slot not in blocks:
+                self.send_error(404)
+            else:
+                fork, data = blocks[slot]
+                self.send_response(200)
+                self.send_header("Content-Type", "application/octet-stream")
+                self.send_header("Eth-Consensus-Version", fork)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", blocks
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("fork", ["bellatrix", "capella", "deneb", "electra"])
+def test_walker_finds_transactions(fork: str):
+    txs = generate_transactions(30_000, "model", seed=1)
+    block = signed_block(fork, 123, txs)
+
+    for header in (fork, None):
+        found = execution_transactions(block, header)
+        assert found.block_number == 123
+        assert get_encoder("ssz").decode(bytes(found.transactions)) == txs
+
+    with pytest.raises(ValueError):
+        execution_transactions(block, "altair")
+    with pytest.raises(ValueError):
+        execution_transactions(block[:600])
+
+
+def test_fetch_ssz_stores_binary_payloads(beacon_node, tmp_path):
+    url, blocks = beacon_node
+    expected = {}
+    for slot, fork in zip(range(10, 13), ["capella", "deneb", "electra"]):
+        txs = generate_transactions(20_000, "model", seed=slot)
+        blocks[str(slot)] = (fork, signed_block(fork, 1000 + slot, txs))
+        expected[f"block_{1000 + slot}.ssz"] = txs
+    blocks["13"] = ("deneb", signed_block("deneb", 1013, []))
+    expected["block_1013.ssz"] = []
+
+    result = CliRunner().invoke(
+        fetch_blocks.main, ["-s", "10", "-e", "14", "-b", url, "-o", str(tmp_path), "-f", "ssz", "-w", "2"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "Fetched 4 blocks, 1 empty slots" in result.output
+    files = find_payloads(tmp_path)
+    assert [f.name for f in files] == sorted(expected)
+    for f in files:
+        assert load_transactions(f) == expected[f.name]
+
+
+def test_find_payloads_prefers_ssz_duplicates(tmp_path):
+    for name in ("block_1.json", "block_1.ssz", "block_2.json", "block_3.ssz", "notes.txt"):
+        (tmp_path / name).write_bytes(b"")
+    assert [f.name for f in find_payloads(tmp_path)] == ["block_1.ssz", "block_2.json", "block_3.ssz"]
+    assert find_payloads(tmp_path / "missing") == []
@@ -0,0 +1,49 @@
+"""Tests for lazily built strategy registries."""
+
+import pytest
+
+from src.compression import COMPRESSORS, get_compressor
+from src.import_time import measure_import
+from src.lazy import LazyRegistry
+
+
+def test_lazy_registry_builds_once_on_lookup():
+    calls = []
+
+    def build():
+        calls.append(1)
+        return object()
+
+    registry = LazyRegistry({"a": build, "b": build})
+
+    assert list(registry) == ["a", "b"] and "a" in registry and len(registry) == 2
+    assert calls == []
+    assert registry["a"] is registry["a"]
+    assert calls == [1] and registry.is_loaded("a") and not registry.is_loaded("b")
+    with pytest.raises(KeyError):
+        registry["c"]
+
+
+def test_registry_api_unchanged():
+    assert "zstd_22" in COMPRESSORS.keys()
+    assert get_compressor("zstd_3") is COMPRESSORS["zstd_3"]
+    assert dict(COMPRESSORS.items())["zstd_3"].name == "zstd_3"
+    with pytest.raises(ValueError):
+        get_compressor("lz4")
+
+
+def test_registry_accepts_assignment():
+    custom = object()
+    COMPRESSORS["custom"] = custom
+    try:
+        assert "custom" in COMPRESSORS and COMPRESSORS.is_loaded("custom")
+        assert get_compressor("custom") is custom
+        assert "custom" in list(COMPRESSORS)
+    finally:
+        del COMPRESSORS["custom"]
+    assert "custom" not in COMPRESSORS
+
+
+@pytest.mark.parametrize("module", ["src.compression", "src.packing", "src.tx_list_encoding", "src.blob"])
+def test_strategy_packages_do_not_import_backends(module: str):
+    assert measure_import(module, runs=1).backends == []
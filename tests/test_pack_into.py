@@ -0,0 +1,64 @@
+"""Tests for caller-provided output buffers."""
+
+import pytest
+
+from src.blob import BlobEncoder
+from src.buffers import BufferPool
+from src.packing import PACKERS, get_packer, packed_size, unpacked_size
+
+DATA = bytes(range(256)) * 600  # spans two blobs
+
+
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_pack_into_dirty_buffer_matches_pack(packing: str):
+    packer = get_packer(packing)
+    out = bytearray(b"\xff" * packed_size(packer, len(DATA)))
+
+    num_blobs = packer.pack_into(DATA, out)
+
+    assert b"".join(packer.pack(DATA)) == bytes(out)
+    assert num_blobs == 2
+
+
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_unpack_into_matches_unpack(packing: str):
+    packer = get_packer(packing)
+    blobs = packer.pack(DATA)
+    out = bytearray(unpacked_size(packer, len(blobs)) + 10)
+
+    written = packer.unpack_into(blobs, memoryview(out))
+
+    assert written == unpacked_size(packer, len(blobs))
+    assert bytes(out[:written]) == packer.unpack(blobs)
+
+
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_pack_into_rejects_small_buffer(packing: str):
+    packer = get_packer(packing)
+
+    with pytest.raises(ValueError):
+        packer.pack_into(DATA, bytearray(packed_size(packer, len(DATA)) - 1))
+
+
+def test_buffer_pool_reuses_ring_slots():
+    pool = BufferPool(slots=2)
+
+    a = pool.get("blobs", 100)
+    b = pool.get("blobs", 50)
+    c = pool.get("blobs", 80)
+
+    assert a.obj is c.obj
+    assert a.obj is not b.obj
+    assert pool.nbytes == 150
+
+
+@pytest.mark.parametrize("compression", ["none", "zstd_3"])
+@pytest.mark.parametrize("packing", list(PACKERS.keys()))
+def test_pooled_blob_encoder_roundtrip(compression: str, packing: str):
+    encoder = BlobEncoder.from_names(compression, packing, BufferPool())
+
+    for data in (DATA, DATA[:1000], DATA):
+        blobs, _ = encoder.encode(data)
+        decoded = encoder.decode(blobs)
+        assert isinstance(decoded, bytes)
+        assert decoded == data
@@ -0,0 +1,34 @@
+"""Tests for batched per-tx zstd compression."""
+
+import pytest
+import rlp
+
+from src.synthetic import generate_transactions
+from src.transaction import rlp_list_item_spans
+from src.tx_list_encoding import BatchPerTxRlpEncoder, get_encoder
+
+
+@pytest.mark.parametrize("threads", [0, 2])
+def test_batch_matches_loop(threads: int):
+    transactions = generate_transactions(100_000, "model", seed=9)
+    batch = BatchPerTxRlpEncoder(level=3, threads=threads)
+
+    encoded = batch.encode(transactions)
+
+    assert encoded == get_encoder("rlp_pertx_zstd_3").encode(transactions)
+    assert batch.decode(encoded) == transactions
+
+
+def test_batch_empty_list_and_registry_name():
+    encoder = get_encoder("rlp_pertx_batch_zstd_3")
+
+    assert encoder.name == "rlp_pertx_batch_zstd_3"
+    assert encoder.decode(encoder.encode([])) == []
+
+
+def test_rlp_list_item_spans():
+    data = rlp.encode([b"ab", b"x" * 60, b""])
+
+    assert [bytes(data[o : o + n]) for o, n in rlp_list_item_spans(data)] == [b"ab", b"x" * 60, b""]
+    with pytest.raises(ValueError):
+        rlp_list_item_spans(data + b"\x00")
@@ -0,0 +1,75 @@
+"""Tests for the field-element-native rANS packer."""
+
+import pytest
+
+from src.benchmark import strategy_combinations
+from src.blob import BlobEncoder
+from src.buffers import BufferPool
+from src.compression import get_compressor
+from src.packing import BLS_MODULUS, RansModel, RansPacker, get_packer, packed_size
+from src.rans_benchmark import run_fe_benchmark
+from src.synthetic import generate_transactions
+from src.tx_list_encoding import get_encoder
+
+
+def _data(seed: int, size: int = 60_000) -> bytes:
+    return get_encoder("rlp").encode(generate_transactions(size, "model", seed=seed))
+
+
+@pytest.mark.parametrize("data", [b"", b"a", bytes(range(256)) * 3])
+def test_order0_roundtrip_edge_cases(data: bytes):
+    packer = RansPacker()
+    assert packer.unpack(packer.pack(data)) == data
+
+
+def test_roundtrip_through_blob_encoder():
+    data = _data(1, 300_000)
+    model = RansModel.fit([_data(2), _data(3)], order=1)
+    for packer in (get_packer("rans_o0"), RansPacker(model=model)):
+        blob_encoder = BlobEncoder(get_compressor("none"), packer)
+        blobs, _ = blob_encoder.encode(data)
+        assert len(blobs) > 1
+        assert blob_encoder.decode(blobs) == data
+        for blob in blobs:
+            elements = [int.from_bytes(blob[i : i + 32], "big") for i in range(0, len(blob), 32)]
+            assert all(e < BLS_MODULUS for e in elements)
+
+
+def test_pooled_roundtrip():
+    model = RansModel.fit([_data(2)], order=1)
+    for packer in (get_packer("rans_o0"), RansPacker(model=model)):
+        encoder = BlobEncoder(get_compressor("none"), packer, BufferPool())
+        # Incompressible, highly compressible (longer than its blobs' nominal capacity) and typical
+        for data in (bytes(range(256)) * 600, bytes(600_000), _data(9, 100_000), b""):
+            blobs, _ = encoder.encode(data)
+            assert encoder.decode(blobs) == data
+        assert packed_size(packer, 100_000) >= len(b"".join(packer.pack(bytes(range(256)) * 400)))
+
+
+def test_model_save_load_and_checksum(tmp_path):
+    model = RansModel.fit([_data(4)], order=1)
+    model.save(tmp_path / "model.bin")
+    loaded = RansModel.load(tmp_path / "model.bin")
+    assert loaded.tables == model.tables and loaded.checksum == model.checksum
+
+    blobs = RansPacker(model=model).pack(_data(5))
+    other = RansPacker(model=RansModel.fit([_data(6)], order=1))
+    with pytest.raises(ValueError):
+        other.unpack(blobs)
+
+
+def test_entropy_packers_only_pair_with_no_compression():
+    combos = strategy_combinations(["rlp"], ["none", "zstd_22"], ["bitpack", "rans_o0"])
+    assert ("rlp", "none", "rans_o0") in combos
+    assert ("rlp", "zstd_22", "rans_o0") not in combos
+    assert ("rlp", "zstd_22", "bitpack") in combos
+
+
+def test_fe_benchmark_counts_elements(tmp_payloads):
+    payload_files = tmp_payloads(1, 100_000, first_block=1, seed=7)
+    model = RansModel.fit([_data(8)], order=1)
+
+    results = run_fe_benchmark(payload_files, model=model)
+
+    assert [r.strategy for r in results] == ["zstd_22+bitpack_254", "none+rans_o0", "none+rans_o1"]
+    assert all(0 < r.field_elements <= r.blob_count * 4096 for r in results)
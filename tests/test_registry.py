@@ -0,0 +1,57 @@
+"""Tests for address/selector registry substitution."""
+
+import pytest
+
+from src.symbol_registry import SymbolRegistry, build_registry, decode_varints, encode_varint
+from src.synthetic import generate_transactions
+from src.tx_list_encoding import ENCODERS, RegistryEncoder, get_encoder
+
+
+def test_varint_roundtrip():
+    values = [0, 1, 127, 128, 300, 16383, 16384, 2**40]
+    out = bytearray()
+    for v in values:
+        encode_varint(v, out)
+
+    assert decode_varints(bytes(out)) == values
+    assert len(out) == 1 + 1 + 1 + 2 + 2 + 2 + 3 + 6
+
+
+def test_registry_save_load(tmp_path):
+    registry = SymbolRegistry(3, [b"\x11" * 20, b"\x22" * 20], [b"\xaa\xbb\xcc\xdd"])
+    path = tmp_path / "symbols.bin"
+
+    registry.save(path)
+    loaded = SymbolRegistry.load(path)
+
+    assert loaded.version == 3
+    assert loaded.addresses == registry.addresses
+    assert loaded.selector_index(b"\xaa\xbb\xcc\xdd") == 0
+
+
+@pytest.mark.parametrize("inner", list(ENCODERS.keys()))
+def test_registry_encoder_roundtrip_and_shrinks(inner: str):
+    transactions = generate_transactions(200_000, "model", seed=5)
+    registry = build_registry(transactions[: len(transactions) // 2])
+    encoder = RegistryEncoder(get_encoder(inner), registry)
+
+    encoded = encoder.encode(transactions)
+
+    assert encoder.decode(encoded) == transactions
+    assert len(encoded) < len(get_encoder(inner).encode(transactions))
+
+
+def test_registry_encoder_rejects_version_mismatch():
+    transactions = generate_transactions(20_000, "model", seed=6)
+    encoded = RegistryEncoder(get_encoder("rlp"), build_registry(transactions, version=1)).encode(transactions)
+
+    with pytest.raises(ValueError):
+        RegistryEncoder(get_encoder("rlp"), build_registry(transactions, version=2)).decode(encoded)
+
+
+def test_registry_encoder_passes_unparseable_tx_verbatim():
+    registry = build_registry([])
+    encoder = RegistryEncoder(get_encoder("rlp"), registry)
+    transactions = [b"\x02\xff\xff", b"\x7f"]
+
+    assert encoder.decode(encoder.encode(transactions)) == transactions
@@ -0,0 +1,23 @@
+"""Tests for the slot-replay benchmark."""
+
+from src.replay import group_slots, replay_strategy
+
+
+def test_group_slots_reaches_blob_target():
+    slots = group_slots(["a", "b", "c", "d", "e"], [2, 3, 1, 4, 1], 4)
+
+    assert slots == [["a", "b"], ["c", "d"], ["e"]]
+    assert group_slots(["a", "b"], [1, 1], 0) == [["a"], ["b"]]
+
+
+def test_replay_decodes_every_slot(tmp_payloads):
+    result = replay_strategy(
+        tmp_payloads(4, 150_000), "rlp", "zstd_3", "bitpack", blobs_per_slot=2, loops=2,
+    )
+
+    assert result.slots == len(result.slot_results) > 0
+    assert sum(s.tx_raw_size for s in result.slot_results) == result.tx_raw_size
+    assert [s.payload_files[0] for s in result.slot_results][0] == "block_10.json"
+    assert result.p50_ms <= result.p99_ms <= result.p999_ms <= result.max_ms
+    assert result.deadline_misses == 0
+    assert result.sustained_mb_s > 0
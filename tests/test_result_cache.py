@@ -0,0 +1,91 @@
+"""Tests for the benchmark cell cache."""
+
+import importlib.util
+import json
+import sys
+
+from src.benchmark import run_benchmark
+from src.compression.zstd import ZstdCompressor
+from src.result_cache import ResultCache, source_fingerprint
+from src.symbol_registry import SymbolRegistry
+from src.tx_list_encoding import PerTxRlpEncoder, RegistryEncoder, get_encoder
+
+
+def _sizes(results):
+    return [(r.payload_file, r.encoding, r.compression, r.packing, r.compressed_size, r.blob_count) for r in results]
+
+
+def test_rerun_reuses_cells_and_new_strategy_costs_one_column(tmp_path, tmp_payloads):
+    payload_files = tmp_payloads()
+    cache_path = tmp_path / "cache.jsonl"
+
+    with ResultCache(cache_path) as cache:
+        first = run_benchmark(payload_files, ["rlp"], ["none"], ["naive"], 1, cache)
+    assert (cache.hits, cache.misses) == (0, 2)
+
+    with ResultCache(cache_path) as cache:
+        second = run_benchmark(payload_files, ["rlp"], ["none", "zstd_3"], ["naive"], 1, cache)
+    assert (cache.hits, cache.misses) == (2, 2)
+    assert [r for r in second if r.compression == "none"] == first
+
+    with ResultCache(cache_path) as cache:
+        assert len(cache) == 4
+        third = run_benchmark(payload_files, ["rlp"], ["none", "zstd_3"], ["naive"], 1, cache, retime=True)
+    assert (cache.hits, cache.misses) == (4, 0)
+    assert _sizes(third) == _sizes(second)
+    assert len(ResultCache(cache_path)) == 4
+    # Re-timed cells replace their old lines instead of piling up
+    assert len(cache_path.read_text().splitlines()) == 4
+
+    # Another iteration count re-times instead of reusing timings
+    with ResultCache(cache_path) as cache:
+        run_benchmark(payload_files, ["rlp"], ["none"], ["naive"], 2, cache)
+    lines = [json.loads(line) for line in cache_path.read_text().splitlines()]
+    assert sorted(e["iterations"] for e in lines) == [1, 1, 2, 2]
+
+
+def test_fingerprint_follows_source_and_configuration(tmp_path):
+    source = tmp_path / "fp_strategy.py"
+    source.write_text("class Strategy:\n    name = 'a'\n")
+    spec = importlib.util.spec_from_file_location("fp_strategy", source)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["fp_strategy"] = module
+    try:
+        spec.loader.exec_module(module)
+        before = source_fingerprint(module.Strategy())
+        assert source_fingerprint(module.Strategy()) == before
+        source.write_text("class Strategy:\n    name = 'b'\n")
+        assert source_fingerprint(module.Strategy()) != before
+    finally:
+        del sys.modules["fp_strategy"]
+
+    assert source_fingerprint(ZstdCompressor(3)) != source_fingerprint(ZstdCompressor(4))
+
+
+def test_fingerprint_follows_nested_strategies(tmp_path):
+    # A compressor module under src, held by a per-tx encoder
+    source = tmp_path / "fp_compressor.py"
+    source.write_text("class Compressor:\n    name = 'a'\n")
+    spec = importlib.util.spec_from_file_location("src.fp_compressor", source)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["src.fp_compressor"] = module
+    try:
+        spec.loader.exec_module(module)
+        before = source_fingerprint(PerTxRlpEncoder(module.Compressor()))
+        source.write_text("class Compressor:\n    name = 'b'\n")
+        assert source_fingerprint(PerTxRlpEncoder(module.Compressor())) != before
+    finally:
+        del sys.modules["src.fp_compressor"]
+
+    assert source_fingerprint(PerTxRlpEncoder(ZstdCompressor(3))) != source_fingerprint(
+        PerTxRlpEncoder(ZstdCompressor(4))
+    )
+
+
+def test_fingerprint_follows_registry_contents():
+    def fingerprint(address: bytes) -> str:
+        return source_fingerprint(RegistryEncoder(get_encoder("rlp"), SymbolRegistry(1, [address], [])))
+
+    # A rebuild keeps the version number but not the symbols
+    assert fingerprint(b"\x01" * 20) == fingerprint(b"\x01" * 20)
+    assert fingerprint(b"\x01" * 20) != fingerprint(b"\x02" * 20)
@@ -0,0 +1,101 @@
+"""Tests for pre-aggregated dashboard summaries."""
+
+import json
+import random
+
+from src.benchmark import BenchmarkResult
+from src.sketch import QuantileSketch
+from src.summary import ResultsWriter, SummaryAggregator, pareto_front, quantile, summarize, write_summary
+
+
+def _result(compression: str, payload: str, blobs: int, decode_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        encoding="rlp", compression=compression, packing="naive_31", payload_file=payload,
+        tx_raw_size=100, encoded_size=100, compressed_size=50, blob_count=blobs,
+        space_efficiency=0.5, encode_time_ms=1.0, decode_time_ms=decode_ms,
+    )
+
+
+def test_quantile_interpolates():
+    assert quantile([], 0.5) == 0.0
+    assert quantile([1.0, 3.0], 0.5) == 2.0
+    assert quantile([1.0, 2.0, 3.0, 4.0, 5.0], 0.99) == 4.96
+
+
+def test_pareto_front_drops_dominated_points():
+    points = {"a": (1, 10.0), "b": (2, 5.0), "c": (3, 6.0), "d": (4, 1.0)}
+
+    assert pareto_front(points) == ["a", "b", "d"]
+
+
+def test_summarize_aggregates_per_strategy():
+    results = [
+        _result("none", "block_1.json", 3, 1.0),
+        _result("none", "block_2.json", 5, 3.0),
+        _result("zstd_3", "block_1.json", 1, 2.0),
+    ]
+
+    summary = summarize(results)
+    by_key = {s["key"]: s for s in summary["strategies"]}
+
+    assert summary["blocks"] == ["block_1.json", "block_2.json"]
+    assert by_key["rlp+none+naive_31"]["blobs"] == 8
+    assert by_key["rlp+none+naive_31"]["decode_time_ms"] == 2.0
+    assert by_key["rlp+none+naive_31"]["quantiles"]["blob_count"]["p50"] == 4.0
+    assert summary["pareto"]["decode"] == ["rlp+zstd_3+naive_31"]
+
+
+def test_write_summary_writes_shards(tmp_path):
+    results = [_result("none", "block_1.json", 3, 1.0), _result("zstd_3", "block_1.json", 1, 2.0)]
+
+    summary_file = write_summary(results, tmp_path)
+
+    summary = json.loads(summary_file.read_text())
+    for entry in summary["strategies"]:
+        lines = (tmp_path / entry["shard"]).read_text().splitlines()
+        assert [json.loads(line)["compression"] for line in lines] == [entry["compression"]]
+
+
+def test_sketch_is_exact_when_small_and_bounded_when_large():
+    small = QuantileSketch()
+    for v in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        small.add(v)
+    assert small.quantile(0.99) == 4.96
+
+    rng = random.Random(1)
+    values = [rng.lognormvariate(0, 1) for _ in range(20_000)]
+    halves = QuantileSketch(), QuantileSketch()
+    for i, v in enumerate(values):
+        halves[i % 2].add(v)
+    halves[0].merge(halves[1])
+
+    assert halves[0].count == len(values)
+    for q in (0.5, 0.99):
+        exact = quantile(sorted(values), q)
+        assert abs(halves[0].quantile(q) - exact) <= 0.02 * exact
+
+
+def test_results_writer_streams_rows_and_summary(tmp_path):
+    results = [
+        _result("none", "block_1.json", 3, 1.0),
+        _result("zstd_3", "block_1.json", 1, 2.0),
+        _result("none", "block_2.json", 5, 3.0),
+    ]
+
+    with ResultsWriter(tmp_path) as writer:
+        for r in results:
+            writer.write(r)
+        assert len((tmp_path / "results.jsonl").read_text().splitlines()) == 3
+
+    assert json.loads((tmp_path / "summary.json").read_text()) == json.loads(json.dumps(summarize(results)))
+
+
+def test_aggregators_merge_like_one_stream():
+    results = [_result("none", f"block_{i}.json", i % 4 + 1, float(i)) for i in range(10)]
+    left, right = SummaryAggregator(), SummaryAggregator()
+    for i, r in enumerate(results):
+        (left if i < 4 else right).add(r)
+
+    left.merge(right)
+
+    assert left.summary() == summarize(results)
@@ -0,0 +1,61 @@
+"""Tests for synthetic payload generation and scaling analysis."""
+
+from src.scaling import ScalingResult, linearity_breaks, scaling_exponents
+from src.synthetic import TxModel, fit_model, generate_transactions, make_payload
+from src.payload import extract_transactions
+from src.transaction import decode_transaction, tx_type
+
+
+def test_sample_mode_reaches_target_from_corpus():
+    corpus = [b"\x02" + bytes(99), b"\x02" + bytes(199)]
+    txs = generate_transactions(10_000, "sample", corpus=corpus, seed=1)
+
+    assert sum(len(tx) for tx in txs) >= 10_000
+    assert set(txs) <= set(corpus)
+    assert txs == generate_transactions(10_000, "sample", corpus=corpus, seed=1)
+
+
+def test_model_mode_produces_decodable_transactions():
+    model = TxModel(blob_share=0.5)
+    txs = generate_transactions(50_000, "model", model=model, seed=3)
+
+    types = {tx_type(tx) for tx in txs}
+    assert 3 in types
+    for tx in txs:
+        decode_transaction(tx)
+
+    fitted = fit_model(txs)
+    assert 0.3 < fitted.blob_share < 0.7
+
+
+def test_make_payload_roundtrips_transactions():
+    txs = generate_transactions(5_000, "model", seed=2)
+    payload = make_payload(txs, block_number=7)
+
+    assert payload["blockNumber"] == "7"
+    assert extract_transactions(payload) == txs
+
+
+def _point(size: int, encode_ms: float) -> ScalingResult:
+    return ScalingResult("rlp", "none", "naive_31", size, size, size, size, 1,
+                         encode_ms, encode_ms, 0.0, 0.0)
+
+
+def test_linearity_break_detects_superlinear_step():
+    results = [_point(1, 1.0), _point(2, 2.0), _point(4, 16.0)]
+
+    exponents = scaling_exponents(results)
+    steps = exponents["rlp+none+naive_31"]
+    assert round(steps[0]["encode"], 6) == 1.0
+    assert round(steps[1]["encode"], 6) == 3.0
+    assert linearity_breaks(exponents)["rlp+none+naive_31"]["encode"] == 4
+
+
+def test_exponents_merge_equal_sizes_and_skip_zero_times():
+    results = [_point(1, 0.0), _point(2, 2.0), _point(2, 4.0), _point(4, 6.0)]
+
+    steps = scaling_exponents(results)["rlp+none+naive_31"]
+    assert len(steps) == 2
+    assert steps[0]["encode"] is None
+    assert round(steps[1]["encode"], 6) == 1.0
+    assert linearity_breaks({"k": steps})["k"]["encode"] is None